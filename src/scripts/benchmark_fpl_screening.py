@@ -0,0 +1,189 @@
+"""
+Micro-benchmark for FplApp.screen_players: the original row-by-row loop versus the
+columnar NumPy engine. Runs on a synthetic bootstrap snapshot (no network) and
+checks that both paths return identical players and summary statistics.
+
+Usage:
+    python src/scripts/benchmark_fpl_screening.py [--players 700] [--repeat 200]
+"""
+
+import argparse
+import logging
+import random
+import timeit
+from collections import Counter
+
+from universal_mcp.applications.fpl.utils.player_index import PlayerIndex
+
+logger = logging.getLogger(__name__)
+
+POSITIONS = ["GKP", "DEF", "MID", "FWD"]
+
+SCENARIOS = [
+    {"sort_by": "points"},
+    {"position": "MID", "sort_by": "price", "min_price": 6.0},
+    {"team": "ars", "sort_by": "form", "sort_order": "asc"},
+    {"min_ownership": 5.0, "max_ownership": 40.0, "form_threshold": 3.0, "sort_by": "selected_by_percent"},
+    {"min_points": 50, "max_price": 8.0, "sort_by": "web_name"},
+    {"position": "FWD", "sort_by": "total_points"},
+]
+
+
+def make_bootstrap(num_players: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    teams = [{"id": i, "name": "Arsenal" if i == 1 else f"Team {i}", "short_name": f"T{i:02d}"} for i in range(1, 21)]
+    element_types = [{"id": i + 1, "singular_name_short": code} for i, code in enumerate(POSITIONS)]
+    elements = []
+    for i in range(1, num_players + 1):
+        elements.append(
+            {
+                "id": i,
+                "first_name": f"First{i}",
+                "second_name": f"Second{i}",
+                "web_name": f"Player{rng.randint(0, num_players)}",
+                "team": rng.randint(1, 20),
+                "element_type": rng.randint(1, 4),
+                "now_cost": rng.randint(40, 150),
+                # An occasional blank form exercises the unparsable-value handling
+                "form": "" if rng.random() < 0.01 else f"{rng.uniform(0, 10):.1f}",
+                "total_points": rng.randint(0, 250),
+                "points_per_game": f"{rng.uniform(0, 8):.1f}",
+                "selected_by_percent": f"{rng.uniform(0, 70):.1f}",
+                "status": rng.choice("aaaadis"),
+                **dict.fromkeys(
+                    [
+                        "minutes",
+                        "starts",
+                        "goals_scored",
+                        "assists",
+                        "clean_sheets",
+                        "goals_conceded",
+                        "own_goals",
+                        "penalties_saved",
+                        "penalties_missed",
+                        "yellow_cards",
+                        "red_cards",
+                        "saves",
+                        "bonus",
+                        "bps",
+                        "transfers_in_event",
+                        "transfers_out_event",
+                        "cost_change_event",
+                        "cost_change_start",
+                    ],
+                    0,
+                ),
+                **dict.fromkeys(["influence", "creativity", "threat", "ict_index"], "0.0"),
+                "news": "",
+                "chance_of_playing_next_round": None,
+            }
+        )
+    return {"teams": teams, "element_types": element_types, "elements": elements}
+
+
+def legacy_screen(
+    all_players,
+    position=None,
+    team=None,
+    min_price=None,
+    max_price=None,
+    min_points=None,
+    min_ownership=None,
+    max_ownership=None,
+    form_threshold=None,
+    sort_by="total_points",
+    sort_order="desc",
+    limit=20,
+):
+    """The pre-columnar screen_players loop, kept as the reference implementation."""
+    filtered_players = []
+    for player in all_players:
+        if position and player.get("position") != position:
+            continue
+        if team and (not (team.lower() in player.get("team", "").lower() or team.lower() in player.get("team_short", "").lower())):
+            continue
+        if min_price is not None and player.get("price", 0) < min_price:
+            continue
+        if max_price is not None and player.get("price", 0) > max_price:
+            continue
+        if min_points is not None and player.get("points", 0) < min_points:
+            continue
+        try:
+            ownership = float(player.get("selected_by_percent", 0).replace("%", ""))
+            if min_ownership is not None and ownership < min_ownership:
+                continue
+            if max_ownership is not None and ownership > max_ownership:
+                continue
+        except (ValueError, TypeError):
+            pass
+        try:
+            form = float(player.get("form", 0))
+            if form_threshold is not None and form < form_threshold:
+                continue
+        except (ValueError, TypeError):
+            pass
+        player["status"] = "available" if player.get("status") == "a" else "unavailable"
+        filtered_players.append(player)
+    reverse = sort_order.lower() != "asc"
+    try:
+        numeric_fields = ["points", "price", "form", "selected_by_percent", "value"]
+        if sort_by in numeric_fields:
+            filtered_players.sort(key=lambda p: float(p.get(sort_by, 0)) if p.get(sort_by) is not None else 0, reverse=reverse)
+        else:
+            filtered_players.sort(key=lambda p: p.get(sort_by, ""), reverse=reverse)
+    except (KeyError, ValueError):
+        filtered_players.sort(key=lambda p: float(p.get("points", 0)), reverse=True)
+    total_players = len(filtered_players)
+    average_points = sum(float(p.get("points", 0)) for p in filtered_players) / max(1, total_players)
+    average_price = sum(float(p.get("price", 0)) for p in filtered_players) / max(1, total_players)
+    position_counts = Counter(p.get("position") for p in filtered_players)
+    team_counts = Counter(p.get("team") for p in filtered_players)
+    return {
+        "total_matches": total_players,
+        "average_points": round(average_points, 1),
+        "average_price": round(average_price, 2),
+        "position_distribution": dict(position_counts),
+        "team_distribution": dict(sorted(team_counts.items(), key=lambda x: x[1], reverse=True)[:10]),
+        "player_ids": [p["id"] for p in filtered_players[:limit]],
+    }
+
+
+def columnar_screen(columns, sort_by="total_points", sort_order="desc", limit=20, **filters):
+    """The columnar path used by FplApp.screen_players."""
+    matches = columns.screen(sort_by=sort_by, descending=sort_order.lower() != "asc", **filters)
+    return {
+        "total_matches": len(matches),
+        **columns.summarize(matches),
+        "player_ids": [columns.players[i]["id"] for i in matches[:limit]],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=700)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    index = PlayerIndex(make_bootstrap(args.players))
+    columns = index.columns
+
+    for scenario in SCENARIOS:
+        # The legacy loop mutates player dicts, so give it fresh copies each run
+        legacy_players = [dict(p) for p in index.players]
+        expected = legacy_screen(legacy_players, **scenario)
+        actual = columnar_screen(columns, **scenario)
+        if expected != actual:
+            raise SystemExit(f"Mismatch for {scenario}:\nlegacy:   {expected}\ncolumnar: {actual}")
+
+        legacy_time = timeit.timeit(lambda s=scenario: legacy_screen([dict(p) for p in index.players], **s), number=args.repeat)
+        copy_time = timeit.timeit(lambda: [dict(p) for p in index.players], number=args.repeat)
+        columnar_time = timeit.timeit(lambda s=scenario: columnar_screen(columns, **s), number=args.repeat)
+
+        legacy_ms = (legacy_time - copy_time) / args.repeat * 1000
+        columnar_ms = columnar_time / args.repeat * 1000
+        logger.info(f"{scenario}\n  legacy {legacy_ms:.3f} ms  columnar {columnar_ms:.3f} ms  speedup x{legacy_ms / columnar_ms:.1f}")
+
+
+if __name__ == "__main__":
+    main()
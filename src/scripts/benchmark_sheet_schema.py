@@ -0,0 +1,128 @@
+"""
+Micro-benchmark for Google Sheets schema inference: the original per-cell async
+analyze_columns versus the regex-per-column engine in the google_sheet helper.
+Runs on a synthetic 50k-row table (no network) with one column of each supported
+type and reports the time and inferred types for every sampling strategy.
+
+Usage:
+    python src/scripts/benchmark_sheet_schema.py [--rows 50000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import timeit
+
+from universal_mcp.applications.google_sheet.helper import SAMPLING_STRATEGIES, analyze_columns, sample_rows
+
+logger = logging.getLogger(__name__)
+
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+COLUMNS = {
+    "id": lambda rng, i: str(i),
+    "quantity": lambda rng, i: f"{rng.randint(0, 50000):,}",
+    "price": lambda rng, i: f"{rng.uniform(0, 500):.2f}",
+    "in_stock": lambda rng, i: rng.choice(["TRUE", "FALSE"]),
+    "discount": lambda rng, i: f"{rng.randint(0, 60)}%",
+    "revenue": lambda rng, i: f"${rng.uniform(0, 10000):,.2f}",
+    "ordered": lambda rng, i: f"{rng.randint(2015, 2025)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+    "shipped": lambda rng, i: f"{rng.choice(MONTHS)} {rng.randint(1, 28)}, {rng.randint(2015, 2025)}",
+    "contact": lambda rng, i: f"user{i}@example.com",
+    "website": lambda rng, i: f"https://shop{rng.randint(1, 99)}.example.com/p/{i}",
+    "notes": lambda rng, i: rng.choice(["", "fragile", "gift wrap", "call first", "n/a"]),
+}
+
+
+def make_table(num_rows: int, seed: int = 0) -> list[list[str]]:
+    rng = random.Random(seed)
+    rows = [list(COLUMNS)]
+    for i in range(num_rows):
+        # Occasional blank cells, as in real sheets
+        rows.append(["" if rng.random() < 0.02 else make(rng, i) for make in COLUMNS.values()])
+    return rows
+
+
+async def legacy_infer_column_type(values):
+    """The pre-regex infer_column_type, kept as the reference implementation."""
+    if not values:
+        return "TEXT", {}
+    non_empty_values = [val for val in values if val and str(val).strip()]
+    if not non_empty_values:
+        return "TEXT", {}
+    boolean_count = sum(1 for val in non_empty_values if str(val).lower() in ["true", "false", "yes", "no", "1", "0"])
+    if boolean_count / len(non_empty_values) >= 0.8:
+        return "BOOLEAN", {}
+    numeric_count = 0
+    decimal_count = 0
+    date_count = 0
+    for val in non_empty_values:
+        val_str = str(val)
+        if any(pattern in val_str.lower() for pattern in ["/", "-", *(month.lower() for month in MONTHS)]):
+            date_count += 1
+        if val_str.replace(".", "").replace("-", "").replace(",", "").isdigit():
+            numeric_count += 1
+            if "." in val_str:
+                decimal_count += 1
+    if date_count / len(non_empty_values) >= 0.6:
+        return "DATE", {}
+    elif numeric_count / len(non_empty_values) >= 0.8:
+        if decimal_count / numeric_count >= 0.3:
+            return "DECIMAL", {"precision": 2}
+        else:
+            return "INTEGER", {}
+    else:
+        return "TEXT", {}
+
+
+async def legacy_analyze_columns(sample_values):
+    """The pre-regex analyze_columns, kept as the reference implementation."""
+    headers = sample_values[0]
+    data_rows = sample_values[1:]
+    columns = []
+    for col_idx in range(len(headers)):
+        column_values = [row[col_idx] for row in data_rows if col_idx < len(row)]
+        column_type, constraints = await legacy_infer_column_type(column_values)
+        columns.append(
+            {
+                "name": str(headers[col_idx]),
+                "type": column_type,
+                "null_count": sum(1 for val in column_values if not val or str(val).strip() == ""),
+                "unique_count": len(set(str(val) for val in column_values if val and str(val).strip())),
+            }
+        )
+    return columns
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--sample-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    table = make_table(args.rows)
+
+    legacy = asyncio.run(legacy_analyze_columns(table))
+    legacy_time = timeit.timeit(lambda: asyncio.run(legacy_analyze_columns(table)), number=args.repeat) / args.repeat
+    logger.info(f"legacy full scan: {legacy_time * 1000:.1f} ms")
+
+    for sampling in SAMPLING_STRATEGIES:
+        columns = analyze_columns(sample_rows(table, args.sample_size, sampling))
+        elapsed = timeit.timeit(lambda s=sampling: analyze_columns(sample_rows(table, args.sample_size, s)), number=args.repeat)
+        elapsed /= args.repeat
+        logger.info(f"{sampling} ({len(sample_rows(table, args.sample_size, sampling)) - 1} rows): {elapsed * 1000:.1f} ms")
+        if sampling == "full":
+            logger.info(f"  speedup over legacy x{legacy_time / elapsed:.1f}")
+            for old, new in zip(legacy, columns, strict=True):
+                if (old["null_count"], old["unique_count"]) != (new["null_count"], new["unique_count"]):
+                    raise SystemExit(f"Column statistics differ for {new['name']}: {old} vs {new}")
+                logger.info(f"  {new['name']:<10} legacy {old['type']:<8} now {new['type']:<8} {new['constraints']}")
+        else:
+            logger.info("  " + ", ".join(f"{c['name']}={c['type']}" for c in columns))
+
+
+if __name__ == "__main__":
+    main()
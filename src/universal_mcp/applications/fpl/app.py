@@ -1,25 +1,23 @@
-from collections import Counter
 from datetime import datetime
 from typing import Any
-import requests
 from universal_mcp.applications.application import APIApplication
 from universal_mcp.integrations import Integration
-from universal_mcp.applications.fpl.utils.api import api
+from universal_mcp.applications.fpl.utils.api import async_api
+from universal_mcp.applications.fpl.utils.fixture_matrix import get_fixture_matrix
 from universal_mcp.applications.fpl.utils.fixtures import (
     analyze_player_fixtures,
     get_blank_gameweeks,
     get_double_gameweeks,
-    get_fixtures_resource,
     get_player_fixtures,
     get_player_gameweek_history,
 )
 from universal_mcp.applications.fpl.utils.helper import (
     find_players_by_name,
     get_player_info,
-    get_players_resource,
     get_team_by_name,
     search_players,
 )
+from universal_mcp.applications.fpl.utils.player_index import get_player_index
 from universal_mcp.applications.fpl.utils.league_utils import (
     _get_league_historical_performance,
     _get_league_standings,
@@ -70,7 +68,7 @@ class FplApp(APIApplication):
             if analysis_type not in valid_types:
                 return {"error": f"Invalid analysis type: {analysis_type}", "valid_types": valid_types}
             try:
-                current_gw_data = api.get_current_gameweek()
+                current_gw_data = await async_api.get_current_gameweek()
                 current_gw = current_gw_data.get("id", 1)
             except Exception:
                 current_gw = 1
@@ -103,16 +101,16 @@ class FplApp(APIApplication):
             if effective_start_gw > effective_end_gw:
                 effective_start_gw, effective_end_gw = (effective_end_gw, effective_start_gw)
             try:
-                league_data = _get_league_standings(league_id, api)
+                league_data = await _get_league_standings(league_id, async_api)
                 if "error" in league_data:
                     return league_data
             except Exception as e:
                 return {"error": f"Failed to get league standings: {str(e)}"}
             try:
                 if analysis_type in {"overview", "historical"}:
-                    return _get_league_historical_performance(league_id, api, effective_start_gw, effective_end_gw)
+                    return await _get_league_historical_performance(league_id, async_api, effective_start_gw, effective_end_gw)
                 elif analysis_type == "team_composition":
-                    return _get_league_team_composition(league_id, api, effective_end_gw)
+                    return await _get_league_team_composition(league_id, async_api, effective_end_gw)
             except Exception as e:
                 return {
                     "error": f"Analysis failed: {str(e)}",
@@ -142,10 +140,7 @@ class FplApp(APIApplication):
             leagues, standings, important
         """
         try:
-            url = f"https://fantasy.premierleague.com/api/leagues-classic/{league_id}/standings/"
-            response = requests.get(url)
-            response.raise_for_status()
-            league_data = response.json()
+            league_data = await async_api.get_league_standings(league_id)
             if "error" in league_data:
                 return league_data
             parsed_data = parse_league_standings(league_data)
@@ -183,7 +178,7 @@ class FplApp(APIApplication):
         Tags:
             players, important
         """
-        return get_player_info(player_id, player_name, start_gameweek, end_gameweek, include_history, include_fixtures)
+        return await get_player_info(player_id, player_name, start_gameweek, end_gameweek, include_history, include_fixtures)
 
     async def find_players(self, query: str, position: str | None = None, team: str | None = None, limit: int = 5) -> dict[str, Any]:
         """
@@ -205,7 +200,7 @@ class FplApp(APIApplication):
         Tags:
             players, search, important
         """
-        return search_players(query, position, team, limit)
+        return await search_players(query, position, team, limit)
 
     async def get_gameweek_snapshot(self) -> dict[str, Any]:
         """
@@ -221,7 +216,7 @@ class FplApp(APIApplication):
         Tags:
             gameweek, status, timing, important
         """
-        gameweeks = api.get_gameweeks()
+        gameweeks = await async_api.get_gameweeks()
         current_gw = next((gw for gw in gameweeks if gw.get("is_current")), None)
         previous_gw = next((gw for gw in gameweeks if gw.get("is_previous")), None)
         next_gw = next((gw for gw in gameweeks if gw.get("is_next")), None)
@@ -295,51 +290,27 @@ class FplApp(APIApplication):
         Tags:
             players, analyze, important
         """
-        all_players = get_players_resource()
+        columns = (await get_player_index()).columns
         normalized_position = normalize_position(position) if position else None
         position_changed = normalized_position != position if position else False
-        filtered_players = []
-        for player in all_players:
-            if normalized_position and player.get("position") != normalized_position:
-                continue
-            if team and (not (team.lower() in player.get("team", "").lower() or team.lower() in player.get("team_short", "").lower())):
-                continue
-            if min_price is not None and player.get("price", 0) < min_price:
-                continue
-            if max_price is not None and player.get("price", 0) > max_price:
-                continue
-            if min_points is not None and player.get("points", 0) < min_points:
-                continue
-            try:
-                ownership = float(player.get("selected_by_percent", 0).replace("%", ""))
-                if min_ownership is not None and ownership < min_ownership:
-                    continue
-                if max_ownership is not None and ownership > max_ownership:
-                    continue
-            except (ValueError, TypeError):
-                pass
-            try:
-                form = float(player.get("form", 0))
-                if form_threshold is not None and form < form_threshold:
-                    continue
-            except (ValueError, TypeError):
-                pass
-            player["status"] = "available" if player.get("status") == "a" else "unavailable"
-            filtered_players.append(player)
-        reverse = sort_order.lower() != "asc"
-        try:
-            numeric_fields = ["points", "price", "form", "selected_by_percent", "value"]
-            if sort_by in numeric_fields:
-                filtered_players.sort(key=lambda p: float(p.get(sort_by, 0)) if p.get(sort_by) is not None else 0, reverse=reverse)
-            else:
-                filtered_players.sort(key=lambda p: p.get(sort_by, ""), reverse=reverse)
-        except (KeyError, ValueError):
-            filtered_players.sort(key=lambda p: float(p.get("points", 0)), reverse=True)
-        total_players = len(filtered_players)
-        average_points = sum((float(p.get("points", 0)) for p in filtered_players)) / max(1, total_players)
-        average_price = sum((float(p.get("price", 0)) for p in filtered_players)) / max(1, total_players)
-        position_counts = Counter((p.get("position") for p in filtered_players))
-        team_counts = Counter((p.get("team") for p in filtered_players))
+        matches = columns.screen(
+            sort_by=sort_by,
+            descending=sort_order.lower() != "asc",
+            position=normalized_position,
+            team=team,
+            min_price=min_price,
+            max_price=max_price,
+            min_points=min_points,
+            min_ownership=min_ownership,
+            max_ownership=max_ownership,
+            form_threshold=form_threshold,
+        )
+        total_players = len(matches)
+        stats = columns.summarize(matches)
+        filtered_players = [
+            {**columns.players[i], "status": "available" if columns.players[i].get("status") == "a" else "unavailable"}
+            for i in matches[:limit]
+        ]
         applied_filters = []
         if normalized_position:
             applied_filters.append(f"Position: {normalized_position}")
@@ -361,19 +332,16 @@ class FplApp(APIApplication):
             "summary": {
                 "total_matches": total_players,
                 "filters_applied": applied_filters,
-                "average_points": round(average_points, 1),
-                "average_price": round(average_price, 2),
-                "position_distribution": dict(position_counts),
-                "team_distribution": dict(sorted(team_counts.items(), key=lambda x: x[1], reverse=True)[:10]),
+                **stats,
             },
-            "players": filtered_players[:limit],
+            "players": filtered_players,
         }
         if position_changed:
             result["summary"]["position_note"] = f"'{position}' was interpreted as '{normalized_position}'"
         if include_gameweeks and filtered_players:
             try:
-                player_ids = [p.get("id") for p in filtered_players[:limit]]
-                gameweek_data = get_player_gameweek_history(player_ids, num_gameweeks)
+                player_ids = [p.get("id") for p in filtered_players]
+                gameweek_data = await get_player_gameweek_history(player_ids, num_gameweeks)
                 result["gameweek_data"] = gameweek_data
                 recent_form_stats = {}
                 if "players" in gameweek_data:
@@ -455,7 +423,7 @@ class FplApp(APIApplication):
             return {"error": "Please provide at least two player names to compare"}
         players_data = {}
         for name in player_names:
-            matches = find_players_by_name(name, limit=3)
+            matches = await find_players_by_name(name, limit=3)
             if not matches:
                 return {"error": f"No player found matching '{name}'"}
             active_matches = [p for p in matches]
@@ -492,8 +460,8 @@ class FplApp(APIApplication):
                 gameweek_comparison = {}
                 recent_form_comparison = {}
                 gameweek_range = []
+                player_history = await get_player_gameweek_history([player["id"] for player in players_data.values()], num_gameweeks)
                 for name, player in players_data.items():
-                    player_history = get_player_gameweek_history([player["id"]], num_gameweeks)
                     if "players" in player_history and player["id"] in player_history["players"]:
                         history = player_history["players"][player["id"]]
                         gameweek_comparison[name] = history
@@ -553,7 +521,7 @@ class FplApp(APIApplication):
             double_gameweek_impacts = {}
             for name, player in players_data.items():
                 try:
-                    player_fixture_analysis = analyze_player_fixtures(player["id"], num_gameweeks)
+                    player_fixture_analysis = await analyze_player_fixtures(player["id"], num_gameweeks)
                     fixtures_data = []
                     if "fixture_analysis" in player_fixture_analysis and "fixtures_analyzed" in player_fixture_analysis["fixture_analysis"]:
                         fixtures_data = player_fixture_analysis["fixture_analysis"]["fixtures_analyzed"]
@@ -561,14 +529,14 @@ class FplApp(APIApplication):
                     if "fixture_analysis" in player_fixture_analysis and "difficulty_score" in player_fixture_analysis["fixture_analysis"]:
                         fixture_scores[name] = player_fixture_analysis["fixture_analysis"]["difficulty_score"]
                     team_name = player["team"]
-                    blank_gws = get_blank_gameweeks(num_gameweeks)
+                    blank_gws = await get_blank_gameweeks(num_gameweeks)
                     blank_impact = []
                     for blank_gw in blank_gws:
                         for team_info in blank_gw.get("teams_without_fixtures", []):
                             if team_info.get("name") == team_name:
                                 blank_impact.append(blank_gw["gameweek"])
                     blank_gameweek_impacts[name] = blank_impact
-                    double_gws = get_double_gameweeks(num_gameweeks)
+                    double_gws = await get_double_gameweeks(num_gameweeks)
                     double_impact = []
                     for double_gw in double_gws:
                         for team_info in double_gw.get("teams_with_doubles", []):
@@ -633,11 +601,11 @@ class FplApp(APIApplication):
         Tags:
             players, fixtures, important
         """
-        player_matches = find_players_by_name(player_name)
+        player_matches = await find_players_by_name(player_name)
         if not player_matches:
             return {"error": f"No player found matching '{player_name}'"}
         player = player_matches[0]
-        analysis = analyze_player_fixtures(player["id"], num_fixtures)
+        analysis = await analyze_player_fixtures(player["id"], num_fixtures)
         return analysis
 
     async def analyze_entity_fixtures(
@@ -671,7 +639,7 @@ class FplApp(APIApplication):
         entity_type = entity_type.lower()
         if entity_type not in ["player", "team", "position"]:
             return {"error": f"Invalid entity type: {entity_type}. Must be 'player', 'team', or 'position'"}
-        gameweeks_data = api.get_gameweeks()
+        gameweeks_data = await async_api.get_gameweeks()
         current_gameweek = None
         for gw in gameweeks_data:
             if gw.get("is_current"):
@@ -695,7 +663,7 @@ class FplApp(APIApplication):
         if entity_type == "player":
             if entity_name is None:
                 return {"error": "Entity name is required for player analysis"}
-            player_matches = find_players_by_name(entity_name)
+            player_matches = await find_players_by_name(entity_name)
             if not player_matches:
                 return {"error": f"No player found matching '{entity_name}'"}
             active_players = [p for p in player_matches]
@@ -707,7 +675,7 @@ class FplApp(APIApplication):
                 "position": player["position"],
                 "status": "available" if player["status"] == "a" else "unavailable",
             }
-            player_fixtures = get_player_fixtures(player["id"], num_gameweeks)
+            player_fixtures = await get_player_fixtures(player["id"], num_gameweeks)
             total_difficulty = sum((f["difficulty"] for f in player_fixtures))
             avg_difficulty = total_difficulty / len(player_fixtures) if player_fixtures else 0
             fixture_score = (6 - avg_difficulty) * 2 if player_fixtures else 0
@@ -729,25 +697,21 @@ class FplApp(APIApplication):
         elif entity_type == "team":
             if entity_name is None:
                 return {"error": "Entity name is required for team analysis"}
-            team = get_team_by_name(entity_name)
+            team = await get_team_by_name(entity_name)
             if not team:
                 return {"error": f"No team found matching '{entity_name}'"}
             result["team"] = {"id": team["id"], "name": team["name"], "short_name": team["short_name"]}
-            team_fixtures = get_fixtures_resource(team_name=team["name"])
-            upcoming_fixtures = [f for f in team_fixtures if f["gameweek"] in result["analysis_range"]]
-            formatted_fixtures = []
-            for fixture in upcoming_fixtures:
-                is_home = fixture["home_team"]["name"] == team["name"]
-                opponent = fixture["away_team"] if is_home else fixture["home_team"]
-                difficulty = fixture["difficulty"]["home" if is_home else "away"]
-                formatted_fixtures.append(
-                    {
-                        "gameweek": fixture["gameweek"],
-                        "opponent": opponent["name"],
-                        "location": "home" if is_home else "away",
-                        "difficulty": difficulty,
-                    }
-                )
+            fixture_matrix = await get_fixture_matrix()
+            team_fixtures = fixture_matrix.team_fixtures(team["id"], current_gameweek + 1, current_gameweek + num_gameweeks + 1)
+            formatted_fixtures = [
+                {
+                    "gameweek": fixture["gameweek"],
+                    "opponent": fixture_matrix.team_name(fixture["opponent_id"]),
+                    "location": "home" if fixture["is_home"] else "away",
+                    "difficulty": fixture["difficulty"],
+                }
+                for fixture in team_fixtures
+            ]
             result["fixtures"] = formatted_fixtures
             if formatted_fixtures:
                 total_difficulty = sum((f["difficulty"] for f in formatted_fixtures))
@@ -774,38 +738,39 @@ class FplApp(APIApplication):
             if not normalized_position or normalized_position not in ["GKP", "DEF", "MID", "FWD"]:
                 return {"error": f"Invalid position: {entity_name}"}
             result["position"] = normalized_position
-            all_players = get_players_resource()
-            position_players = [p for p in all_players if p.get("position") == normalized_position]
-            teams_with_position = set((p.get("team") for p in position_players))
-            all_fixtures = get_fixtures_resource()
-            upcoming_fixtures = [f for f in all_fixtures if f["gameweek"] in result["analysis_range"]]
+            fixture_matrix = await get_fixture_matrix()
+            position_players = (await get_player_index()).by_position.get(normalized_position, [])
+            teams_with_position = dict.fromkeys(fixture_matrix.player_team(p["id"]) for p in position_players)
+            # Difficulty totals for every team over the analysis range in one pass
+            analysis_start, analysis_end = current_gameweek + 1, current_gameweek + num_gameweeks + 1
+            totals, counts, _ = fixture_matrix.difficulty_totals(analysis_start, analysis_end)
             team_difficulties = {}
-            for team in teams_with_position:
-                team_fixtures = []
-                for fixture in upcoming_fixtures:
-                    is_home = fixture["home_team"]["name"] == team
-                    is_away = fixture["away_team"]["name"] == team
-                    if is_home or is_away:
-                        difficulty = fixture["difficulty"]["home" if is_home else "away"]
-                        team_fixtures.append(
-                            {
-                                "gameweek": fixture["gameweek"],
-                                "opponent": fixture["away_team"]["name"] if is_home else fixture["home_team"]["name"],
-                                "location": "home" if is_home else "away",
-                                "difficulty": difficulty,
-                            }
-                        )
-                if team_fixtures:
-                    total_diff = sum((f["difficulty"] for f in team_fixtures))
-                    avg_diff = total_diff / len(team_fixtures)
-                    fixture_score = (6 - avg_diff) * 2
-                    team_difficulties[team] = {
-                        "fixtures": team_fixtures,
-                        "difficulty_score": round(fixture_score, 1),
-                        "fixtures_analyzed": len(team_fixtures),
-                    }
+            for team_id in teams_with_position:
+                row = fixture_matrix.rows.get(team_id)
+                if row is None or not counts[row]:
+                    continue
+                fixture_score = (6 - totals[row] / counts[row]) * 2
+                team_difficulties[fixture_matrix.team_name(team_id)] = {
+                    "team_id": team_id,
+                    "difficulty_score": round(float(fixture_score), 1),
+                    "fixtures_analyzed": int(counts[row]),
+                }
             sorted_teams = sorted(team_difficulties.items(), key=lambda x: x[1]["difficulty_score"], reverse=True)
-            result["team_fixtures"] = {team: data for team, data in sorted_teams[:10]}
+            result["team_fixtures"] = {}
+            for team, data in sorted_teams[:10]:
+                team_fixtures = fixture_matrix.team_fixtures(data.pop("team_id"), analysis_start, analysis_end)
+                result["team_fixtures"][team] = {
+                    "fixtures": [
+                        {
+                            "gameweek": fixture["gameweek"],
+                            "opponent": fixture_matrix.team_name(fixture["opponent_id"]),
+                            "location": "home" if fixture["is_home"] else "away",
+                            "difficulty": fixture["difficulty"],
+                        }
+                        for fixture in team_fixtures
+                    ],
+                    **data,
+                }
             if sorted_teams:
                 best_teams = [team for team, data in sorted_teams[:3]]
                 result["recommendations"] = {
@@ -813,10 +778,10 @@ class FplApp(APIApplication):
                     "analysis": f"Teams with players in position {normalized_position} with the best upcoming fixtures: {', '.join(best_teams)}",
                 }
         if include_blanks:
-            blank_gameweeks = get_blank_gameweeks(num_gameweeks)
+            blank_gameweeks = await get_blank_gameweeks(num_gameweeks)
             result["blank_gameweeks"] = blank_gameweeks
         if include_doubles:
-            double_gameweeks = get_double_gameweeks(num_gameweeks)
+            double_gameweeks = await get_double_gameweeks(num_gameweeks)
             result["double_gameweeks"] = double_gameweeks
         return result
 
@@ -837,7 +802,7 @@ class FplApp(APIApplication):
         Tags:
             gameweeks, blanks, important
         """
-        return get_blank_gameweeks(num_weeks)
+        return await get_blank_gameweeks(num_weeks)
 
     async def get_double_gameweeks(self, num_weeks: int = 5) -> list[dict[str, Any]]:
         """
@@ -856,7 +821,7 @@ class FplApp(APIApplication):
         Tags:
             gameweeks, doubles, important
         """
-        return get_double_gameweeks(num_weeks)
+        return await get_double_gameweeks(num_weeks)
 
     async def get_manager_team_info(self, team_id: str) -> dict[str, Any]:
         """
@@ -1,22 +1,213 @@
+import asyncio
+import contextlib
 import logging
+import os
+import threading
+import time
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 import httpx
 
+from .snapshot_store import SnapshotStore
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+DEFAULT_BASE_URL = "https://fantasy.premierleague.com/api"
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
+
+# Default cache lifetimes in seconds, keyed by the first segment of the endpoint path
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    "bootstrap-static": 300,
+    "fixtures": 600,
+    "element-summary": 600,
+    "entry": 300,
+}
+DEFAULT_CACHE_TTL = 60
+
+# Maximum number of simultaneous requests issued by the async batch fetchers
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Directory for on-disk response snapshots shared by all workers (disabled when unset)
+FPL_SNAPSHOT_DIR = os.getenv("FPL_SNAPSHOT_DIR")
+
+
+@dataclass
+class _CacheEntry:
+    """A cached API response together with its HTTP validators."""
+
+    data: Any
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def is_fresh(self) -> bool:
+        return self.expires_at > time.monotonic()
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that let the server answer 304 Not Modified for this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class _InFlight:
+    """A request that is currently being fetched, shared by all concurrent callers."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.data: Any = None
+        self.error: BaseException | None = None
+
+
+class ResponseCache:
+    """
+    Endpoint-keyed response cache shared by the sync and async FPL clients.
+
+    Entries expire after a TTL chosen by the endpoint's first path segment and keep
+    their ETag / Last-Modified validators so stale entries can be revalidated. With
+    a ``SnapshotStore`` attached, missing or expired entries are first reloaded from
+    valid on-disk snapshots and fetched responses are written back to disk.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = DEFAULT_CACHE_TTL,
+        snapshots: SnapshotStore | None = None,
+    ):
+        """
+        Args:
+            ttls: Per-endpoint cache TTLs in seconds, merged over ``DEFAULT_CACHE_TTLS``
+            default_ttl: TTL in seconds for endpoints without an explicit entry
+            snapshots: Optional on-disk snapshot store for warm starts
+        """
+        self.ttls = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.snapshots = snapshots
+        self._entries: dict[str, _CacheEntry] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "revalidated": 0, "coalesced": 0, "snapshot_hits": 0}
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Return the cache TTL for an endpoint based on its first path segment."""
+        prefix = endpoint.strip("/").split("/", 1)[0]
+        return self.ttls.get(prefix, self.default_ttl)
+
+    def peek(self, endpoint: str) -> _CacheEntry | None:
+        """Return the in-memory entry for an endpoint without consulting snapshots."""
+        with self._lock:
+            return self._entries.get(endpoint)
+
+    def get(self, endpoint: str) -> _CacheEntry | None:
+        entry = self.peek(endpoint)
+        if self.snapshots is None or (entry is not None and entry.is_fresh()):
+            return entry
+
+        data = self.snapshots.load(endpoint)
+        if data is None:
+            return entry
+
+        self.record("snapshot_hits")
+        snapshot_entry = _CacheEntry(data=data, expires_at=time.monotonic() + self.ttl_for(endpoint))
+        with self._lock:
+            self._entries[endpoint] = snapshot_entry
+        return snapshot_entry
+
+    def store(self, endpoint: str, response: httpx.Response, cached: _CacheEntry | None) -> _CacheEntry:
+        """
+        Store a response for an endpoint, refreshing the stale entry on 304 Not Modified.
+
+        Raises:
+            httpx.HTTPStatusError: If the response is an error
+        """
+        expires_at = time.monotonic() + self.ttl_for(endpoint)
+
+        if response.status_code == 304 and cached is not None:
+            self.record("revalidated")
+            cached.expires_at = expires_at
+            if self.snapshots is not None:
+                self.snapshots.save(endpoint, cached.data)
+            return cached
+
+        response.raise_for_status()
+        entry = _CacheEntry(
+            data=response.json(),
+            expires_at=expires_at,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        with self._lock:
+            self._entries[endpoint] = entry
+        if self.snapshots is not None:
+            self.snapshots.save(endpoint, entry.data)
+        return entry
+
+    def record(self, counter: str) -> None:
+        with self._lock:
+            self._stats[counter] += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
+
+    def clear(self, endpoint: str | None = None) -> None:
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(endpoint, None)
+
+
+def _fix_bootstrap_static(data: dict[str, Any]) -> dict[str, Any]:
+    """Fix null values that should be integers according to schema."""
+    if "phases" in data:
+        for phase in data["phases"]:
+            if phase.get("highest_score") is None:
+                phase["highest_score"] = 0
+    return data
+
+
+def _select_current_gameweek(gameweeks: list[dict[str, Any]]) -> dict[str, Any]:
+    """Pick the current gameweek, falling back to the next one and then the first one."""
+    for gw in gameweeks:
+        if gw.get("is_current", False):
+            return gw
+
+    # If no current gameweek found, return next one
+    for gw in gameweeks:
+        if gw.get("is_next", False):
+            return gw
+
+    # If no next gameweek either, return first one
+    return gameweeks[0] if gameweeks else {}
+
 
 class FPLAPI:
     """
     FPL API client with schema validation, caching, and rate limiting.
     Handles fetching data from the Fantasy Premier League API.
+
+    Responses are cached per endpoint (see ``ResponseCache``). Expired entries are
+    revalidated with ``If-None-Match`` / ``If-Modified-Since`` and concurrent
+    requests for the same endpoint share a single fetch. Cached payloads are shared
+    between callers and must be treated as read-only.
     """
 
     def __init__(
         self,
-        base_url: str = "https://fantasy.premierleague.com/api",
-        user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
+        base_url: str = DEFAULT_BASE_URL,
+        user_agent: str = DEFAULT_USER_AGENT,
+        cache_ttls: dict[str, float] | None = None,
+        default_ttl: float = DEFAULT_CACHE_TTL,
+        cache: ResponseCache | None = None,
+        snapshot_dir: str | None = None,
     ):
         """
         Initialize the FPL API client.
@@ -24,13 +215,29 @@ class FPLAPI:
         Args:
             base_url: FPL API base URL
             user_agent: User-Agent header for requests
+            cache_ttls: Per-endpoint cache TTLs in seconds, merged over ``DEFAULT_CACHE_TTLS``
+            default_ttl: TTL in seconds for endpoints without an explicit entry
+            cache: Existing cache to share with another client (overrides the other cache arguments)
+            snapshot_dir: Directory for on-disk snapshots of bootstrap, fixture and player data
         """
         self.base_url = base_url
         self.headers = {"User-Agent": user_agent}
+        self.cache = cache or ResponseCache(cache_ttls, default_ttl, SnapshotStore(snapshot_dir) if snapshot_dir else None)
+
+        self._client: httpx.Client | None = None
+        self._in_flight: dict[str, _InFlight] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """Shared HTTP client, created on first use so connections are reused across calls."""
+        if self._client is None:
+            self._client = httpx.Client(headers=self.headers)
+        return self._client
 
     def _make_request(self, endpoint: str) -> Any:
         """
-        Make an HTTP request to the FPL API.
+        Make an HTTP request to the FPL API, served from the cache while fresh.
 
         Args:
             endpoint: API endpoint to request (without base URL)
@@ -41,13 +248,59 @@ class FPLAPI:
         Raises:
             httpx.HTTPError: On HTTP error
         """
-        url = f"{self.base_url}/{endpoint}"
-        logger.debug(f"Making request to {url}")
+        # Kept outside the lock: a miss may load an on-disk snapshot
+        cached = self.cache.get(endpoint)
+        if cached is not None and cached.is_fresh():
+            self.cache.record("hits")
+            return cached.data
+
+        with self._lock:
+            in_flight = self._in_flight.get(endpoint)
+            owner = in_flight is None
+            if owner:
+                self.cache.record("misses")
+                in_flight = self._in_flight[endpoint] = _InFlight()
+            else:
+                self.cache.record("coalesced")
+
+        if not owner:
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.data
+
+        try:
+            url = f"{self.base_url}/{endpoint}"
+            logger.debug(f"Making request to {url}")
+            response = self.client.get(url, headers=cached.conditional_headers() if cached else None)
+            in_flight.data = self.cache.store(endpoint, response, cached).data
+            return in_flight.data
+        except BaseException as e:
+            in_flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(endpoint, None)
+            in_flight.done.set()
+
+    def cache_stats(self) -> dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            Hits, misses, conditional revalidations (304s), coalesced concurrent
+            requests, snapshot loads and the number of cached endpoints
+        """
+        return self.cache.stats()
+
+    def clear_cache(self, endpoint: str | None = None) -> None:
+        """
+        Drop cached responses.
 
-        with httpx.Client() as client:
-            response = client.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+        Args:
+            endpoint: Endpoint to invalidate; clears the whole cache when omitted
+        """
+        self.cache.clear(endpoint)
 
     def get_bootstrap_static(self) -> dict[str, Any]:
         """
@@ -56,15 +309,7 @@ class FPLAPI:
         Returns:
             Bootstrap static data
         """
-        data = self._make_request("bootstrap-static/")
-
-        # Fix null values that should be integers according to schema
-        if "phases" in data:
-            for phase in data["phases"]:
-                if phase.get("highest_score") is None:
-                    phase["highest_score"] = 0
-
-        return data
+        return _fix_bootstrap_static(self._make_request("bootstrap-static/"))
 
     def get_fixtures(self) -> list[dict[str, Any]]:
         """
@@ -92,18 +337,7 @@ class FPLAPI:
         Returns:
             Current gameweek data or None if not found
         """
-        gameweeks = self.get_gameweeks()
-        for gw in gameweeks:
-            if gw.get("is_current", False):
-                return gw
-
-        # If no current gameweek found, return next one
-        for gw in gameweeks:
-            if gw.get("is_next", False):
-                return gw
-
-        # If no next gameweek either, return first one
-        return gameweeks[0] if gameweeks else {}
+        return _select_current_gameweek(self.get_gameweeks())
 
     def get_player_summary(self, player_id: int) -> dict[str, Any]:
         """
@@ -117,6 +351,18 @@ class FPLAPI:
         """
         return self._make_request(f"element-summary/{player_id}/")
 
+    def get_entry_history(self, entry_id: int) -> dict[str, Any]:
+        """
+        Get season history for a manager's team (entry).
+
+        Args:
+            entry_id: FPL entry (manager team) ID
+
+        Returns:
+            Entry history data
+        """
+        return self._make_request(f"entry/{entry_id}/history/")
+
     def get_players(self) -> list[dict[str, Any]]:
         """
         Get all players data.
@@ -138,5 +384,340 @@ class FPLAPI:
         return static_data.get("teams", [])
 
 
-# Create a singleton instance
-api = FPLAPI()
+async def _close_stale_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+    """Close a client left behind by another event loop."""
+    if loop is not None and loop.is_running():
+        # Still serving requests on another thread, so close it there
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+    # Its loop is no longer running, so close it from this one as far as possible
+    with contextlib.suppress(RuntimeError, OSError):
+        await client.aclose()
+
+
+class AsyncFPLAPI:
+    """
+    Async FPL API client built on a single pooled ``httpx.AsyncClient``.
+
+    Shares its response cache with the sync client by default, so data fetched by
+    either is served from memory to both. Batch fetchers fan requests out with
+    bounded concurrency.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        user_agent: str = DEFAULT_USER_AGENT,
+        cache: ResponseCache | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = 30.0,
+    ):
+        """
+        Initialize the async FPL API client.
+
+        Args:
+            base_url: FPL API base URL
+            user_agent: User-Agent header for requests
+            cache: Response cache, shared with other clients when given
+            max_concurrency: Maximum simultaneous requests per batch and pooled connections
+            timeout: Request timeout in seconds
+        """
+        self.base_url = base_url
+        self.headers = {"User-Agent": user_agent}
+        self.cache = cache or ResponseCache()
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self._batch_slots: asyncio.Semaphore | None = None
+
+    async def get_client(self) -> httpx.AsyncClient:
+        """
+        Pooled HTTP client for the running event loop.
+
+        The pool is bound to the loop it was created on, so if the client is used
+        from a different loop a new pool is created and the old one is closed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            stale, stale_loop = self._client, self._client_loop
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency),
+            )
+            self._client_loop = loop
+            self._in_flight = {}
+            self._batch_slots = asyncio.Semaphore(self.max_concurrency)
+            if stale is not None:
+                await _close_stale_client(stale, stale_loop)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def _make_request(self, endpoint: str) -> Any:
+        """
+        Make an HTTP request to the FPL API, served from the cache while fresh.
+
+        Args:
+            endpoint: API endpoint to request (without base URL)
+
+        Returns:
+            JSON response data
+
+        Raises:
+            httpx.HTTPError: On HTTP error
+        """
+        cached = self.cache.peek(endpoint)
+        if (cached is None or not cached.is_fresh()) and self.cache.snapshots is not None:
+            # Snapshots are read and decompressed off the event loop
+            cached = await asyncio.to_thread(self.cache.get, endpoint)
+        if cached is not None and cached.is_fresh():
+            self.cache.record("hits")
+            return cached.data
+
+        client = await self.get_client()
+        pending = self._in_flight.get(endpoint)
+        if pending is not None:
+            self.cache.record("coalesced")
+        else:
+            self.cache.record("misses")
+            # The request runs as its own task so cancelling any one caller, including
+            # the one that started it, does not end it for the others
+            pending = asyncio.create_task(self._fetch(client, endpoint, cached))
+            pending.add_done_callback(partial(self._fetch_done, endpoint))
+            self._in_flight[endpoint] = pending
+        return await asyncio.shield(pending)
+
+    async def _fetch(self, client: httpx.AsyncClient, endpoint: str, cached: _CacheEntry | None) -> Any:
+        """Request an endpoint and store the response in the cache."""
+        url = f"{self.base_url}/{endpoint}"
+        logger.debug(f"Making request to {url}")
+        response = await client.get(url, headers=cached.conditional_headers() if cached else None)
+        if self.cache.snapshots is not None:
+            return (await asyncio.to_thread(self.cache.store, endpoint, response, cached)).data
+        return self.cache.store(endpoint, response, cached).data
+
+    def _fetch_done(self, endpoint: str, task: asyncio.Task) -> None:
+        """Drop a finished request from the in-flight table."""
+        if self._in_flight.get(endpoint) is task:
+            del self._in_flight[endpoint]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled
+            task.exception()
+
+    async def _fetch_many(self, endpoints: dict[int, str]) -> dict[int, Any]:
+        """
+        Fetch several endpoints with at most ``max_concurrency`` requests in flight.
+
+        The limit is shared by all batches running on the client's event loop, so
+        overlapping batches do not multiply the number of concurrent requests.
+
+        Args:
+            endpoints: Mapping of caller key to endpoint
+
+        Returns:
+            Mapping of caller key to JSON response data, or to the exception raised
+            for that endpoint
+        """
+        # Getting the client binds the pool and the batch slots to the running loop
+        await self.get_client()
+        semaphore = self._batch_slots
+
+        async def fetch(endpoint: str) -> Any:
+            async with semaphore:
+                return await self._make_request(endpoint)
+
+        results = await asyncio.gather(*(fetch(endpoint) for endpoint in endpoints.values()), return_exceptions=True)
+        return dict(zip(endpoints, results, strict=True))
+
+    def cache_stats(self) -> dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            Hits, misses, conditional revalidations (304s), coalesced concurrent
+            requests, snapshot loads and the number of cached endpoints
+        """
+        return self.cache.stats()
+
+    async def get_bootstrap_static(self) -> dict[str, Any]:
+        """
+        Get main FPL static data (players, teams, game settings).
+
+        Returns:
+            Bootstrap static data
+        """
+        return _fix_bootstrap_static(await self._make_request("bootstrap-static/"))
+
+    async def get_fixtures(self) -> list[dict[str, Any]]:
+        """
+        Get fixture data for all matches.
+
+        Returns:
+            List of fixtures
+        """
+        return await self._make_request("fixtures/")
+
+    async def get_gameweeks(self) -> list[dict[str, Any]]:
+        """
+        Get all gameweeks data.
+
+        Returns:
+            List of gameweeks
+        """
+        static_data = await self.get_bootstrap_static()
+        return static_data.get("events", [])
+
+    async def get_current_gameweek(self) -> dict[str, Any]:
+        """
+        Get current gameweek data.
+
+        Returns:
+            Current gameweek data or None if not found
+        """
+        return _select_current_gameweek(await self.get_gameweeks())
+
+    async def get_players(self) -> list[dict[str, Any]]:
+        """
+        Get all players data.
+
+        Returns:
+            List of player data
+        """
+        static_data = await self.get_bootstrap_static()
+        return static_data.get("elements", [])
+
+    async def get_teams(self) -> list[dict[str, Any]]:
+        """
+        Get all teams data.
+
+        Returns:
+            List of team data
+        """
+        static_data = await self.get_bootstrap_static()
+        return static_data.get("teams", [])
+
+    async def get_player_summary(self, player_id: int) -> dict[str, Any]:
+        """
+        Get detailed data for a specific player.
+
+        Args:
+            player_id: FPL player ID
+
+        Returns:
+            Player summary data
+        """
+        return await self._make_request(f"element-summary/{player_id}/")
+
+    async def get_player_summaries(self, player_ids: Iterable[int]) -> dict[int, dict[str, Any] | Exception]:
+        """
+        Get detailed data for several players concurrently.
+
+        Args:
+            player_ids: FPL player IDs
+
+        Returns:
+            Mapping of player ID to player summary data, or to the exception raised
+            while fetching it
+        """
+        return await self._fetch_many({player_id: f"element-summary/{player_id}/" for player_id in player_ids})
+
+    async def get_entry_history(self, entry_id: int) -> dict[str, Any]:
+        """
+        Get season history for a manager's team (entry).
+
+        Args:
+            entry_id: FPL entry (manager team) ID
+
+        Returns:
+            Entry history data
+        """
+        return await self._make_request(f"entry/{entry_id}/history/")
+
+    async def get_entry_histories(self, entry_ids: Iterable[int]) -> dict[int, dict[str, Any] | Exception]:
+        """
+        Get season history for several manager teams concurrently.
+
+        Args:
+            entry_ids: FPL entry (manager team) IDs
+
+        Returns:
+            Mapping of entry ID to entry history data, or to the exception raised
+            while fetching it
+        """
+        return await self._fetch_many({entry_id: f"entry/{entry_id}/history/" for entry_id in entry_ids})
+
+    async def get_entry_picks(self, entry_id: int, gameweek: int) -> dict[str, Any]:
+        """
+        Get a manager team's picks for a gameweek.
+
+        Args:
+            entry_id: FPL entry (manager team) ID
+            gameweek: Gameweek ID
+
+        Returns:
+            Picks and entry history for the gameweek
+        """
+        return await self._make_request(f"entry/{entry_id}/event/{gameweek}/picks/")
+
+    async def get_entries_picks(self, entry_ids: Iterable[int], gameweek: int) -> dict[int, dict[str, Any] | Exception]:
+        """
+        Get several manager teams' picks for a gameweek concurrently.
+
+        Args:
+            entry_ids: FPL entry (manager team) IDs
+            gameweek: Gameweek ID
+
+        Returns:
+            Mapping of entry ID to picks data, or to the exception raised while
+            fetching it
+        """
+        return await self._fetch_many({entry_id: f"entry/{entry_id}/event/{gameweek}/picks/" for entry_id in entry_ids})
+
+    async def get_league_standings(self, league_id: int, page: int = 1) -> dict[str, Any]:
+        """
+        Get one page (50 entries) of standings for a classic league.
+
+        Args:
+            league_id: FPL classic league ID
+            page: Standings page number, starting at 1
+
+        Returns:
+            Raw league standings data
+        """
+        endpoint = f"leagues-classic/{league_id}/standings/"
+        if page > 1:
+            endpoint += f"?page_standings={page}"
+        return await self._make_request(endpoint)
+
+    async def iter_league_standings(self, league_id: int, max_pages: int | None = None) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream the standings pages of a classic league, in rank order.
+
+        Args:
+            league_id: FPL classic league ID
+            max_pages: Stop after this many pages (default: all pages)
+
+        Yields:
+            Raw league standings data, one page at a time
+        """
+        page = 1
+        while max_pages is None or page <= max_pages:
+            data = await self.get_league_standings(league_id, page)
+            yield data
+            if not data.get("standings", {}).get("has_next"):
+                break
+            page += 1
+
+
+# Create singleton instances sharing one response cache
+api = FPLAPI(snapshot_dir=FPL_SNAPSHOT_DIR)
+async_api = AsyncFPLAPI(cache=api.cache)
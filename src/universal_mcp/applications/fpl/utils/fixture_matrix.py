@@ -0,0 +1,225 @@
+"""Team-by-gameweek fixture matrix, rebuilt once per fixtures/bootstrap snapshot."""
+
+import asyncio
+import logging
+import threading
+from typing import Any
+
+import numpy as np
+
+from .api import async_api
+
+logger = logging.getLogger(__name__)
+
+# Difficulty assumed when a fixture has no FDR for a side
+DEFAULT_DIFFICULTY = 3
+
+
+class FixtureMatrix:
+    """
+    Fixtures laid out as (team, gameweek, slot) arrays.
+
+    Rows are teams (bootstrap order, then any team ids only seen in fixtures),
+    columns are gameweek ids and slots hold a team's fixtures within a gameweek
+    in fixture-list order, so a double gameweek fills two slots. Each cell stores
+    the opponent id, a home flag, the team's FDR and the fixture's position in the
+    raw fixtures list; empty slots have opponent 0 and position -1. Fixtures not
+    yet assigned to a gameweek are left out.
+    """
+
+    def __init__(self, bootstrap: dict[str, Any], fixtures: list[dict[str, Any]]):
+        """
+        Args:
+            bootstrap: Raw bootstrap-static payload
+            fixtures: Raw fixtures payload
+        """
+        # The payloads this matrix was built from, compared by identity to spot new snapshots
+        self.sources: tuple[dict[str, Any], list[dict[str, Any]] | None] = (bootstrap, fixtures)
+        self.fixtures = fixtures
+        self.gameweeks: list[dict[str, Any]] = bootstrap.get("events", [])
+        self.teams: dict[int, dict[str, Any]] = {t["id"]: t for t in bootstrap.get("teams", [])}
+        self.player_teams: dict[int, int] = {p["id"]: p["team"] for p in bootstrap.get("elements", [])}
+
+        scheduled = [(i, f) for i, f in enumerate(fixtures) if f.get("event")]
+
+        self.team_ids: list[int] = list(self.teams)
+        self.known_teams = len(self.team_ids)
+        for _, fixture in scheduled:
+            for team_id in (fixture.get("team_h"), fixture.get("team_a")):
+                if team_id not in self.teams and team_id not in self.team_ids:
+                    self.team_ids.append(team_id)
+        self.rows = {team_id: row for row, team_id in enumerate(self.team_ids)}
+
+        num_columns = max([f["event"] for _, f in scheduled] + [gw["id"] for gw in self.gameweeks] + [0]) + 1
+        shape = (len(self.team_ids), num_columns)
+        self.counts = np.zeros(shape, dtype=np.int16)
+
+        cells = []
+        for position, fixture in scheduled:
+            gw_id = fixture["event"]
+            for team_key, opponent_key, is_home in (("team_h", "team_a", True), ("team_a", "team_h", False)):
+                row = self.rows[fixture.get(team_key)]
+                slot = self.counts[row, gw_id]
+                self.counts[row, gw_id] += 1
+                difficulty = fixture.get("team_h_difficulty" if is_home else "team_a_difficulty", DEFAULT_DIFFICULTY)
+                cells.append((row, gw_id, slot, fixture.get(opponent_key, 0), is_home, difficulty, position))
+
+        num_slots = max(1, int(self.counts.max(initial=0)))
+        self.opponents = np.zeros((*shape, num_slots), dtype=np.int32)
+        self.is_home = np.zeros((*shape, num_slots), dtype=bool)
+        self.difficulty = np.zeros((*shape, num_slots), dtype=np.int16)
+        self.positions = np.full((*shape, num_slots), -1, dtype=np.int32)
+
+        if cells:
+            rows, columns, slots, opponents, homes, difficulties, positions = (np.array(c) for c in zip(*cells, strict=True))
+            index = (rows, columns, slots)
+            self.opponents[index] = opponents
+            self.is_home[index] = homes
+            self.difficulty[index] = difficulties
+            self.positions[index] = positions
+
+        logger.info(f"Built fixture matrix for {len(self.team_ids)} teams over {num_columns - 1} gameweeks")
+
+    def _window(self, start_gw: int, end_gw: int | None = None) -> slice:
+        """Column slice for gameweeks ``start_gw`` up to (not including) ``end_gw``."""
+        num_columns = self.counts.shape[1]
+        start = min(max(start_gw, 1), num_columns)
+        end = num_columns if end_gw is None else min(max(end_gw, start), num_columns)
+        return slice(start, end)
+
+    def team_name(self, team_id: int) -> str:
+        """Get a team name by ID, or "Team <id>" if not found."""
+        return self.teams.get(team_id, {}).get("name", f"Team {team_id}")
+
+    def player_team(self, player_id: int) -> int | None:
+        """Get the team ID of a player."""
+        return self.player_teams.get(player_id)
+
+    def fixtures_in_gameweek(self, gw_id: int) -> list[dict[str, Any]]:
+        """Get the raw fixtures scheduled in a gameweek, in fixture-list order."""
+        if not 0 < gw_id < self.counts.shape[1]:
+            return []
+        positions = np.unique(self.positions[:, gw_id])
+        return [self.fixtures[p] for p in positions[positions >= 0]]
+
+    def team_fixtures(self, team_id: int, start_gw: int, end_gw: int | None = None, limit: int | None = None) -> list[dict[str, Any]]:
+        """
+        Get a team's fixtures over a range of gameweeks.
+
+        Args:
+            team_id: FPL team ID
+            start_gw: First gameweek to include
+            end_gw: Gameweek to stop before (default: end of season)
+            limit: Maximum number of fixtures to return
+
+        Returns:
+            Fixtures ordered by gameweek, each with the gameweek, opponent ID, home
+            flag, difficulty and raw fixture
+        """
+        row = self.rows.get(team_id)
+        if row is None:
+            return []
+
+        window = self._window(start_gw, end_gw)
+        occupied = self.positions[row, window] >= 0
+        columns, slots = np.nonzero(occupied)
+        if limit is not None:
+            columns, slots = columns[:limit], slots[:limit]
+        columns = columns + window.start
+
+        return [
+            {
+                "gameweek": int(gw_id),
+                "opponent_id": int(self.opponents[row, gw_id, slot]),
+                "is_home": bool(self.is_home[row, gw_id, slot]),
+                "difficulty": int(self.difficulty[row, gw_id, slot]),
+                "fixture": self.fixtures[self.positions[row, gw_id, slot]],
+            }
+            for gw_id, slot in zip(columns.tolist(), slots.tolist(), strict=True)
+        ]
+
+    def blank_teams(self, gw_ids: list[int]) -> dict[int, list[int]]:
+        """
+        Get the teams without a fixture in each of the given gameweeks.
+
+        Returns:
+            Mapping of gameweek ID to team IDs in bootstrap order
+        """
+        num_columns = self.counts.shape[1]
+        in_range = [gw_id for gw_id in gw_ids if 0 <= gw_id < num_columns]
+        blank = self.counts[: self.known_teams, in_range] == 0
+
+        result = {gw_id: list(self.team_ids[: self.known_teams]) for gw_id in gw_ids}
+        for column, gw_id in enumerate(in_range):
+            result[gw_id] = [self.team_ids[row] for row in np.flatnonzero(blank[:, column])]
+        return result
+
+    def double_teams(self, gw_ids: list[int]) -> dict[int, list[tuple[int, int]]]:
+        """
+        Get the teams with more than one fixture in each of the given gameweeks.
+
+        Returns:
+            Mapping of gameweek ID to (team ID, fixture count) pairs, ordered by
+            each team's first appearance in that gameweek's fixtures
+        """
+        num_columns = self.counts.shape[1]
+        result: dict[int, list[tuple[int, int]]] = {}
+        for gw_id in gw_ids:
+            if not 0 <= gw_id < num_columns:
+                result[gw_id] = []
+                continue
+            rows = np.flatnonzero(self.counts[:, gw_id] > 1)
+            # Home side first when two doubling teams share their first fixture
+            first_seen = self.positions[rows, gw_id, 0] * 2 + ~self.is_home[rows, gw_id, 0]
+            rows = rows[np.argsort(first_seen, kind="stable")]
+            result[gw_id] = [(self.team_ids[row], int(self.counts[row, gw_id])) for row in rows]
+        return result
+
+    def difficulty_totals(self, start_gw: int, end_gw: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sum fixture difficulty for every team over a range of gameweeks in one pass.
+
+        Args:
+            start_gw: First gameweek to include
+            end_gw: Gameweek to stop before
+
+        Returns:
+            Arrays aligned with ``team_ids``: total difficulty, fixture count and
+            home fixture count
+        """
+        window = self._window(start_gw, end_gw)
+        totals = self.difficulty[:, window].sum(axis=(1, 2), dtype=np.int64)
+        counts = self.counts[:, window].sum(axis=1, dtype=np.int64)
+        home_counts = self.is_home[:, window].sum(axis=(1, 2), dtype=np.int64)
+        return totals, counts, home_counts
+
+
+class _LatestMatrix:
+    """The matrix for the most recently seen fixtures and bootstrap-static snapshots."""
+
+    def __init__(self):
+        self.matrix: FixtureMatrix | None = None
+        self.lock = threading.Lock()
+
+    def for_snapshots(self, bootstrap: dict[str, Any], fixtures: list[dict[str, Any]] | None) -> FixtureMatrix:
+        with self.lock:
+            matrix = self.matrix
+            if matrix is None or matrix.sources[0] is not bootstrap or matrix.sources[1] is not fixtures:
+                matrix = FixtureMatrix(bootstrap, fixtures or [])
+                matrix.sources = (bootstrap, fixtures)
+                self.matrix = matrix
+            return matrix
+
+
+_latest = _LatestMatrix()
+
+
+async def get_fixture_matrix() -> FixtureMatrix:
+    """
+    Get the fixture matrix for the current fixtures and bootstrap-static snapshots.
+
+    The matrix is rebuilt only when the API cache hands back new payloads, so
+    repeated fixture queries within a cache TTL reuse the same arrays.
+    """
+    bootstrap, fixtures = await asyncio.gather(async_api.get_bootstrap_static(), async_api.get_fixtures())
+    return _latest.for_snapshots(bootstrap, fixtures)
@@ -3,13 +3,39 @@
 import logging
 from typing import Any
 
-from .api import api
+from .api import async_api
+from .fixture_matrix import FixtureMatrix, get_fixture_matrix
+from .player_index import get_player_index
 
 # Set up logging following project conventions
 logger = logging.getLogger("fpl-mcp-server.fixtures")
 
 
-def get_fixtures_resource(gameweek_id: int | None = None, team_name: str | None = None) -> list[dict[str, Any]]:
+def _current_gameweek(gameweeks: list[dict[str, Any]]) -> int | None:
+    """Get the current gameweek ID, falling back to the one before the next gameweek."""
+    for gw in gameweeks:
+        if gw.get("is_current"):
+            return gw.get("id")
+
+    for gw in gameweeks:
+        if gw.get("is_next"):
+            gw_id = gw.get("id")
+            return gw_id - 1 if gw_id is not None else None
+
+    return None
+
+
+def _upcoming_gameweeks(gameweeks: list[dict[str, Any]], num_gameweeks: int) -> list[dict[str, Any]]:
+    """Get the current (or next) gameweek and the ones after it, up to ``num_gameweeks`` in total."""
+    current_gw = next((gw for gw in gameweeks if gw.get("is_current", False) or gw.get("is_next", False)), None)
+    if not current_gw:
+        return []
+
+    current_gw_id = current_gw["id"]
+    return [gw for gw in gameweeks if gw["id"] >= current_gw_id and gw["id"] < current_gw_id + num_gameweeks]
+
+
+async def get_fixtures_resource(gameweek_id: int | None = None, team_name: str | None = None) -> list[dict[str, Any]]:
     """Get fixtures from the FPL API with optional filtering by gameweek or team
 
     Args:
@@ -21,15 +47,14 @@ def get_fixtures_resource(gameweek_id: int | None = None, team_name: str | None
     """
     logger.info(f"Getting fixtures (gameweek_id={gameweek_id}, team_name={team_name})")
 
-    # Get raw fixtures data
-    fixtures = api.get_fixtures()
-    if not fixtures:
+    matrix = await get_fixture_matrix()
+    if not matrix.fixtures:
         logger.warning("No fixtures data found")
         return []
 
-    # Get teams data for mapping IDs to names
-    teams_data = api.get_teams()
-    team_map = {t["id"]: t for t in teams_data}
+    # Take a single gameweek's fixtures straight from the matrix column
+    fixtures = matrix.fixtures if gameweek_id is None else matrix.fixtures_in_gameweek(gameweek_id)
+    team_map = matrix.teams
 
     # Format each fixture
     formatted_fixtures = []
@@ -64,10 +89,6 @@ def get_fixtures_resource(gameweek_id: int | None = None, team_name: str | None
 
         formatted_fixtures.append(formatted_fixture)
 
-    # Apply gameweek filter if provided
-    if gameweek_id is not None:
-        formatted_fixtures = [f for f in formatted_fixtures if f["gameweek"] == gameweek_id]
-
     # Apply team filter if provided
     if team_name is not None:
         team_name_lower = team_name.lower()
@@ -95,7 +116,37 @@ def get_fixtures_resource(gameweek_id: int | None = None, team_name: str | None
     return formatted_fixtures
 
 
-def get_player_fixtures(player_id: int, num_fixtures: int = 5) -> list[dict[str, Any]]:
+def format_team_fixtures(matrix: FixtureMatrix, team_fixtures: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Format fixtures from ``FixtureMatrix.team_fixtures`` from the team's point of view.
+
+    Args:
+        matrix: Fixture matrix the fixtures came from
+        team_fixtures: Team fixtures to format
+
+    Returns:
+        List of fixtures with gameweek, kickoff, location, opponent and difficulty
+    """
+    formatted_fixtures = []
+    for entry in team_fixtures:
+        opponent_id = entry["opponent_id"]
+        opponent_team = matrix.teams.get(opponent_id, {})
+
+        formatted_fixtures.append(
+            {
+                "gameweek": entry["gameweek"],
+                "kickoff_time": entry["fixture"].get("kickoff_time", ""),
+                "location": "home" if entry["is_home"] else "away",
+                "opponent": opponent_team.get("name", f"Team {opponent_id}"),
+                "opponent_short": opponent_team.get("short_name", ""),
+                # Higher is more difficult
+                "difficulty": entry["difficulty"],
+            }
+        )
+
+    return formatted_fixtures
+
+
+async def get_player_fixtures(player_id: int, num_fixtures: int = 5) -> list[dict[str, Any]]:
     """Get upcoming fixtures for a specific player
 
     Args:
@@ -107,100 +158,34 @@ def get_player_fixtures(player_id: int, num_fixtures: int = 5) -> list[dict[str,
     """
     logger.info(f"Getting player fixtures (player_id={player_id}, num_fixtures={num_fixtures})")
 
-    # Get player data to find their team
-    players_data = api.get_players()
-    player = None
-    for p in players_data:
-        if p.get("id") == player_id:
-            player = p
-            break
+    matrix = await get_fixture_matrix()
 
-    if not player:
+    # Find the player's team
+    if player_id not in matrix.player_teams:
         logger.warning(f"Player with ID {player_id} not found")
         return []
 
-    team_id = player.get("team")
+    team_id = matrix.player_team(player_id)
     if not team_id:
         logger.warning(f"Team ID not found for player {player_id}")
         return []
 
-    # Get all fixtures
-    all_fixtures = api.get_fixtures()
-    if not all_fixtures:
+    if not matrix.fixtures:
         logger.warning("No fixtures data found")
         return []
 
-    # Get gameweeks to determine current gameweek
-    gameweeks = api.get_gameweeks()
-    current_gameweek = None
-    for gw in gameweeks:
-        if gw.get("is_current"):
-            current_gameweek = gw.get("id")
-            break
-
-    if not current_gameweek:
-        for gw in gameweeks:
-            if gw.get("is_next"):
-                gw_id = gw.get("id")
-                if gw_id is not None:
-                    current_gameweek = gw_id - 1
-                break
-
+    current_gameweek = _current_gameweek(matrix.gameweeks)
     if not current_gameweek:
         logger.warning("Could not determine current gameweek")
         return []
 
-    # Filter upcoming fixtures for player's team
-    upcoming_fixtures = []
-
-    for fixture in all_fixtures:
-        # Only include fixtures from current gameweek onwards
-        if fixture.get("event") and fixture.get("event") >= current_gameweek:
-            # Check if player's team is involved
-            if fixture.get("team_h") == team_id or fixture.get("team_a") == team_id:
-                upcoming_fixtures.append(fixture)
-
-    # Sort by gameweek
-    upcoming_fixtures.sort(key=lambda x: x.get("event", 0))
-
-    # Limit to requested number of fixtures
-    upcoming_fixtures = upcoming_fixtures[:num_fixtures]
-
-    # Get teams data for mapping IDs to names
-    teams_data = api.get_teams()
-    team_map = {t["id"]: t for t in teams_data}
-
-    # Format fixtures
-    formatted_fixtures = []
-    for fixture in upcoming_fixtures:
-        home_id = fixture.get("team_h", 0)
-        away_id = fixture.get("team_a", 0)
-
-        # Determine if player's team is home or away
-        is_home = home_id == team_id
+    # Slice the team's row from the current gameweek onwards
+    upcoming_fixtures = matrix.team_fixtures(team_id, current_gameweek, limit=num_fixtures)
 
-        # Get opponent team data
-        opponent_id = away_id if is_home else home_id
-        opponent_team = team_map.get(opponent_id, {})
-
-        # Determine difficulty - higher is more difficult
-        difficulty = fixture.get("team_h_difficulty" if is_home else "team_a_difficulty", 3)
-
-        formatted_fixture = {
-            "gameweek": fixture.get("event"),
-            "kickoff_time": fixture.get("kickoff_time", ""),
-            "location": "home" if is_home else "away",
-            "opponent": opponent_team.get("name", f"Team {opponent_id}"),
-            "opponent_short": opponent_team.get("short_name", ""),
-            "difficulty": difficulty,
-        }
-
-        formatted_fixtures.append(formatted_fixture)
-
-    return formatted_fixtures
+    return format_team_fixtures(matrix, upcoming_fixtures)
 
 
-def analyze_player_fixtures(player_id: int, num_fixtures: int = 5) -> dict[str, Any]:
+async def analyze_player_fixtures(player_id: int, num_fixtures: int = 5) -> dict[str, Any]:
     """Analyze upcoming fixtures for a player and provide a difficulty rating
 
     Args:
@@ -213,40 +198,13 @@ def analyze_player_fixtures(player_id: int, num_fixtures: int = 5) -> dict[str,
     logger.info(f"Analyzing player fixtures (player_id={player_id}, num_fixtures={num_fixtures})")
 
     # Get player data
-    players_data = api.get_players()
-    player = None
-    for p in players_data:
-        if p.get("id") == player_id:
-            player = p
-            break
-
+    player = (await get_player_index()).get_player(player_id)
     if not player:
         logger.warning(f"Player with ID {player_id} not found")
         return {"error": f"Player with ID {player_id} not found"}
 
-    # Get team and position data for the player
-    teams_data = api.get_teams()
-    team_map = {t["id"]: t for t in teams_data}
-    logger.info("Analyze Player Fixtures: Team data loaded: %s", team_map)
-
-    position_data = api.get_bootstrap_static()
-    position_map = {p["id"]: p for p in position_data.get("element_types", [])}
-    logger.info("Analyze Player Fixtures: Position data loaded: %s", position_map)
-
-    # Map team name
-    logger.info(
-        "Searching for team name %s and position %s",
-        player.get("team"),
-        player.get("element_type"),
-    )
-    team_id = player.get("team")
-    team_info = team_map.get(team_id, {})
-    team_name = team_info.get("name", "Unknown team")
-
-    # Map position name
-    position_id = player.get("element_type")
-    position_info = position_map.get(position_id, {})
-    position_code = position_info.get("singular_name_short", "Unknown position")
+    team_name = player["team"]
+    position_code = player["position"]
 
     logger.info("Player %s plays as %s for %s", player.get("web_name"), position_code, team_name)
 
@@ -255,7 +213,7 @@ def analyze_player_fixtures(player_id: int, num_fixtures: int = 5) -> dict[str,
     position = position_mapping.get(position_code, position_code)
 
     # Get player's fixtures
-    fixtures = get_player_fixtures(player_id, num_fixtures)
+    fixtures = await get_player_fixtures(player_id, num_fixtures)
     if not fixtures:
         return {
             "player": {
@@ -320,7 +278,7 @@ def analyze_player_fixtures(player_id: int, num_fixtures: int = 5) -> dict[str,
     }
 
 
-def get_blank_gameweeks(num_gameweeks: int = 5) -> list[dict[str, Any]]:
+async def get_blank_gameweeks(num_gameweeks: int = 5) -> list[dict[str, Any]]:
     """
     Identify upcoming blank gameweeks where teams don't have a fixture.
 
@@ -330,56 +288,30 @@ def get_blank_gameweeks(num_gameweeks: int = 5) -> list[dict[str, Any]]:
     Returns:
         List of blank gameweeks with affected teams
     """
-    # Get gameweek data
-    all_gameweeks = api.get_gameweeks()
-    all_fixtures = api.get_fixtures()
-    team_data = api.get_teams()
-
-    # Get current gameweek
-    current_gw = None
-    for gw in all_gameweeks:
-        if gw.get("is_current", False) or gw.get("is_next", False):
-            current_gw = gw
-            break
-
-    if not current_gw:
-        return []
-
-    current_gw_id = current_gw["id"]
+    matrix = await get_fixture_matrix()
 
     # Limit to specified number of upcoming gameweeks
-    upcoming_gameweeks = [gw for gw in all_gameweeks if gw["id"] >= current_gw_id and gw["id"] < current_gw_id + num_gameweeks]
+    upcoming_gameweeks = _upcoming_gameweeks(matrix.gameweeks, num_gameweeks)
+    if not upcoming_gameweeks:
+        return []
 
-    # Map team IDs to names
-    team_map = {t["id"]: t for t in team_data}
+    # Teams with a zero fixture count, for every upcoming gameweek at once
+    blank_teams = matrix.blank_teams([gw["id"] for gw in upcoming_gameweeks])
 
     # Results to return
     blank_gameweeks = []
 
-    # Analyze each upcoming gameweek
     for gameweek in upcoming_gameweeks:
         gw_id = gameweek["id"]
 
-        # Get fixtures for this gameweek
-        gw_fixtures = [f for f in all_fixtures if f.get("event") == gw_id]
-
-        # Get teams with fixtures this gameweek
-        teams_with_fixtures = set()
-        for fixture in gw_fixtures:
-            teams_with_fixtures.add(fixture.get("team_h"))
-            teams_with_fixtures.add(fixture.get("team_a"))
-
-        # Identify teams without fixtures (blank gameweek)
-        teams_without_fixtures = []
-        for team_id, team in team_map.items():
-            if team_id not in teams_with_fixtures:
-                teams_without_fixtures.append(
-                    {
-                        "id": team_id,
-                        "name": team.get("name", f"Team {team_id}"),
-                        "short_name": team.get("short_name", ""),
-                    }
-                )
+        teams_without_fixtures = [
+            {
+                "id": team_id,
+                "name": matrix.team_name(team_id),
+                "short_name": matrix.teams[team_id].get("short_name", ""),
+            }
+            for team_id in blank_teams[gw_id]
+        ]
 
         # If teams have blank gameweek, add to results
         if teams_without_fixtures:
@@ -395,7 +327,7 @@ def get_blank_gameweeks(num_gameweeks: int = 5) -> list[dict[str, Any]]:
     return blank_gameweeks
 
 
-def get_double_gameweeks(num_gameweeks: int = 5) -> list[dict[str, Any]]:
+async def get_double_gameweeks(num_gameweeks: int = 5) -> list[dict[str, Any]]:
     """
     Identify upcoming double gameweeks where teams have multiple fixtures.
 
@@ -405,61 +337,31 @@ def get_double_gameweeks(num_gameweeks: int = 5) -> list[dict[str, Any]]:
     Returns:
         List of double gameweeks with affected teams
     """
-    # Get gameweek data
-    all_gameweeks = api.get_gameweeks()
-    all_fixtures = api.get_fixtures()
-    team_data = api.get_teams()
-
-    # Get current gameweek
-    current_gw = None
-    for gw in all_gameweeks:
-        if gw.get("is_current", False) or gw.get("is_next", False):
-            current_gw = gw
-            break
-
-    if not current_gw:
-        return []
-
-    current_gw_id = current_gw["id"]
+    matrix = await get_fixture_matrix()
 
     # Limit to specified number of upcoming gameweeks
-    upcoming_gameweeks = [gw for gw in all_gameweeks if gw["id"] >= current_gw_id and gw["id"] < current_gw_id + num_gameweeks]
+    upcoming_gameweeks = _upcoming_gameweeks(matrix.gameweeks, num_gameweeks)
+    if not upcoming_gameweeks:
+        return []
 
-    # Map team IDs to names
-    team_map = {t["id"]: t for t in team_data}
+    # Teams with more than one fixture, for every upcoming gameweek at once
+    double_teams = matrix.double_teams([gw["id"] for gw in upcoming_gameweeks])
 
     # Results to return
     double_gameweeks = []
 
-    # Analyze each upcoming gameweek
     for gameweek in upcoming_gameweeks:
         gw_id = gameweek["id"]
 
-        # Get fixtures for this gameweek
-        gw_fixtures = [f for f in all_fixtures if f.get("event") == gw_id]
-
-        # Count fixtures per team
-        team_fixture_count = {}
-        for fixture in gw_fixtures:
-            home_team = fixture.get("team_h")
-            away_team = fixture.get("team_a")
-
-            team_fixture_count[home_team] = team_fixture_count.get(home_team, 0) + 1
-            team_fixture_count[away_team] = team_fixture_count.get(away_team, 0) + 1
-
-        # Identify teams with multiple fixtures (double gameweek)
-        teams_with_doubles = []
-        for team_id, count in team_fixture_count.items():
-            if count > 1:
-                team = team_map.get(team_id, {})
-                teams_with_doubles.append(
-                    {
-                        "id": team_id,
-                        "name": team.get("name", f"Team {team_id}"),
-                        "short_name": team.get("short_name", ""),
-                        "fixture_count": count,
-                    }
-                )
+        teams_with_doubles = [
+            {
+                "id": team_id,
+                "name": matrix.team_name(team_id),
+                "short_name": matrix.teams.get(team_id, {}).get("short_name", ""),
+                "fixture_count": count,
+            }
+            for team_id, count in double_teams[gw_id]
+        ]
 
         # If teams have double gameweek, add to results
         if teams_with_doubles:
@@ -475,7 +377,7 @@ def get_double_gameweeks(num_gameweeks: int = 5) -> list[dict[str, Any]]:
     return double_gameweeks
 
 
-def get_player_gameweek_history(player_ids: list[int], num_gameweeks: int = 5) -> dict[str, Any]:
+async def get_player_gameweek_history(player_ids: list[int], num_gameweeks: int = 5) -> dict[str, Any]:
     """Get recent gameweek history for multiple players.
 
     Args:
@@ -489,7 +391,7 @@ def get_player_gameweek_history(player_ids: list[int], num_gameweeks: int = 5) -
     logger.info(f"Getting gameweek history for {len(player_ids)} players, {num_gameweeks} gameweeks")
 
     # Get current gameweek to determine range
-    gameweeks = api.get_gameweeks()
+    gameweeks = await async_api.get_gameweeks()
     current_gameweek = None
 
     for gw in gameweeks:
@@ -515,13 +417,16 @@ def get_player_gameweek_history(player_ids: list[int], num_gameweeks: int = 5) -
     gameweek_range = list(range(start_gameweek, current_gameweek + 1))
     logger.info(f"Analyzing gameweek range: {gameweek_range}")
 
-    # Fetch history for each player
+    # Fetch all player summaries concurrently, then map opponent IDs to names
+    summaries = await async_api.get_player_summaries(player_ids)
+    team_names = {t["id"]: t.get("name", "Unknown team") for t in await async_api.get_teams()}
+
     result = {}
 
-    for player_id in player_ids:
+    for player_id, player_summary in summaries.items():
         try:
-            # Get player summary which includes history
-            player_summary = api.get_player_summary(player_id)
+            if isinstance(player_summary, Exception):
+                raise player_summary
 
             if not player_summary or "history" not in player_summary:
                 logger.warning(f"No history data found for player {player_id}")
@@ -542,7 +447,7 @@ def get_player_gameweek_history(player_ids: list[int], num_gameweeks: int = 5) -
                             "assists": entry.get("assists", 0),
                             "clean_sheets": entry.get("clean_sheets", 0),
                             "bonus": entry.get("bonus", 0),
-                            "opponent": get_team_name_by_id(entry.get("opponent_team")),
+                            "opponent": team_names.get(entry.get("opponent_team"), "Unknown team"),
                             "was_home": entry.get("was_home", False),
                             # Added additional stats as requested
                             "expected_goals": entry.get("expected_goals", 0),
@@ -574,7 +479,7 @@ def get_player_gameweek_history(player_ids: list[int], num_gameweeks: int = 5) -
     return {"players": result, "gameweeks": gameweek_range}
 
 
-def get_team_name_by_id(team_id: int) -> str:
+async def get_team_name_by_id(team_id: int) -> str:
     """Get team name from team ID.
 
     Args:
@@ -586,10 +491,4 @@ def get_team_name_by_id(team_id: int) -> str:
     if team_id is None:
         return "Unknown team"
 
-    teams_data = api.get_teams()
-
-    for team in teams_data:
-        if team.get("id") == team_id:
-            return team.get("name", "Unknown team")
-
-    return "Unknown team"
+    return (await get_player_index()).get_team_name(team_id)
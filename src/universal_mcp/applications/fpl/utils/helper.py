@@ -3,12 +3,15 @@ import logging
 from typing import Any
 
 logger = logging.getLogger("fpl-mcp-server.fixtures")
-from .api import api
+from .api import async_api
+from .fixture_matrix import get_fixture_matrix
+from .fixtures import get_player_fixtures
+from .player_index import get_player_index
 
 # Resources
 
 
-def get_players_resource(name_filter: str | None = None, team_filter: str | None = None) -> list[dict[str, Any]]:
+async def get_players_resource(name_filter: str | None = None, team_filter: str | None = None) -> list[dict[str, Any]]:
     """
     Format player data for the MCP resource.
 
@@ -17,91 +20,22 @@ def get_players_resource(name_filter: str | None = None, team_filter: str | None
         team_filter: Optional filter for team name (case-insensitive partial match)
 
     Returns:
-        Formatted player data
+        Formatted player data (copies, safe for callers to modify)
     """
-    # Get raw data from API
-    data = api.get_bootstrap_static()
-
-    # Create team and position lookup maps
-    team_map = {t["id"]: t for t in data["teams"]}
-    position_map = {p["id"]: p for p in data["element_types"]}
-    logging.info(f"Team map: {team_map}")
-    logging.info(f"Position map: {position_map}")
-
-    # Format player data
-    players = []
-    for player in data["elements"]:
-        # Extract team and position info
-        team = team_map.get(player["team"], {})
-        position = position_map.get(player["element_type"], {})
-
-        player_name = f"{player['first_name']} {player['second_name']}"
-        team_name = team.get("name", "Unknown")
-
-        # Apply filters if specified
-        if name_filter and name_filter.lower() not in player_name.lower():
-            continue
-
-        if team_filter and team_filter.lower() not in team_name.lower():
-            continue
-
-        # Build comprehensive player object with all available stats
-        player_data = {
-            "id": player["id"],
-            "name": player_name,
-            "web_name": player["web_name"],
-            "team": team_name,
-            "team_short": team.get("short_name", "UNK"),
-            "position": position.get("singular_name_short", "UNK"),
-            "price": player["now_cost"] / 10.0,
-            "form": player["form"],
-            "points": player["total_points"],
-            "points_per_game": player["points_per_game"],
-            # Playing time
-            "minutes": player["minutes"],
-            "starts": player["starts"],
-            # Key stats
-            "goals": player["goals_scored"],
-            "assists": player["assists"],
-            "clean_sheets": player["clean_sheets"],
-            "goals_conceded": player["goals_conceded"],
-            "own_goals": player["own_goals"],
-            "penalties_saved": player["penalties_saved"],
-            "penalties_missed": player["penalties_missed"],
-            "yellow_cards": player["yellow_cards"],
-            "red_cards": player["red_cards"],
-            "saves": player["saves"],
-            "bonus": player["bonus"],
-            "bps": player["bps"],
-            # Advanced metrics
-            "influence": player["influence"],
-            "creativity": player["creativity"],
-            "threat": player["threat"],
-            "ict_index": player["ict_index"],
-            # Expected stats (if available)
-            "expected_goals": player.get("expected_goals", "N/A"),
-            "expected_assists": player.get("expected_assists", "N/A"),
-            "expected_goal_involvements": player.get("expected_goal_involvements", "N/A"),
-            "expected_goals_conceded": player.get("expected_goals_conceded", "N/A"),
-            # Ownership & transfers
-            "selected_by_percent": player["selected_by_percent"],
-            "transfers_in_event": player["transfers_in_event"],
-            "transfers_out_event": player["transfers_out_event"],
-            # Price changes
-            "cost_change_event": player["cost_change_event"] / 10.0,
-            "cost_change_start": player["cost_change_start"] / 10.0,
-            # Status info
-            "status": player["status"],
-            "news": player["news"],
-            "chance_of_playing_next_round": player["chance_of_playing_next_round"],
-        }
+    index = await get_player_index()
+
+    players = index.players
+    if name_filter:
+        name_filter = name_filter.lower()
+        players = [p for p in players if name_filter in p["name"].lower()]
+    if team_filter:
+        team_filter = team_filter.lower()
+        players = [p for p in players if team_filter in p["team"].lower()]
 
-        players.append(player_data)
-    logging.info(f"Formatted {len(players)} players")
-    return players
+    return [dict(p) for p in players]
 
 
-def get_team_name_by_id(team_id: int | None) -> str:
+async def get_team_name_by_id(team_id: int | None) -> str:
     """Get team name from team ID.
 
     Args:
@@ -113,16 +47,10 @@ def get_team_name_by_id(team_id: int | None) -> str:
     if team_id is None:
         return "Unknown team"
 
-    teams_data = api.get_teams()
-
-    for team in teams_data:
-        if team.get("id") == team_id:
-            return team.get("name", "Unknown team")
-
-    return "Unknown team"
+    return (await get_player_index()).get_team_name(team_id)
 
 
-def get_player_by_id(player_id: int) -> dict[str, Any] | None:
+async def get_player_by_id(player_id: int) -> dict[str, Any] | None:
     """
     Get detailed information for a specific player by ID.
 
@@ -132,175 +60,45 @@ def get_player_by_id(player_id: int) -> dict[str, Any] | None:
     Returns:
         Player data or None if not found
     """
-    # Get all players
-    all_players = get_players_resource()
+    indexed = (await get_player_index()).get_player(player_id)
+    if indexed is None:
+        return None
 
-    # Find player by ID
-    for player in all_players:
-        if player["id"] == player_id:
-            # Get additional detail data
-            try:
-                summary = api.get_player_summary(player_id)
+    player = dict(indexed)
 
-                # Add fixture history
-                player["history"] = summary.get("history", [])
+    # Get additional detail data
+    try:
+        summary = await async_api.get_player_summary(player_id)
 
-                # Add upcoming fixtures
-                player["fixtures"] = summary.get("fixtures", [])
+        # Add fixture history
+        player["history"] = summary.get("history", [])
 
-                return player
-            except Exception:
-                # Return basic player data if detailed data not available
-                return player
+        # Add upcoming fixtures
+        player["fixtures"] = summary.get("fixtures", [])
 
-    return None
+        return player
+    except Exception:
+        # Return basic player data if detailed data not available
+        return player
 
 
-def find_players_by_name(name: str, limit: int = 5) -> list[dict[str, Any]]:
+async def find_players_by_name(name: str, limit: int = 5) -> list[dict[str, Any]]:
     """
     Find players by partial name match with advanced matching.
 
     Args:
-        name: Player name to search for (supports partial names, nicknames, and initials)
+        name: Player name to search for (supports partial names, nicknames, initials and misspellings)
         limit: Maximum number of results to return
 
     Returns:
         List of matching players sorted by relevance and points
     """
-    # Get all players
     logger = logging.getLogger(__name__)
     logger.info(f"Finding players by name: {name}")
-    all_players = get_players_resource()
-    logger.info(f"Found {len(all_players)} players")
-
-    # Normalize search term
-    search_term = name.lower().strip()
-    if not search_term:
-        return []
-
-    # Common nickname and abbreviation mapping
-    nicknames = {
-        "kdb": "kevin de bruyne",
-        "vvd": "virgil van dijk",
-        "taa": "trent alexander-arnold",
-        "cr7": "cristiano ronaldo",
-        "bobby": "roberto firmino",
-        "mo salah": "mohamed salah",
-        "mane": "sadio mane",
-        "auba": "aubameyang",
-        "lewa": "lewandowski",
-        "kane": "harry kane",
-        "rashford": "marcus rashford",
-        "son": "heung-min son",
-    }
+    return [dict(p) for p in (await get_player_index()).find_by_name(name, limit)]
 
-    # Check for nickname match
-    if search_term in nicknames:
-        search_term = nicknames[search_term]
-
-    # Split search term into parts for multi-part matching
-    search_parts = search_term.split()
-
-    # Store scored results
-    scored_players = []
-
-    for player in all_players:
-        # Extract player name components
-        full_name = player["name"].lower()
-        web_name = player.get("web_name", "").lower()
-
-        # Try to extract first and last name
-        name_parts = full_name.split()
-        first_name = name_parts[0] if name_parts else ""
-        last_name = name_parts[-1] if len(name_parts) > 1 else ""
-
-        # Initialize score and tracking reasons
-        score = 0
-
-        # 1. Exact full name match
-        if search_term == full_name:
-            score += 100
-
-        # 2. Exact match on web_name (common name)
-        elif search_term == web_name:
-            score += 90
-
-        # 3. Exact match on last name
-        elif len(search_parts) == 1 and search_term == last_name:
-            score += 80
-
-        # 4. Exact match on first name
-        elif len(search_parts) == 1 and search_term == first_name:
-            score += 70
-
-        # 5. Check for initials match (e.g., "KDB")
-        if len(search_term) <= 5 and all(c.isalpha() for c in search_term):
-            # Try to match initials
-            initials = "".join(part[0] for part in full_name.split() if part)
-            if search_term.lower() == initials.lower():
-                score += 85
-
-        # 6. Multi-part name matching (e.g., "Mo Salah")
-        if len(search_parts) > 1:
-            # Check if first part matches first name and last part matches last name
-            if search_parts[0] in first_name and search_parts[-1] in last_name:
-                score += 75
-
-            # Check if parts appear in order in the full name
-            search_combined = "".join(search_parts)
-            full_combined = "".join(full_name.split())
-            if search_combined in full_combined:
-                score += 50
-
-        # 7. Substring matches
-        if search_term in full_name:
-            score += 40
-
-        # 8. Partial word matches in full name
-        for part in search_parts:
-            if part in full_name:
-                score += 30
-
-        # 9. Partial word matches in web name
-        for part in search_parts:
-            if part in web_name:
-                score += 25
-
-        # 10. Add a bonus score for high-point players (tiebreaker)
-        points_score = min(20, float(player["points"]) / 50)  # Up to 20 extra points
-
-        # Total score
-        total_score = score + (points_score if score > 0 else 0)
-
-        # Add to results if there's any match
-        if score > 0:
-            scored_players.append((total_score, player))
-
-    # Sort by score (highest first)
-    sorted_players = [player for _, player in sorted(scored_players, key=lambda x: x[0], reverse=True)]
-    # If no matches with good confidence, fall back to simple contains match
-    if not sorted_players or (sorted_players and scored_players[0][0] < 30):
-        fallback_players = [p for p in all_players if search_term in p["name"].lower() or search_term in p.get("web_name", "").lower()]
-        # Sort fallback by points
-        fallback_players.sort(key=lambda p: float(p["points"]), reverse=True)
-
-        # Merge results, prioritizing scored results
-        merged = []
-        seen_ids = set(p["id"] for p in sorted_players)
-
-        merged.extend(sorted_players)
-        for p in fallback_players:
-            if p["id"] not in seen_ids:
-                merged.append(p)
-                seen_ids.add(p["id"])
-
-        sorted_players = merged
-
-    # Return limited results
-    return sorted_players[:limit]
-
-
-def get_current_gameweek_resource() -> dict[str, Any]:
+
+async def get_current_gameweek_resource() -> dict[str, Any]:
     """
     Get current gameweek data with additional details.
 
@@ -308,10 +106,10 @@ def get_current_gameweek_resource() -> dict[str, Any]:
         Current gameweek data with enhanced information
     """
     # Get current gameweek
-    current_gw = api.get_current_gameweek()
+    current_gw = await async_api.get_current_gameweek()
 
     # Get raw data to extract player details
-    all_data = api.get_bootstrap_static()
+    all_data = await async_api.get_bootstrap_static()
 
     # Create enhanced gameweek data
     gw_data = {
@@ -387,121 +185,14 @@ def get_current_gameweek_resource() -> dict[str, Any]:
         gw_data["popular_players"] = popular_players
 
     # Add fixtures if the API has them
-    fixtures = api.get_fixtures()
-    if fixtures:
-        gw_fixtures = [f for f in fixtures if f.get("event") == current_gw["id"]]
-        if gw_fixtures:
-            gw_data["fixture_count"] = len(gw_fixtures)
+    gw_fixtures = (await get_fixture_matrix()).fixtures_in_gameweek(current_gw["id"])
+    if gw_fixtures:
+        gw_data["fixture_count"] = len(gw_fixtures)
 
     return gw_data
 
 
-def get_player_fixtures(player_id: int, num_fixtures: int = 5) -> list[dict[str, Any]]:
-    """Get upcoming fixtures for a specific player
-
-    Args:
-        player_id: FPL ID of the player
-        num_fixtures: Number of upcoming fixtures to return
-
-    Returns:
-        List of upcoming fixtures for the player
-    """
-    logger.info(f"Getting player fixtures (player_id={player_id}, num_fixtures={num_fixtures})")
-
-    # Get player data to find their team
-    players_data = api.get_players()
-    player = None
-    for p in players_data:
-        if p.get("id") == player_id:
-            player = p
-            break
-
-    if not player:
-        logger.warning(f"Player with ID {player_id} not found")
-        return []
-
-    team_id = player.get("team")
-    if not team_id:
-        logger.warning(f"Team ID not found for player {player_id}")
-        return []
-
-    # Get all fixtures
-    all_fixtures = api.get_fixtures()
-    if not all_fixtures:
-        logger.warning("No fixtures data found")
-        return []
-
-    # Get gameweeks to determine current gameweek
-    gameweeks = api.get_gameweeks()
-    current_gameweek = None
-    for gw in gameweeks:
-        if gw.get("is_current"):
-            current_gameweek = gw.get("id")
-            break
-
-    if not current_gameweek:
-        for gw in gameweeks:
-            if gw.get("is_next"):
-                gw_id = gw.get("id")
-                if gw_id is not None:
-                    current_gameweek = gw_id - 1
-                break
-
-    if not current_gameweek:
-        logger.warning("Could not determine current gameweek")
-        return []
-
-    # Filter upcoming fixtures for player's team
-    upcoming_fixtures = []
-
-    for fixture in all_fixtures:
-        # Only include fixtures from current gameweek onwards
-        if fixture.get("event") and fixture.get("event") >= current_gameweek:
-            # Check if player's team is involved
-            if fixture.get("team_h") == team_id or fixture.get("team_a") == team_id:
-                upcoming_fixtures.append(fixture)
-
-    # Sort by gameweek
-    upcoming_fixtures.sort(key=lambda x: x.get("event", 0))
-
-    # Limit to requested number of fixtures
-    upcoming_fixtures = upcoming_fixtures[:num_fixtures]
-
-    # Get teams data for mapping IDs to names
-    teams_data = api.get_teams()
-    team_map = {t["id"]: t for t in teams_data}
-
-    # Format fixtures
-    formatted_fixtures = []
-    for fixture in upcoming_fixtures:
-        home_id = fixture.get("team_h", 0)
-        away_id = fixture.get("team_a", 0)
-
-        # Determine if player's team is home or away
-        is_home = home_id == team_id
-
-        # Get opponent team data
-        opponent_id = away_id if is_home else home_id
-        opponent_team = team_map.get(opponent_id, {})
-
-        # Determine difficulty - higher is more difficult
-        difficulty = fixture.get("team_h_difficulty" if is_home else "team_a_difficulty", 3)
-
-        formatted_fixture = {
-            "gameweek": fixture.get("event"),
-            "kickoff_time": fixture.get("kickoff_time", ""),
-            "location": "home" if is_home else "away",
-            "opponent": opponent_team.get("name", f"Team {opponent_id}"),
-            "opponent_short": opponent_team.get("short_name", ""),
-            "difficulty": difficulty,
-        }
-
-        formatted_fixtures.append(formatted_fixture)
-
-    return formatted_fixtures
-
-
-def get_player_gameweek_history(player_ids: list[int], num_gameweeks: int = 5) -> dict[str, Any]:
+async def get_player_gameweek_history(player_ids: list[int], num_gameweeks: int = 5) -> dict[str, Any]:
     """Get recent gameweek history for multiple players.
 
     Args:
@@ -515,7 +206,7 @@ def get_player_gameweek_history(player_ids: list[int], num_gameweeks: int = 5) -
     logger.info(f"Getting gameweek history for {len(player_ids)} players, {num_gameweeks} gameweeks")
 
     # Get current gameweek to determine range
-    gameweeks = api.get_gameweeks()
+    gameweeks = await async_api.get_gameweeks()
     current_gameweek = None
 
     for gw in gameweeks:
@@ -541,13 +232,16 @@ def get_player_gameweek_history(player_ids: list[int], num_gameweeks: int = 5) -
     gameweek_range = list(range(start_gameweek, current_gameweek + 1))
     logger.info(f"Analyzing gameweek range: {gameweek_range}")
 
-    # Fetch history for each player
+    # Fetch all player summaries concurrently, then map opponent IDs to names
+    summaries = await async_api.get_player_summaries(player_ids)
+    team_names = {t["id"]: t.get("name", "Unknown team") for t in await async_api.get_teams()}
+
     result = {}
 
-    for player_id in player_ids:
+    for player_id, player_summary in summaries.items():
         try:
-            # Get player summary which includes history
-            player_summary = api.get_player_summary(player_id)
+            if isinstance(player_summary, Exception):
+                raise player_summary
 
             if not player_summary or "history" not in player_summary:
                 logger.warning(f"No history data found for player {player_id}")
@@ -568,7 +262,7 @@ def get_player_gameweek_history(player_ids: list[int], num_gameweeks: int = 5) -
                             "assists": entry.get("assists", 0),
                             "clean_sheets": entry.get("clean_sheets", 0),
                             "bonus": entry.get("bonus", 0),
-                            "opponent": get_team_name_by_id(entry.get("opponent_team")),
+                            "opponent": team_names.get(entry.get("opponent_team"), "Unknown team"),
                             "was_home": entry.get("was_home", False),
                             # Added additional stats as requested
                             "expected_goals": entry.get("expected_goals", 0),
@@ -601,7 +295,7 @@ def get_player_gameweek_history(player_ids: list[int], num_gameweeks: int = 5) -
 
 
 # Tools
-def get_player_info(
+async def get_player_info(
     player_id: int | None = None,
     player_name: str | None = None,
     start_gameweek: int | None = None,
@@ -627,15 +321,15 @@ def get_player_info(
     logger.info(f"Getting player info: ID={player_id}, name={player_name}")
 
     # Get current gameweek
-    current_gw_info = get_current_gameweek_resource()
+    current_gw_info = await get_current_gameweek_resource()
     current_gw = current_gw_info.get("id", 1)
 
     # Find player by ID or name
     player = None
     if player_id is not None:
-        player = get_player_by_id(player_id)
+        player = await get_player_by_id(player_id)
     elif player_name:
-        matches = find_players_by_name(player_name)
+        matches = await find_players_by_name(player_name)
         if matches:
             player = matches[0]
             player_id = player.get("id")
@@ -713,7 +407,7 @@ def get_player_info(
         player_id_value = player.get("id")
         if player_id_value is not None:
             gw_count = max(1, end_gameweek - start_gameweek + 1)
-            gameweek_history = get_player_gameweek_history([player_id_value], gw_count)
+            gameweek_history = await get_player_gameweek_history([player_id_value], gw_count)
         else:
             gameweek_history = None
 
@@ -779,7 +473,7 @@ def get_player_info(
 
     # Include upcoming fixtures if requested
     if include_fixtures and player_id is not None:
-        fixtures_data = get_player_fixtures(player_id, 5)  # Next 5 fixtures
+        fixtures_data = await get_player_fixtures(player_id, 5)  # Next 5 fixtures
 
         if fixtures_data:
             result["upcoming_fixtures"] = fixtures_data
@@ -813,7 +507,7 @@ def get_player_info(
     return result
 
 
-def search_players(query: str, position: str | None = None, team: str | None = None, limit: int = 5) -> dict[str, Any]:
+async def search_players(query: str, position: str | None = None, team: str | None = None, limit: int = 5) -> dict[str, Any]:
     """
     Search for players by name with optional filtering by position and team.
 
@@ -830,7 +524,7 @@ def search_players(query: str, position: str | None = None, team: str | None = N
     logger.info(f"Searching players: query={query}, position={position}, team={team}")
 
     # Find players by name
-    matches = find_players_by_name(query, limit=limit * 2)  # Get more than needed for filtering
+    matches = await find_players_by_name(query, limit=limit * 2)  # Get more than needed for filtering
 
     # Apply position filter if specified
     if position and matches:
@@ -854,7 +548,7 @@ def search_players(query: str, position: str | None = None, team: str | None = N
     }
 
 
-def get_teams_resource() -> list[dict[str, Any]]:
+async def get_teams_resource() -> list[dict[str, Any]]:
     """
     Format teams data for the MCP resource.
 
@@ -862,7 +556,7 @@ def get_teams_resource() -> list[dict[str, Any]]:
         Formatted teams data
     """
     # Get raw data from API
-    data = api.get_bootstrap_static()
+    data = await async_api.get_bootstrap_static()
 
     # Format team data
     teams = []
@@ -892,7 +586,7 @@ def get_teams_resource() -> list[dict[str, Any]]:
     return teams
 
 
-def get_team_by_name(name: str) -> dict[str, Any] | None:
+async def get_team_by_name(name: str) -> dict[str, Any] | None:
     """
     Get team data by name (full or partial match).
 
@@ -902,7 +596,7 @@ def get_team_by_name(name: str) -> dict[str, Any] | None:
     Returns:
         Team data or None if not found
     """
-    teams = get_teams_resource()
+    teams = await get_teams_resource()
     name_lower = name.lower()
 
     # Try exact match first
@@ -1,5 +1,42 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import aclosing
 from typing import Any
 
+import numpy as np
+
+# Maximum number of managers analysed by the league pipeline (standings pages hold 50 each)
+MAX_LEAGUE_TEAMS = 500
+
+
+def _parse_league_info(data: dict[str, Any]) -> dict[str, Any]:
+    """Parse the league header of a standings response"""
+    league = data.get("league", {})
+    return {
+        "id": league.get("id"),
+        "name": league.get("name"),
+        "created": league.get("created"),
+        "type": "Public" if league.get("league_type") == "s" else "Private",
+        "scoring": "Classic" if league.get("scoring") == "c" else "Head-to-Head",
+        "admin_entry": league.get("admin_entry"),
+        "start_event": league.get("start_event"),
+    }
+
+
+def _parse_standing(standing: dict[str, Any]) -> dict[str, Any]:
+    """Parse a single standings row"""
+    return {
+        "id": standing.get("id"),
+        "team_id": standing.get("entry"),
+        "team_name": standing.get("entry_name"),
+        "manager_name": standing.get("player_name"),
+        "rank": standing.get("rank"),
+        "last_rank": standing.get("last_rank"),
+        "rank_change": standing.get("last_rank", 0) - standing.get("rank", 0) if standing.get("last_rank") and standing.get("rank") else 0,
+        "total_points": standing.get("total"),
+        "event_total": standing.get("event_total"),
+    }
+
 
 def parse_league_standings(data: dict[str, Any]) -> dict[str, Any]:
     """
@@ -16,15 +53,7 @@ def parse_league_standings(data: dict[str, Any]) -> dict[str, Any]:
         return data
 
     # Parse league info
-    league_info = {
-        "id": data.get("league", {}).get("id"),
-        "name": data.get("league", {}).get("name"),
-        "created": data.get("league", {}).get("created"),
-        "type": "Public" if data.get("league", {}).get("league_type") == "s" else "Private",
-        "scoring": "Classic" if data.get("league", {}).get("scoring") == "c" else "Head-to-Head",
-        "admin_entry": data.get("league", {}).get("admin_entry"),
-        "start_event": data.get("league", {}).get("start_event"),
-    }
+    league_info = _parse_league_info(data)
 
     # Parse standings
     standings = data.get("standings", {}).get("results", [])
@@ -33,22 +62,7 @@ def parse_league_standings(data: dict[str, Any]) -> dict[str, Any]:
     total_count = len(standings)
 
     # Format standings
-    formatted_standings = []
-    for standing in standings:
-        team = {
-            "id": standing.get("id"),
-            "team_id": standing.get("entry"),
-            "team_name": standing.get("entry_name"),
-            "manager_name": standing.get("player_name"),
-            "rank": standing.get("rank"),
-            "last_rank": standing.get("last_rank"),
-            "rank_change": standing.get("last_rank", 0) - standing.get("rank", 0)
-            if standing.get("last_rank") and standing.get("rank")
-            else 0,
-            "total_points": standing.get("total"),
-            "event_total": standing.get("event_total"),
-        }
-        formatted_standings.append(team)
+    formatted_standings = [_parse_standing(standing) for standing in standings]
 
     response = {
         "league_info": league_info,
@@ -62,50 +76,46 @@ def parse_league_standings(data: dict[str, Any]) -> dict[str, Any]:
     return response
 
 
-def get_teams_historical_data(team_ids: list[int], api, start_gw: int | None = None, end_gw: int | None = None) -> dict[str, Any]:
-    """Get historical data for multiple teams"""
-    results = {}
-    errors = {}
+async def _resolve_gameweek_range(api, start_gw: int | str | None = None, end_gw: int | str | None = None) -> tuple[int, int]:
+    """Resolve a gameweek range given as numbers or 'current'/'current-N' into numbers"""
+    if end_gw is None or end_gw == "current":
+        current_gw_data = await api.get_current_gameweek()
+        current_gw = current_gw_data.get("id", 38)
+        end_gw = current_gw
+    elif isinstance(end_gw, str) and end_gw.startswith("current-"):
+        current_gw_data = await api.get_current_gameweek()
+        current_gw = current_gw_data.get("id", 38)
+        offset = int(end_gw.split("-")[1])
+        end_gw = max(1, current_gw - offset)
 
-    # Validate and process gameweek range
-    try:
-        if end_gw is None or end_gw == "current":
-            current_gw_data = api.get_current_gameweek()
-            current_gw = current_gw_data.get("id", 38)
-            end_gw = current_gw
-        elif isinstance(end_gw, str) and end_gw.startswith("current-"):
-            current_gw_data = api.get_current_gameweek()
-            current_gw = current_gw_data.get("id", 38)
-            offset = int(end_gw.split("-")[1])
-            end_gw = max(1, current_gw - offset)
-
-        if start_gw is None:
-            start_gw = 1
-        elif isinstance(start_gw, str) and start_gw.startswith("current-"):
-            current_gw_data = api.get_current_gameweek()
-            current_gw = current_gw_data.get("id", 38)
-            offset = int(start_gw.split("-")[1])
-            start_gw = max(1, current_gw - offset)
-
-        start_gw = int(start_gw) if start_gw is not None else 1
-        end_gw = int(end_gw) if end_gw is not None else 38
-
-        start_gw = max(start_gw, 1)
-        end_gw = min(end_gw, 38)
-        if start_gw > end_gw:
-            start_gw, end_gw = end_gw, start_gw
+    if start_gw is None:
+        start_gw = 1
+    elif isinstance(start_gw, str) and start_gw.startswith("current-"):
+        current_gw_data = await api.get_current_gameweek()
+        current_gw = current_gw_data.get("id", 38)
+        offset = int(start_gw.split("-")[1])
+        start_gw = max(1, current_gw - offset)
 
-    except Exception as e:
-        return {
-            "error": f"Invalid gameweek range: {str(e)}",
-            "suggestion": "Use numeric values or 'current'/'current-N' format",
-        }
+    start_gw = int(start_gw) if start_gw is not None else 1
+    end_gw = int(end_gw) if end_gw is not None else 38
 
-    # Get history data for each team
-    for team_id in team_ids:
+    start_gw = max(start_gw, 1)
+    end_gw = min(end_gw, 38)
+    if start_gw > end_gw:
+        start_gw, end_gw = end_gw, start_gw
+
+    return start_gw, end_gw
+
+
+def _filter_histories(histories: dict[int, Any], start_gw: int, end_gw: int) -> tuple[dict[int, Any], dict[int, str]]:
+    """Restrict fetched entry histories to a gameweek range, separating out failures"""
+    results = {}
+    errors = {}
+
+    for team_id, history_data in histories.items():
         try:
-            # Use the API class to make the request
-            history_data = api._make_request(f"entry/{team_id}/history/")
+            if isinstance(history_data, Exception):
+                raise history_data
 
             if "current" in history_data:
                 current = [gw for gw in history_data["current"] if start_gw <= gw.get("event", 0) <= end_gw]
@@ -123,6 +133,24 @@ def get_teams_historical_data(team_ids: list[int], api, start_gw: int | None = N
         except Exception as e:
             errors[team_id] = str(e)
 
+    return results, errors
+
+
+async def get_teams_historical_data(team_ids: list[int], api, start_gw: int | None = None, end_gw: int | None = None) -> dict[str, Any]:
+    """Get historical data for multiple teams, fetched concurrently through an ``AsyncFPLAPI``"""
+    # Validate and process gameweek range
+    try:
+        start_gw, end_gw = await _resolve_gameweek_range(api, start_gw, end_gw)
+    except Exception as e:
+        return {
+            "error": f"Invalid gameweek range: {str(e)}",
+            "suggestion": "Use numeric values or 'current'/'current-N' format",
+        }
+
+    # Get history data for all teams concurrently
+    histories = await api.get_entry_histories(team_ids)
+    results, errors = _filter_histories(histories, start_gw, end_gw)
+
     return {
         "teams_data": results,
         "errors": errors,
@@ -131,186 +159,180 @@ def get_teams_historical_data(team_ids: list[int], api, start_gw: int | None = N
     }
 
 
-def _get_league_standings(league_id: int, api) -> dict[str, Any]:
+async def _get_league_standings(league_id: int, api) -> dict[str, Any]:
     """Get standings for a specified FPL league"""
     try:
-        # Use the API class to make the request
-        data = api._make_request(f"leagues-classic/{league_id}/standings/")
+        data = await api.get_league_standings(league_id)
     except Exception as e:
         return {"error": f"API request failed: {str(e)}"}
 
-    # Import parse_league_standings from the user's api.py or define a simple version here
-    # For now, we'll define a simple version
-    if "error" in data:
-        return data
+    return parse_league_standings(data)
 
-    league_info = {
-        "id": data.get("league", {}).get("id"),
-        "name": data.get("league", {}).get("name"),
-        "created": data.get("league", {}).get("created"),
-        "type": "Public" if data.get("league", {}).get("league_type") == "s" else "Private",
-        "scoring": "Classic" if data.get("league", {}).get("scoring") == "c" else "Head-to-Head",
-        "admin_entry": data.get("league", {}).get("admin_entry"),
-        "start_event": data.get("league", {}).get("start_event"),
-    }
 
-    standings = data.get("standings", {}).get("results", [])
-    total_count = len(standings)
+async def _stream_league(
+    league_id: int,
+    api,
+    fetch: Callable[[list[int]], Awaitable[dict[int, Any]]],
+    max_teams: int = MAX_LEAGUE_TEAMS,
+) -> dict[str, Any]:
+    """
+    Stream a league's standings pages and fetch per-team data as each page arrives.
 
-    formatted_standings = []
-    for standing in standings:
-        team = {
-            "id": standing.get("id"),
-            "team_id": standing.get("entry"),
-            "team_name": standing.get("entry_name"),
-            "manager_name": standing.get("player_name"),
-            "rank": standing.get("rank"),
-            "last_rank": standing.get("last_rank"),
-            "rank_change": standing.get("last_rank", 0) - standing.get("rank", 0)
-            if standing.get("last_rank") and standing.get("rank")
-            else 0,
-            "total_points": standing.get("total"),
-            "event_total": standing.get("event_total"),
-        }
-        formatted_standings.append(team)
+    Each page's teams are handed to ``fetch`` straight away, so the requests for
+    one page overlap with downloading the next; the API client bounds how many
+    requests are in flight overall.
 
-    response_data = {
-        "league_info": league_info,
-        "standings": formatted_standings[:25],
-        "total_teams": total_count,
-    }
+    Args:
+        league_id: ID of the league
+        api: ``AsyncFPLAPI`` instance
+        fetch: Coroutine function mapping team IDs to fetched data (or exceptions)
+        max_teams: Maximum number of teams to include, in rank order
 
-    if len(formatted_standings) > 25:
-        response_data["disclaimers"] = ["Limited to top 25 teams"]
+    Returns:
+        League info, standings for every included team, fetched data keyed by team
+        ID and the number of teams left out, or an error
+    """
+    league_info = None
+    standings = []
+    tasks = []
+    truncated = False
 
-    return response_data
+    try:
+        async with aclosing(api.iter_league_standings(league_id)) as pages:
+            async for page in pages:
+                if league_info is None:
+                    league_info = _parse_league_info(page)
+
+                rows = [_parse_standing(s) for s in page.get("standings", {}).get("results", [])]
+                room = max_teams - len(standings)
+                if len(rows) > room or (len(rows) == room and page.get("standings", {}).get("has_next")):
+                    truncated = True
+                rows = rows[:room]
+
+                standings.extend(rows)
+                if rows:
+                    tasks.append(asyncio.create_task(fetch([row["team_id"] for row in rows])))
+                if truncated:
+                    break
+    except Exception as e:
+        for task in tasks:
+            task.cancel()
+        return {"error": f"API request failed: {str(e)}"}
+
+    team_data = {}
+    for page_data in await asyncio.gather(*tasks):
+        team_data.update(page_data)
+
+    return {
+        "league_info": league_info or {},
+        "standings": standings,
+        "team_data": team_data,
+        "truncated": truncated,
+    }
 
 
-def _get_league_historical_performance(
+async def _get_league_historical_performance(
     league_id: int,
     api,  # noqa: F821
     start_gw: int | None = None,
     end_gw: int | None = None,
+    max_teams: int = MAX_LEAGUE_TEAMS,
 ) -> dict[str, Any]:
     """Get historical performance data for teams in a league"""
-    league_data = _get_league_standings(league_id, api)
+    try:
+        start_gw, end_gw = await _resolve_gameweek_range(api, start_gw, end_gw)
+    except Exception as e:
+        return {
+            "error": f"Invalid gameweek range: {str(e)}",
+            "suggestion": "Use numeric values or 'current'/'current-N' format",
+        }
+
+    league_data = await _stream_league(league_id, api, api.get_entry_histories, max_teams)
 
     if "error" in league_data:
         return league_data
 
-    if "standings" in league_data and len(league_data["standings"]) > 25:
-        league_data["standings"] = league_data["standings"][:25]
-        league_data["limited_to_top"] = 25
+    standings = league_data["standings"]
+    teams_data, errors = _filter_histories(league_data["team_data"], start_gw, end_gw)
 
-    team_ids = [team["team_id"] for team in league_data["standings"]]
-
-    historical_data = get_teams_historical_data(team_ids, api, start_gw, end_gw)
+    gameweeks = list(range(start_gw, end_gw + 1))
+    teams = [team for team in standings if team["team_id"] in teams_data]
 
-    if "error" in historical_data:
-        return historical_data
+    # Team x gameweek matrices, filled by indexing each history by event id
+    shape = (len(teams), len(gameweeks))
+    points = np.zeros(shape, dtype=np.int64)
+    ranks = np.zeros(shape, dtype=np.int64)
+    values = np.zeros(shape, dtype=np.float64)
 
-    teams_data = historical_data["teams_data"]
-    gameweek_range = historical_data["gameweek_range"]
-
-    gameweeks = list(range(gameweek_range["start"], gameweek_range["end"] + 1))
+    for row, team in enumerate(teams):
+        for gw_data in teams_data[team["team_id"]].get("current", []):
+            column = gw_data.get("event", 0) - start_gw
+            if not 0 <= column < len(gameweeks):
+                continue
+            points[row, column] = gw_data.get("points", 0) or 0
+            ranks[row, column] = gw_data.get("overall_rank", 0) or 0
+            values[row, column] = gw_data.get("value", 0) / 10.0 if gw_data.get("value") else 0
+
+    # Population variance of each team's overall rank, ignoring gameweeks without one
+    valid = ranks > 0
+    valid_counts = valid.sum(axis=1)
+    safe_counts = np.maximum(valid_counts, 1)
+    mean_ranks = np.where(valid, ranks, 0).sum(axis=1) / safe_counts
+    rank_variance = np.where(valid, (ranks - mean_ranks[:, None]) ** 2, 0).sum(axis=1) / safe_counts
+    consistency = 10.0 - np.minimum(10.0, (rank_variance / 1000000) * 10)
 
     series = []
-    for team in league_data["standings"]:
-        team_id = team["team_id"]
-
-        if team_id not in teams_data:
-            continue
-
-        current = teams_data[team_id].get("current", [])
-
-        points_series = []
-        rank_series = []
-        value_series = []
-
-        for gw in gameweeks:
-            gw_data = next((g for g in current if g.get("event") == gw), None)
-
-            if gw_data:
-                points_series.append(gw_data.get("points", 0))
-                rank_series.append(gw_data.get("overall_rank", 0))
-                value_series.append(gw_data.get("value", 0) / 10.0 if gw_data.get("value") else 0)
-            else:
-                points_series.append(0)
-                rank_series.append(0)
-                value_series.append(0)
-
+    for row, team in enumerate(teams):
         series.append(
             {
-                "team_id": team_id,
+                "team_id": team["team_id"],
                 "name": team["team_name"],
                 "manager": team["manager_name"],
-                "points_series": points_series,
-                "rank_series": rank_series,
-                "value_series": value_series,
+                "points_series": points[row].tolist(),
+                "rank_series": ranks[row].tolist(),
+                "value_series": [value if value else 0 for value in values[row].tolist()],
                 "current_rank": team["rank"],
                 "total_points": team["total_points"],
+                "consistency_score": round(float(consistency[row]), 1) if valid_counts[row] else 0,
             }
         )
 
+    # Highest scorer per gameweek; the first team in standings order wins ties
     gameweek_winners = {}
-    for gw_index, gw in enumerate(gameweeks):
-        max_points = 0
-        winner = None
-
-        for team in series:
-            points = team["points_series"][gw_index]
-            if points > max_points:
-                max_points = points
-                winner = {
-                    "team_id": team["team_id"],
-                    "name": team["name"],
-                    "points": points,
+    if teams:
+        winners = points.argmax(axis=0)
+        for column, gw in enumerate(gameweeks):
+            row = winners[column]
+            if points[row, column] > 0:
+                gameweek_winners[str(gw)] = {
+                    "team_id": teams[row]["team_id"],
+                    "name": teams[row]["team_name"],
+                    "points": int(points[row, column]),
                 }
 
-        if winner:
-            gameweek_winners[str(gw)] = winner
-
-    for team in series:
-        rank_variance = 0
-        valid_ranks = [r for r in team["rank_series"] if r > 0]
-
-        if valid_ranks:
-            mean_rank = sum(valid_ranks) / len(valid_ranks)
-            rank_variance = sum((r - mean_rank) ** 2 for r in valid_ranks) / len(valid_ranks)
-            consistency_score = 10.0 - min(10.0, (rank_variance / 1000000) * 10)
-            team["consistency_score"] = round(consistency_score, 1)
-        else:
-            team["consistency_score"] = 0
-
-    return {
+    result = {
         "league_info": league_data["league_info"],
         "gameweeks": gameweeks,
         "teams": series,
         "gameweek_winners": gameweek_winners,
-        "errors": historical_data["errors"],
-        "success_rate": historical_data["success_rate"],
+        "errors": errors,
+        "success_rate": len(teams_data) / len(standings) if standings else 0,
     }
+    if league_data["truncated"]:
+        result["limited_to_top"] = max_teams
+
+    return result
 
 
-def _get_league_team_composition(
+async def _get_league_team_composition(
     league_id: int,
     api,  # noqa: F821
     gameweek: int | None = None,
+    max_teams: int = MAX_LEAGUE_TEAMS,
 ) -> dict[str, Any]:
     """Get team composition analysis for a league"""
-    league_data = _get_league_standings(league_id, api)
-
-    if "error" in league_data:
-        return league_data
-
-    if "standings" in league_data and len(league_data["standings"]) > 25:
-        league_data["standings"] = league_data["standings"][:25]
-        league_data["limited_to_top"] = 25
-
-    team_ids = [team["team_id"] for team in league_data["standings"]]
-
     if gameweek is None:
-        current_gw_data = api.get_current_gameweek()
+        current_gw_data = await api.get_current_gameweek()
         gameweek = current_gw_data.get("id", 1)
 
     try:
@@ -318,7 +340,18 @@ def _get_league_team_composition(
     except (ValueError, TypeError):
         return {"error": f"Invalid gameweek value: {gameweek}"}
 
-    static_data = api.get_bootstrap_static()
+    async def fetch_picks(team_ids: list[int]) -> dict[int, Any]:
+        return await api.get_entries_picks(team_ids, gameweek)
+
+    league_data = await _stream_league(league_id, api, fetch_picks, max_teams)
+
+    if "error" in league_data:
+        return league_data
+
+    team_ids = [team["team_id"] for team in league_data["standings"]]
+    standings_by_team = {team["team_id"]: team for team in league_data["standings"]}
+
+    static_data = await api.get_bootstrap_static()
     all_players = static_data.get("elements", [])
 
     teams_map = {t["id"]: t for t in static_data.get("teams", [])}
@@ -342,14 +375,12 @@ def _get_league_team_composition(
     errors = {}
 
     for team_id in team_ids:
-        try:
-            # Use the API class to make the request
-            picks_data = api._make_request(f"entry/{team_id}/event/{gameweek}/picks/")
+        picks_data = league_data["team_data"].get(team_id)
+        if isinstance(picks_data, Exception):
+            errors[team_id] = str(picks_data)
+        else:
             teams_data[team_id] = picks_data
 
-        except Exception as e:
-            errors[team_id] = str(e)
-
     if not teams_data:
         return {
             "error": "Failed to retrieve team data for any teams in the league",
@@ -363,7 +394,7 @@ def _get_league_team_composition(
     team_values = {}
 
     for team_id, team_data in teams_data.items():
-        team_info = next((t for t in league_data["standings"] if t["team_id"] == team_id), None)
+        team_info = standings_by_team.get(team_id)
         if not team_info:
             continue
 
@@ -486,7 +517,7 @@ def _get_league_team_composition(
 
     PLAYER_LIMIT = 25
 
-    return {
+    result = {
         "league_info": league_data["league_info"],
         "gameweek": gameweek,
         "teams_analyzed": team_count,
@@ -500,3 +531,7 @@ def _get_league_team_composition(
         "errors": errors,
         "success_rate": len(teams_data) / len(team_ids) if team_ids else 0,
     }
+    if league_data["truncated"]:
+        result["limited_to_top"] = max_teams
+
+    return result
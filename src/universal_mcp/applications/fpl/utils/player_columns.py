@@ -0,0 +1,202 @@
+"""Columnar (NumPy) view of the FPL player database used by player screening."""
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+# Fields sorted numerically by screen_players; anything else sorts on the raw value
+NUMERIC_SORT_FIELDS = ("points", "price", "form", "selected_by_percent", "value")
+
+
+def _parse_floats(values: Sequence[Any], strip_percent: bool = False) -> np.ndarray:
+    """Convert raw values to floats, using NaN where a value cannot be parsed."""
+    parsed = np.empty(len(values), dtype=np.float64)
+    for i, value in enumerate(values):
+        try:
+            parsed[i] = float(value.replace("%", "") if strip_percent else value)
+        except (AttributeError, ValueError, TypeError):
+            parsed[i] = np.nan
+    return parsed
+
+
+def _first_seen_counts(codes: np.ndarray, labels: Sequence[Any]) -> list[tuple[Any, int]]:
+    """Count category codes, returning (label, count) pairs in order of first appearance."""
+    if codes.size == 0:
+        return []
+    unique, first_index, counts = np.unique(codes, return_index=True, return_counts=True)
+    order = np.argsort(first_index, kind="stable")
+    return [(labels[unique[i]], int(counts[i])) for i in order]
+
+
+class PlayerColumns:
+    """
+    Typed column arrays over a list of formatted players.
+
+    Built once per player index; filtering produces boolean masks, sorting uses a
+    stable argsort, and summary statistics are array reductions. Results match the
+    row-by-row semantics of the original screening loop, including skipping
+    ownership/form filters for values that cannot be parsed.
+    """
+
+    def __init__(self, players: Sequence[dict[str, Any]]):
+        """
+        Args:
+            players: Formatted players, as produced by the player index
+        """
+        self.players = players
+
+        # Prices are tenths of a million; keep the integer cost so sums are exact
+        self.cost = np.array([round(p.get("price", 0) * 10) for p in players], dtype=np.int64)
+        self.price = self.cost / 10.0
+        self.points = np.array([p.get("points", 0) for p in players], dtype=np.int64)
+        self.ownership = _parse_floats([p.get("selected_by_percent", 0) for p in players], strip_percent=True)
+        self.form = _parse_floats([p.get("form", 0) for p in players])
+
+        positions = [p.get("position") for p in players]
+        self.position_labels: list[Any] = list(dict.fromkeys(positions))
+        position_codes = {label: code for code, label in enumerate(self.position_labels)}
+        self.position_codes = np.array([position_codes[p] for p in positions], dtype=np.int16)
+
+        teams = [(p.get("team", ""), p.get("team_short", "")) for p in players]
+        self.team_labels: list[tuple[str, str]] = list(dict.fromkeys(teams))
+        team_codes = {label: code for code, label in enumerate(self.team_labels)}
+        self.team_codes = np.array([team_codes[t] for t in teams], dtype=np.int16)
+        self.team_names: list[str] = list(dict.fromkeys(name for name, _ in teams))
+        team_name_codes = {name: code for code, name in enumerate(self.team_names)}
+        self.team_name_codes = np.array([team_name_codes[name] for name, _ in teams], dtype=np.int16)
+
+        self._sort_keys: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def filter(
+        self,
+        position: str | None = None,
+        team: str | None = None,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        min_points: int | None = None,
+        min_ownership: float | None = None,
+        max_ownership: float | None = None,
+        form_threshold: float | None = None,
+    ) -> np.ndarray:
+        """
+        Get the indices of players matching every given criterion, in index order.
+
+        Args:
+            position: Normalized position code (GKP, DEF, MID, FWD)
+            team: Case-insensitive partial match on team name or short name
+            min_price: Minimum player price in millions
+            max_price: Maximum player price in millions
+            min_points: Minimum total points
+            min_ownership: Minimum ownership percentage
+            max_ownership: Maximum ownership percentage
+            form_threshold: Minimum form rating
+
+        Returns:
+            Array of matching player positions
+        """
+        mask = np.ones(len(self.players), dtype=bool)
+
+        if position:
+            if position not in self.position_labels:
+                return np.empty(0, dtype=np.intp)
+            mask &= self.position_codes == self.position_labels.index(position)
+        if team:
+            team_lower = team.lower()
+            matching = [
+                code for code, (name, short) in enumerate(self.team_labels) if team_lower in name.lower() or team_lower in short.lower()
+            ]
+            mask &= np.isin(self.team_codes, matching)
+        if min_price is not None:
+            mask &= self.price >= min_price
+        if max_price is not None:
+            mask &= self.price <= max_price
+        if min_points is not None:
+            mask &= self.points >= min_points
+        # Comparisons against NaN are False, so unparsable values are never excluded
+        if min_ownership is not None:
+            mask &= ~(self.ownership < min_ownership)
+        if max_ownership is not None:
+            mask &= ~(self.ownership > max_ownership)
+        if form_threshold is not None:
+            mask &= ~(self.form < form_threshold)
+
+        return np.flatnonzero(mask)
+
+    def _sort_key(self, field: str) -> np.ndarray:
+        """
+        Numeric sort key for a field, cached per column.
+
+        Missing values sort as 0; values that cannot be parsed are NaN.
+        """
+        if field not in self._sort_keys:
+            raw = [p.get(field) for p in self.players]
+            key = _parse_floats([0 if value is None else value for value in raw])
+            self._sort_keys[field] = key
+        return self._sort_keys[field]
+
+    def sort(self, indices: np.ndarray, sort_by: str, descending: bool = True) -> np.ndarray | None:
+        """
+        Order player positions by a numeric field with a stable argsort.
+
+        Args:
+            indices: Player positions to order
+            sort_by: Field to sort by, one of ``NUMERIC_SORT_FIELDS``
+            descending: Sort highest first
+
+        Returns:
+            Ordered positions, sorted by points (descending) if any value of the
+            field cannot be parsed, or None if the field is not numeric
+        """
+        if sort_by not in NUMERIC_SORT_FIELDS:
+            return None
+
+        key = self._sort_key(sort_by)[indices]
+        if np.isnan(key).any():
+            key, descending = self.points[indices].astype(np.float64), True
+
+        order = np.argsort(-key if descending else key, kind="stable")
+        return indices[order]
+
+    def screen(self, sort_by: str = "total_points", descending: bool = True, **filters: Any) -> np.ndarray:
+        """
+        Filter and sort players in one call.
+
+        Args:
+            sort_by: Field to sort by; non-numeric fields sort on the raw player value
+            descending: Sort highest first
+            **filters: Criteria accepted by ``filter``
+
+        Returns:
+            Ordered positions of the matching players
+        """
+        indices = self.filter(**filters)
+        ordered = self.sort(indices, sort_by, descending)
+        if ordered is None:
+            ordered = np.array(
+                sorted(indices.tolist(), key=lambda i: self.players[i].get(sort_by, ""), reverse=descending),
+                dtype=np.intp,
+            )
+        return ordered
+
+    def summarize(self, indices: np.ndarray) -> dict[str, Any]:
+        """
+        Summary statistics for a set of players, in the order given.
+
+        Args:
+            indices: Player positions (already sorted)
+
+        Returns:
+            Average points and price, position distribution and top-10 team distribution
+        """
+        total = max(1, len(indices))
+        team_counts = _first_seen_counts(self.team_name_codes[indices], self.team_names)
+        return {
+            "average_points": round(int(self.points[indices].sum()) / total, 1),
+            "average_price": round(int(self.cost[indices].sum()) / 10.0 / total, 2),
+            "position_distribution": dict(_first_seen_counts(self.position_codes[indices], self.position_labels)),
+            "team_distribution": dict(sorted(team_counts, key=lambda x: x[1], reverse=True)[:10]),
+        }
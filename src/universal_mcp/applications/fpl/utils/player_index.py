@@ -0,0 +1,370 @@
+"""In-memory index over the FPL player database, rebuilt once per bootstrap snapshot."""
+
+import logging
+import threading
+import unicodedata
+from collections import defaultdict
+from functools import cached_property
+from typing import Any
+
+from .api import async_api
+from .player_columns import PlayerColumns
+
+logger = logging.getLogger(__name__)
+
+# Common nickname and abbreviation mapping
+NICKNAMES = {
+    "kdb": "kevin de bruyne",
+    "vvd": "virgil van dijk",
+    "taa": "trent alexander-arnold",
+    "cr7": "cristiano ronaldo",
+    "bobby": "roberto firmino",
+    "mo salah": "mohamed salah",
+    "mane": "sadio mane",
+    "auba": "aubameyang",
+    "lewa": "lewandowski",
+    "kane": "harry kane",
+    "rashford": "marcus rashford",
+    "son": "heung-min son",
+}
+
+# Minimum trigram similarity for fuzzy (misspelled) name matches
+FUZZY_THRESHOLD = 0.3
+
+
+def _fold(text: str) -> str:
+    """Lowercase and strip accents, e.g. "Gyökeres" -> "gyokeres"."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _substring_trigrams(text: str) -> set[str]:
+    """Trigrams every string containing ``text`` must also contain."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _word_trigrams(word: str) -> set[str]:
+    """Padded trigrams of a single word, used for similarity scoring."""
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _format_player(player: dict[str, Any], team: dict[str, Any], position: dict[str, Any]) -> dict[str, Any]:
+    """Build the comprehensive player object exposed by the FPL tools."""
+    return {
+        "id": player["id"],
+        "name": f"{player['first_name']} {player['second_name']}",
+        "web_name": player["web_name"],
+        "team": team.get("name", "Unknown"),
+        "team_short": team.get("short_name", "UNK"),
+        "position": position.get("singular_name_short", "UNK"),
+        "price": player["now_cost"] / 10.0,
+        "form": player["form"],
+        "points": player["total_points"],
+        "points_per_game": player["points_per_game"],
+        # Playing time
+        "minutes": player["minutes"],
+        "starts": player["starts"],
+        # Key stats
+        "goals": player["goals_scored"],
+        "assists": player["assists"],
+        "clean_sheets": player["clean_sheets"],
+        "goals_conceded": player["goals_conceded"],
+        "own_goals": player["own_goals"],
+        "penalties_saved": player["penalties_saved"],
+        "penalties_missed": player["penalties_missed"],
+        "yellow_cards": player["yellow_cards"],
+        "red_cards": player["red_cards"],
+        "saves": player["saves"],
+        "bonus": player["bonus"],
+        "bps": player["bps"],
+        # Advanced metrics
+        "influence": player["influence"],
+        "creativity": player["creativity"],
+        "threat": player["threat"],
+        "ict_index": player["ict_index"],
+        # Expected stats (if available)
+        "expected_goals": player.get("expected_goals", "N/A"),
+        "expected_assists": player.get("expected_assists", "N/A"),
+        "expected_goal_involvements": player.get("expected_goal_involvements", "N/A"),
+        "expected_goals_conceded": player.get("expected_goals_conceded", "N/A"),
+        # Ownership & transfers
+        "selected_by_percent": player["selected_by_percent"],
+        "transfers_in_event": player["transfers_in_event"],
+        "transfers_out_event": player["transfers_out_event"],
+        # Price changes
+        "cost_change_event": player["cost_change_event"] / 10.0,
+        "cost_change_start": player["cost_change_start"] / 10.0,
+        # Status info
+        "status": player["status"],
+        "news": player["news"],
+        "chance_of_playing_next_round": player["chance_of_playing_next_round"],
+    }
+
+
+class PlayerIndex:
+    """
+    Formatted players plus lookup tables for one bootstrap-static snapshot.
+
+    Holds id/team/position hash maps, a precomputed table of lowercased name parts
+    and initials, and trigram indexes used to narrow name searches to plausible
+    candidates and to match partial or misspelled names. Player dicts are shared;
+    callers that modify them should copy first.
+    """
+
+    def __init__(self, bootstrap: dict[str, Any]):
+        """
+        Args:
+            bootstrap: Raw bootstrap-static payload
+        """
+        self.source = bootstrap
+        self.teams: dict[int, dict[str, Any]] = {t["id"]: t for t in bootstrap.get("teams", [])}
+        self.positions: dict[int, dict[str, Any]] = {p["id"]: p for p in bootstrap.get("element_types", [])}
+
+        self.players: list[dict[str, Any]] = []
+        self.by_id: dict[int, dict[str, Any]] = {}
+        self.by_team: dict[int, list[dict[str, Any]]] = defaultdict(list)
+        self.by_position: dict[str, list[dict[str, Any]]] = defaultdict(list)
+
+        # Per-player name features, aligned with self.players
+        self._full_names: list[str] = []
+        self._web_names: list[str] = []
+        self._first_names: list[str] = []
+        self._last_names: list[str] = []
+        self._combined_names: list[str] = []
+        self._points: list[float] = []
+        self._by_initials: dict[str, set[int]] = defaultdict(set)
+
+        # Substring trigram -> player positions, over full, web and space-free names
+        self._substring_index: dict[str, set[int]] = defaultdict(set)
+        # Word -> player positions, and padded trigram -> words, for fuzzy matching
+        self._word_players: dict[str, set[int]] = defaultdict(set)
+        self._word_trigrams: dict[str, set[str]] = {}
+        self._trigram_words: dict[str, set[str]] = defaultdict(set)
+
+        for raw in bootstrap.get("elements", []):
+            self._add(raw)
+
+        logger.info(f"Indexed {len(self.players)} players")
+
+    def _add(self, raw: dict[str, Any]) -> None:
+        position = self.positions.get(raw["element_type"], {})
+        player = _format_player(raw, self.teams.get(raw["team"], {}), position)
+        index = len(self.players)
+
+        self.players.append(player)
+        self.by_id[player["id"]] = player
+        self.by_team[raw["team"]].append(player)
+        self.by_position[player["position"]].append(player)
+
+        full_name = player["name"].lower()
+        web_name = player.get("web_name", "").lower()
+        name_parts = full_name.split()
+        combined = "".join(name_parts)
+
+        self._full_names.append(full_name)
+        self._web_names.append(web_name)
+        self._first_names.append(name_parts[0] if name_parts else "")
+        self._last_names.append(name_parts[-1] if len(name_parts) > 1 else "")
+        self._combined_names.append(combined)
+        self._points.append(float(player["points"]))
+        self._by_initials["".join(part[0] for part in name_parts)].add(index)
+
+        for text in (full_name, web_name, combined):
+            for trigram in _substring_trigrams(text):
+                self._substring_index[trigram].add(index)
+
+        for word in {*full_name.split(), *web_name.split(), *_fold(full_name).split(), *_fold(web_name).split()}:
+            self._word_players[word].add(index)
+            if word not in self._word_trigrams:
+                trigrams = self._word_trigrams[word] = _word_trigrams(word)
+                for trigram in trigrams:
+                    self._trigram_words[trigram].add(word)
+
+    @cached_property
+    def columns(self) -> PlayerColumns:
+        """Typed column arrays over the indexed players, built on first use."""
+        return PlayerColumns(self.players)
+
+    def get_player(self, player_id: int) -> dict[str, Any] | None:
+        """Get a formatted player by FPL ID."""
+        return self.by_id.get(player_id)
+
+    def get_team_name(self, team_id: int | None) -> str:
+        """Get a team name by ID, or "Unknown team" if not found."""
+        return self.teams.get(team_id, {}).get("name", "Unknown team")
+
+    def _containing(self, text: str) -> set[int] | None:
+        """
+        Players whose full, web or space-free name may contain ``text``.
+
+        Returns None when ``text`` is too short to be narrowed by trigrams.
+        """
+        trigrams = _substring_trigrams(text)
+        if not trigrams:
+            return None
+        postings = sorted((self._substring_index.get(t, set()) for t in trigrams), key=len)
+        return set.intersection(*postings)
+
+    def _candidates(self, search_term: str, search_parts: list[str]) -> list[int]:
+        """Positions of every player that can score for ``search_term``, in index order."""
+        candidates = set(self._by_initials.get(search_term, ()))
+        for text in [*search_parts, search_term, "".join(search_parts)]:
+            matches = self._containing(text)
+            if matches is None:
+                return list(range(len(self.players)))
+            candidates |= matches
+        return sorted(candidates)
+
+    def find_by_name(self, name: str, limit: int = 5) -> list[dict[str, Any]]:
+        """
+        Find players by partial name match with advanced matching.
+
+        Scores exact, initials, multi-part and substring matches. If nothing matches,
+        falls back to trigram similarity so misspelled names still find players.
+
+        Args:
+            name: Player name to search for (supports partial names, nicknames, and initials)
+            limit: Maximum number of results to return
+
+        Returns:
+            List of matching players sorted by relevance and points
+        """
+        # Normalize search term
+        search_term = name.lower().strip()
+        if not search_term:
+            return []
+
+        # Check for nickname match
+        if search_term in NICKNAMES:
+            search_term = NICKNAMES[search_term]
+
+        # Split search term into parts for multi-part matching
+        search_parts = search_term.split()
+        single_part = len(search_parts) == 1
+        check_initials = len(search_term) <= 5 and all(c.isalpha() for c in search_term)
+        search_combined = "".join(search_parts)
+
+        scored_players = []
+        candidates = self._candidates(search_term, search_parts)
+
+        for i in candidates:
+            full_name = self._full_names[i]
+            web_name = self._web_names[i]
+            first_name = self._first_names[i]
+            last_name = self._last_names[i]
+
+            score = 0
+
+            # 1. Exact full name match
+            if search_term == full_name:
+                score += 100
+            # 2. Exact match on web_name (common name)
+            elif search_term == web_name:
+                score += 90
+            # 3. Exact match on last name
+            elif single_part and search_term == last_name:
+                score += 80
+            # 4. Exact match on first name
+            elif single_part and search_term == first_name:
+                score += 70
+
+            # 5. Initials match (e.g., "KDB")
+            if check_initials and i in self._by_initials.get(search_term, ()):
+                score += 85
+
+            # 6. Multi-part name matching (e.g., "Mo Salah")
+            if not single_part:
+                if search_parts[0] in first_name and search_parts[-1] in last_name:
+                    score += 75
+                if search_combined in self._combined_names[i]:
+                    score += 50
+
+            # 7. Substring matches
+            if search_term in full_name:
+                score += 40
+
+            # 8. Partial word matches in full name
+            for part in search_parts:
+                if part in full_name:
+                    score += 30
+
+            # 9. Partial word matches in web name
+            for part in search_parts:
+                if part in web_name:
+                    score += 25
+
+            if score > 0:
+                # 10. Bonus score for high-point players (tiebreaker), up to 20 extra points
+                scored_players.append((score + min(20, self._points[i] / 50), i))
+
+        sorted_positions = [i for _, i in sorted(scored_players, key=lambda x: x[0], reverse=True)]
+
+        # If no matches with good confidence, fall back to simple contains match
+        if not sorted_positions or scored_players[0][0] < 30:
+            seen = set(sorted_positions)
+            fallback = [i for i in candidates if search_term in self._full_names[i] or search_term in self._web_names[i]]
+            fallback.sort(key=lambda i: self._points[i], reverse=True)
+            sorted_positions.extend(i for i in fallback if i not in seen)
+
+        if not sorted_positions:
+            sorted_positions = self._fuzzy_match(search_term)
+
+        return [self.players[i] for i in sorted_positions[:limit]]
+
+    def _fuzzy_match(self, search_term: str) -> list[int]:
+        """
+        Rank players by trigram similarity of their name words to the search words.
+
+        Each search word is matched to the player's most similar name word; players
+        whose average similarity reaches ``FUZZY_THRESHOLD`` are returned, best first.
+        """
+        search_words = _fold(search_term).split()
+        best: dict[int, list[float]] = defaultdict(lambda: [0.0] * len(search_words))
+
+        for position, search_word in enumerate(search_words):
+            query = _word_trigrams(search_word)
+            shared: dict[str, int] = defaultdict(int)
+            for trigram in query:
+                for word in self._trigram_words.get(trigram, ()):
+                    shared[word] += 1
+
+            for word, count in shared.items():
+                similarity = count / (len(query) + len(self._word_trigrams[word]) - count)
+                if similarity < FUZZY_THRESHOLD:
+                    continue
+                for i in self._word_players[word]:
+                    scores = best[i]
+                    scores[position] = max(scores[position], similarity)
+
+        ranked = [(sum(scores) / len(scores), i) for i, scores in best.items()]
+        ranked = [(similarity, i) for similarity, i in ranked if similarity >= FUZZY_THRESHOLD]
+        ranked.sort(key=lambda x: (x[0], self._points[x[1]]), reverse=True)
+        return [i for _, i in ranked]
+
+
+class _LatestIndex:
+    """The index for the most recently seen bootstrap-static snapshot."""
+
+    def __init__(self):
+        self.index: PlayerIndex | None = None
+        self.lock = threading.Lock()
+
+    def for_snapshot(self, bootstrap: dict[str, Any]) -> PlayerIndex:
+        with self.lock:
+            if self.index is None or self.index.source is not bootstrap:
+                self.index = PlayerIndex(bootstrap)
+            return self.index
+
+
+_latest = _LatestIndex()
+
+
+async def get_player_index() -> PlayerIndex:
+    """
+    Get the player index for the current bootstrap-static snapshot.
+
+    The index is rebuilt only when the API client returns a new snapshot, so
+    repeated lookups within the cache TTL reuse the same tables.
+    """
+    return _latest.for_snapshot(await async_api.get_bootstrap_static())
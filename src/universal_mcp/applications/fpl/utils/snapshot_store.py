@@ -0,0 +1,215 @@
+"""On-disk snapshots of FPL API responses, shared between processes for warm starts."""
+
+import gzip
+import json
+import logging
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+BOOTSTRAP_ENDPOINT = "bootstrap-static/"
+
+# Endpoints persisted by default, matched on the first path segment
+DEFAULT_SNAPSHOT_ENDPOINTS = ("bootstrap-static", "fixtures", "element-summary")
+
+# How long snapshots stay valid while the current gameweek is still being played
+DEFAULT_LIVE_TTL = 600
+
+MANIFEST_FILE = "manifest.json"
+
+
+def _parse_deadline(deadline_time: str | None) -> float | None:
+    """Convert an FPL ``deadline_time`` (ISO 8601, UTC) to a Unix timestamp."""
+    if not deadline_time:
+        return None
+    try:
+        return datetime.fromisoformat(deadline_time).timestamp()
+    except ValueError:
+        return None
+
+
+def _gameweek_state(bootstrap: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Describe the gameweek a bootstrap-static payload belongs to.
+
+    Returns:
+        The current gameweek's id, deadline and finished flag, plus the Unix time
+        of the next deadline (None at the end of the season), or None if the
+        payload has no gameweeks
+    """
+    events = bootstrap.get("events", [])
+    current = next((gw for gw in events if gw.get("is_current")), None)
+    upcoming = next((gw for gw in events if gw.get("is_next")), None)
+    if current is None:
+        current = upcoming
+        upcoming = next((gw for gw in events if current and gw.get("id") == current.get("id", 0) + 1), None)
+    if current is None:
+        return None
+
+    return {
+        "gameweek": current.get("id"),
+        "deadline_time": current.get("deadline_time"),
+        "finished": bool(current.get("finished") and current.get("data_checked")),
+        "valid_until": _parse_deadline(upcoming.get("deadline_time")) if upcoming else None,
+    }
+
+
+class SnapshotStore:
+    """
+    Gzip-compressed JSON snapshots of API responses, keyed by gameweek and endpoint.
+
+    Files live under ``<directory>/gw<id>/`` and are tied to a generation described
+    in ``manifest.json``: the current gameweek, its ``deadline_time`` and whether it
+    has finished, taken from the last bootstrap-static response saved. A snapshot
+    is served only if it was written during the current generation and the next
+    deadline has not passed; while a gameweek is still live it also expires after
+    ``live_ttl`` seconds. When a new bootstrap-static shows the gameweek has moved
+    on or finished, a new generation starts and endpoints are re-saved one by one
+    as they are next fetched. Writes are atomic, so several processes can share a
+    directory.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        endpoints: tuple[str, ...] = DEFAULT_SNAPSHOT_ENDPOINTS,
+        live_ttl: float = DEFAULT_LIVE_TTL,
+    ):
+        """
+        Args:
+            directory: Directory to keep snapshots in, created on the first write
+            endpoints: First path segments of the endpoints to persist
+            live_ttl: Snapshot lifetime in seconds while the current gameweek is unfinished
+        """
+        self.directory = Path(directory)
+        self.endpoints = endpoints
+        self.live_ttl = live_ttl
+
+    def handles(self, endpoint: str) -> bool:
+        """Whether responses for an endpoint are persisted."""
+        return endpoint.strip("/").split("/", 1)[0] in self.endpoints
+
+    def _read_manifest(self) -> dict[str, Any] | None:
+        """
+        Read the current generation, if any.
+
+        The generation's start time is the manifest's mtime, so it comes from the
+        same clock as the snapshot mtimes it is compared with.
+        """
+        path = self.directory / MANIFEST_FILE
+        try:
+            with open(path, "rb") as f:
+                manifest = json.loads(f.read())
+                manifest["started_at"] = os.fstat(f.fileno()).st_mtime
+            return manifest
+        except (OSError, ValueError):
+            return None
+
+    def _path(self, manifest: dict[str, Any], endpoint: str) -> Path:
+        name = endpoint.split("?", 1)[0].strip("/").replace("/", "_")
+        return self.directory / f"gw{manifest['gameweek']}" / f"{name}.json.gz"
+
+    def _write_atomic(self, path: Path, payload: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _start_generation(self, state: dict[str, Any]) -> dict[str, Any]:
+        """Record a new generation and remove snapshots from other gameweeks."""
+        self._write_atomic(self.directory / MANIFEST_FILE, json.dumps(state).encode())
+        manifest = self._read_manifest() or {**state, "started_at": time.time()}
+        logger.info(f"Started FPL snapshot generation for gameweek {state['gameweek']} (finished={state['finished']})")
+
+        keep = f"gw{state['gameweek']}"
+        for child in self.directory.iterdir():
+            if child.is_dir() and child.name.startswith("gw") and child.name != keep:
+                shutil.rmtree(child, ignore_errors=True)
+        return manifest
+
+    def is_valid(self, manifest: dict[str, Any], saved_at: float, now: float | None = None) -> bool:
+        """Whether a snapshot written at ``saved_at`` can still be served."""
+        now = time.time() if now is None else now
+        if manifest.get("valid_until") is not None and now >= manifest["valid_until"]:
+            return False
+        if saved_at < manifest.get("started_at", 0):
+            return False
+        return manifest.get("finished", False) or now < saved_at + self.live_ttl
+
+    def load(self, endpoint: str) -> Any | None:
+        """
+        Read a valid snapshot for an endpoint.
+
+        Returns:
+            The stored response data, or None if there is no valid snapshot
+        """
+        if not self.handles(endpoint):
+            return None
+        manifest = self._read_manifest()
+        if manifest is None:
+            return None
+
+        path = self._path(manifest, endpoint)
+        try:
+            with open(path, "rb") as f:
+                if not self.is_valid(manifest, os.fstat(f.fileno()).st_mtime):
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return json.loads(gzip.decompress(mapped))
+        except (OSError, ValueError, EOFError) as e:
+            if not isinstance(e, FileNotFoundError):
+                logger.warning(f"Ignoring unreadable FPL snapshot {path}: {e}")
+            return None
+
+    def save(self, endpoint: str, data: Any) -> None:
+        """
+        Persist response data for an endpoint.
+
+        A bootstrap-static response starts a new generation when it shows a
+        different gameweek, deadline or finished state. Other endpoints are only
+        saved once a generation exists.
+        """
+        if not self.handles(endpoint):
+            return
+
+        manifest = self._read_manifest()
+        if endpoint == BOOTSTRAP_ENDPOINT:
+            state = _gameweek_state(data)
+            if state is None:
+                return
+            if manifest is None or any(manifest.get(key) != value for key, value in state.items()):
+                try:
+                    manifest = self._start_generation(state)
+                except OSError as e:
+                    logger.warning(f"Failed to start FPL snapshot generation for gameweek {state['gameweek']}: {e}")
+                    return
+        if manifest is None:
+            return
+
+        payload = gzip.compress(json.dumps(data, separators=(",", ":")).encode(), compresslevel=5)
+        try:
+            self._write_atomic(self._path(manifest, endpoint), payload)
+        except OSError as e:
+            logger.warning(f"Failed to write FPL snapshot for {endpoint}: {e}")
+
+    def clear(self) -> None:
+        """Remove all snapshots and the manifest."""
+        if not self.directory.is_dir():
+            return
+        for child in self.directory.iterdir():
+            if child.is_dir():
+                shutil.rmtree(child, ignore_errors=True)
+            elif child.name == MANIFEST_FILE:
+                child.unlink(missing_ok=True)
@@ -1,8 +1,116 @@
+import asyncio
+import hashlib
+import json
+import mimetypes
+import os
+import random
+import tempfile
+import time
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from pathlib import Path
 from typing import Any
 import httpx
 from loguru import logger
 from universal_mcp.applications.application import APIApplication
 from universal_mcp.integrations import Integration
+from universal_mcp.applications.google_drive.drive_index import FOLDER_MIME_TYPE, INDEX_FILE_FIELDS, DriveIndex
+
+UPLOAD_BASE_URL = "https://www.googleapis.com/upload/drive/v3/files"
+# Files up to this size are sent in a single multipart request
+MULTIPART_UPLOAD_MAX_BYTES = 5 * 1024 * 1024
+# Resumable chunks must be a multiple of 256 KiB
+UPLOAD_CHUNK_GRANULARITY = 256 * 1024
+DEFAULT_UPLOAD_CHUNK_SIZE = 32 * UPLOAD_CHUNK_GRANULARITY
+UPLOAD_MAX_RETRIES = 5
+# Statuses retried by uploads, downloads and folder walks
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# Drive keeps resumable sessions for a week; stop reusing them a day early
+UPLOAD_SESSION_MAX_AGE = 6 * 24 * 3600
+# Bytes read from the network per step when streaming downloads to disk
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_MAX_RETRIES = 5
+GOOGLE_APPS_MIME_PREFIX = "application/vnd.google-apps."
+# Directory where resumable upload session URIs are kept between runs
+GOOGLE_DRIVE_UPLOAD_STATE_DIR = os.getenv(
+    "GOOGLE_DRIVE_UPLOAD_STATE_DIR", os.path.join(Path.home(), ".cache", "universal_mcp", "google_drive_uploads")
+)
+# Directory holding the local file index, one database per Drive account
+GOOGLE_DRIVE_INDEX_DIR = os.getenv("GOOGLE_DRIVE_INDEX_DIR", os.path.join(Path.home(), ".cache", "universal_mcp", "google_drive_index"))
+# Largest page size accepted by files.list and changes.list
+INDEX_PAGE_SIZE = 1000
+# Folders listed at once by walk_folder
+WALK_MAX_CONCURRENCY = 8
+WALK_MAX_RETRIES = 5
+# File fields returned by walk_folder unless others are requested
+DEFAULT_WALK_FIELDS = "id,name,mimeType,parents,size,modifiedTime"
+
+
+class UploadSessionStore:
+    """
+    Resumable upload session URIs persisted on disk, one JSON file per upload.
+
+    An upload is identified by the local file (path, size and modification time)
+    and its destination, so an interrupted upload of an unchanged file picks up
+    its session again, while a modified file starts a new one. Sessions older than
+    ``max_age`` seconds are ignored. Writes are atomic, so several processes can
+    share a directory.
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_age: float = UPLOAD_SESSION_MAX_AGE):
+        """
+        Args:
+            directory: Directory to keep session files in, created on first save
+            max_age: Seconds after which a saved session is no longer reused
+        """
+        self.directory = Path(directory)
+        self.max_age = max_age
+
+    @staticmethod
+    def key(file_path: str, stat: os.stat_result, metadata: dict[str, Any]) -> str:
+        identity = [os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns, metadata]
+        return hashlib.sha256(json.dumps(identity, sort_keys=True).encode()).hexdigest()
+
+    def load(self, key: str) -> str | None:
+        """Get the session URI saved for an upload, if it is still fresh."""
+        path = self.directory / f"{key}.json"
+        try:
+            with open(path, "rb") as f:
+                if time.time() - os.fstat(f.fileno()).st_mtime > self.max_age:
+                    return None
+                return json.loads(f.read())["session_uri"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save(self, key: str, session_uri: str) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{key}.")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"session_uri": session_uri}, f)
+                os.replace(tmp_path, self.directory / f"{key}.json")
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to persist Drive upload session: {e}")
+
+    def discard(self, key: str) -> None:
+        (self.directory / f"{key}.json").unlink(missing_ok=True)
+
+
+def _retry_delay(attempt: int) -> float:
+    return min(2**attempt, 32) + random.random()
+
+
+def _next_upload_offset(response: httpx.Response) -> int:
+    """Offset to send next, from the Range header of a 308 resumable-upload response."""
+    received = response.headers.get("Range")
+    if not received:
+        return 0
+    return int(received.rsplit("-", 1)[1]) + 1
 
 
 class GoogleDriveApp(APIApplication):
@@ -14,6 +122,10 @@ class GoogleDriveApp(APIApplication):
     def __init__(self, integration: Integration | None = None) -> None:
         super().__init__(name="google_drive", integration=integration)
         self.base_url = "https://www.googleapis.com/drive/v3"
+        self.upload_sessions = UploadSessionStore(GOOGLE_DRIVE_UPLOAD_STATE_DIR)
+        self._index: DriveIndex | None = None
+        self._index_path: str | None = None
+        self._index_lock = asyncio.Lock()
 
     async def move_file(self, file_id: str, add_parents: str, remove_parents: str) -> dict[str, Any]:
         """
@@ -175,9 +287,7 @@ class GoogleDriveApp(APIApplication):
         file_data = self._handle_response(create_response)
         file_id = file_data.get("id")
         upload_url = f"https://www.googleapis.com/upload/drive/v3/files/{file_id}?uploadType=media"
-        upload_response = await self._apatch(
-            upload_url, data=text_content.encode("utf-8"), content_type=f"{mime_type}; charset=utf-8"
-        )
+        upload_response = await self._apatch(upload_url, data=text_content.encode("utf-8"), content_type=f"{mime_type}; charset=utf-8")
         return self._handle_response(upload_response)
 
     async def find_folder_id_by_name(self, folder_name: str) -> str | None:
@@ -188,7 +298,7 @@ class GoogleDriveApp(APIApplication):
             folder_name: The name of the folder to search for in Google Drive
 
         Returns:
-            str | None: The folder's ID if a matching folder is found, None if no folder is found or if an error occurs
+            str | None: The folder's ID if a matching folder is found, None if no folder is found or if an error occurs. Once `sync_drive_index` has built the local index, the lookup is answered from it (the most recently modified match wins) after an incremental sync.
 
         Raises:
             Exception: Caught internally and logged when API requests fail or response parsing errors occur
@@ -196,6 +306,16 @@ class GoogleDriveApp(APIApplication):
         Tags:
             search, find, google-drive, folder, query, api, utility
         """
+        try:
+            # Only an index built by an earlier sync is used; a lookup never creates one
+            async with self._index_lock:
+                index = await self._get_index(create=False)
+            if index is not None and index.page_token:
+                await self.sync_drive_index()
+                matches = index.find(folder_name, mime_type=FOLDER_MIME_TYPE)
+                return matches[0]["id"] if matches else None
+        except Exception as e:
+            logger.warning(f"Drive index unavailable, searching the API instead: {e}")
         query = f"mimeType='application/vnd.google-apps.folder' and name='{folder_name}' and trashed=false"
         try:
             response = await self._aget(f"{self.base_url}/files", params={"q": query, "fields": "files(id,name)"})
@@ -206,6 +326,275 @@ class GoogleDriveApp(APIApplication):
             logger.error(f"Error finding folder ID by name: {e}")
             return None
 
+    async def _get_index(self, create: bool = True) -> DriveIndex | None:
+        """
+        Open the local index for the authenticated account, one database file per user.
+
+        With ``create=False`` no database is created: None is returned unless the
+        account's index file already exists, and the account is not looked up at
+        all while the index directory holds no index files.
+        """
+        if self._index is None:
+            if not create and self._index_path is None and not any(Path(GOOGLE_DRIVE_INDEX_DIR).glob("*.sqlite3")):
+                return None
+            if self._index_path is None:
+                response = await self._aget(f"{self.base_url}/about", params={"fields": "user(permissionId)"})
+                permission_id = self._handle_response(response)["user"]["permissionId"]
+                self._index_path = os.path.join(GOOGLE_DRIVE_INDEX_DIR, f"{permission_id}.sqlite3")
+            if not create and not os.path.exists(self._index_path):
+                return None
+            self._index = DriveIndex(self._index_path)
+        return self._index
+
+    async def sync_drive_index(self, full_rebuild: bool = False) -> dict[str, Any]:
+        """
+        Brings the local on-disk index of Drive file metadata (id, name, parents, MIME type, modified time) up to date. The first call lists every file once and saves a changes page token; later calls only read the changes feed since that token, so keeping the index current costs O(changes) instead of re-listing the drive. `find_file_by_path`, `get_file_path` and `find_folder_id_by_name` answer from this index.
+
+        Args:
+            full_rebuild: Discard the index and list every file again. Defaults to False.
+
+        Returns:
+            A dictionary with files (number of files indexed), changes_applied, rebuilt (whether a full listing was done), page_token and elapsed_seconds
+
+        Raises:
+            HTTPStatusError: When a Drive API request fails
+
+        Tags:
+            sync, index, changes, cache, drive, incremental
+        """
+        async with self._index_lock:
+            index = await self._get_index()
+            started = time.monotonic()
+            rebuilt = full_rebuild or not index.page_token
+            if rebuilt:
+                await self._rebuild_index(index)
+
+            changes_applied = 0
+            page_token = index.page_token
+            while page_token:
+                params = {
+                    "pageToken": page_token,
+                    "pageSize": INDEX_PAGE_SIZE,
+                    "includeRemoved": "true",
+                    "fields": f"nextPageToken,newStartPageToken,changes(changeType,fileId,removed,file({INDEX_FILE_FIELDS}))",
+                }
+                response = await self._aget(f"{self.base_url}/changes", params=params)
+                data = self._handle_response(response)
+                next_token = data.get("nextPageToken") or data.get("newStartPageToken")
+                changes_applied += index.apply_changes(data.get("changes", []), next_token)
+                if "newStartPageToken" in data:
+                    break
+                page_token = next_token
+
+            elapsed = time.monotonic() - started
+            logger.info(f"Drive index synced: {len(index)} files, {changes_applied} changes in {elapsed:.1f}s (rebuilt={rebuilt})")
+            return {
+                "files": len(index),
+                "changes_applied": changes_applied,
+                "rebuilt": rebuilt,
+                "page_token": index.page_token,
+                "elapsed_seconds": round(elapsed, 3),
+            }
+
+    async def _rebuild_index(self, index: DriveIndex) -> None:
+        """List every non-trashed file into the index, syncing from a token taken beforehand so nothing is missed."""
+        start_token = (await self.get_changes_start_token())["startPageToken"]
+        response = await self._aget(f"{self.base_url}/files/root", params={"fields": "id"})
+        index.start_rebuild(self._handle_response(response)["id"])
+
+        params = {"q": "trashed=false", "pageSize": INDEX_PAGE_SIZE, "fields": f"nextPageToken,files({INDEX_FILE_FIELDS})"}
+        while True:
+            response = await self._aget(f"{self.base_url}/files", params=params)
+            data = self._handle_response(response)
+            index.add_files(data.get("files", []))
+            if not data.get("nextPageToken"):
+                break
+            params["pageToken"] = data["nextPageToken"]
+        index.finish_rebuild(start_token)
+
+    async def find_file_by_path(self, path: str) -> dict[str, Any] | None:
+        """
+        Finds a file or folder by its slash-separated path from the My Drive root, such as 'Reports/2024/summary.pdf', using the local index maintained by `sync_drive_index` (which is synced first, building it on first use). Where a folder holds several items with the same name, the most recently modified one is used.
+
+        Args:
+            path: Slash-separated path relative to My Drive, e.g. 'Projects/Design/logo.png'
+
+        Returns:
+            The file's id, name, mimeType, modifiedTime and parents, plus its path, or None if no file exists at that path
+
+        Raises:
+            HTTPStatusError: When syncing the index fails
+            ValueError: When path is empty
+
+        Tags:
+            find, path, lookup, file, folder, index, drive
+        """
+        if not path.strip("/"):
+            raise ValueError("path cannot be empty")
+        await self.sync_drive_index()
+        file = self._index.resolve_path(path)
+        return {**file, "path": path.strip("/")} if file else None
+
+    async def get_file_path(self, file_id: str) -> str | None:
+        """
+        Builds the slash-separated path of a file from the My Drive root by following its parent folders in the local index maintained by `sync_drive_index` (synced first), without a request per folder level.
+
+        Args:
+            file_id: The ID of the file or folder
+
+        Returns:
+            The path, e.g. 'Projects/Design/logo.png', or None if the file is not in the index (trashed, deleted or not visible)
+
+        Raises:
+            HTTPStatusError: When syncing the index fails
+
+        Tags:
+            path, lookup, file, folder, index, drive
+        """
+        await self.sync_drive_index()
+        return self._index.path_of(file_id)
+
+    async def walk_folder(
+        self,
+        folder_id: str = "root",
+        fields: str = DEFAULT_WALK_FIELDS,
+        max_depth: int | None = None,
+        max_concurrency: int = WALK_MAX_CONCURRENCY,
+        drive_id: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Walk a folder tree breadth-first, yielding each file and folder as soon as its page arrives.
+
+        Up to ``max_concurrency`` folders are listed at once, each following
+        ``nextPageToken`` at the largest page size with only ``fields`` requested.
+        Pages that hit a rate limit or server error are retried with backoff. Items
+        carry their ``path`` relative to ``folder_id`` and their ``depth`` (1 for
+        direct children). Stopping iteration early cancels the outstanding requests.
+
+        Args:
+            folder_id: ID of the folder to start from
+            fields: File fields to request; id, name and mimeType are always included
+            max_depth: Deepest level to list, or None for the whole tree
+            max_concurrency: Maximum number of folders listed at once
+            drive_id: Shared drive to search in, for trees inside a shared drive
+        """
+        requested = dict.fromkeys(["id", "name", "mimeType", *(f.strip() for f in fields.split(",") if f.strip())])
+        params = {
+            "pageSize": INDEX_PAGE_SIZE,
+            "fields": f"nextPageToken,files({','.join(requested)})",
+            "supportsAllDrives": "true",
+            "includeItemsFromAllDrives": "true",
+        }
+        if drive_id:
+            params.update(corpora="drive", driveId=drive_id)
+
+        folders: asyncio.Queue[tuple[str, str, int]] = asyncio.Queue()
+        # Bounded, so a slow consumer holds back the listing instead of buffering the tree
+        results: asyncio.Queue[dict[str, Any] | Exception | None] = asyncio.Queue(maxsize=4 * INDEX_PAGE_SIZE)
+        folders.put_nowait((folder_id, "", 0))
+        # Folders with several parents are listed once
+        queued = {folder_id}
+
+        async def list_page(page_params: dict[str, Any]) -> dict[str, Any]:
+            for attempt in range(WALK_MAX_RETRIES + 1):
+                response = await self._aget(f"{self.base_url}/files", params=page_params)
+                if response.status_code not in RETRY_STATUS_CODES or attempt == WALK_MAX_RETRIES:
+                    break
+                await asyncio.sleep(_retry_delay(attempt))
+            return self._handle_response(response)
+
+        async def worker() -> None:
+            while True:
+                parent_id, parent_path, depth = await folders.get()
+                try:
+                    page_params = {**params, "q": f"'{parent_id}' in parents and trashed=false"}
+                    while True:
+                        data = await list_page(page_params)
+                        for file in data.get("files", []):
+                            path = f"{parent_path}/{file['name']}" if parent_path else file["name"]
+                            is_folder = file["mimeType"] == FOLDER_MIME_TYPE and file["id"] not in queued
+                            if is_folder and (max_depth is None or depth + 1 < max_depth):
+                                queued.add(file["id"])
+                                folders.put_nowait((file["id"], path, depth + 1))
+                            await results.put({**file, "path": path, "depth": depth + 1})
+                        if not data.get("nextPageToken"):
+                            break
+                        page_params["pageToken"] = data["nextPageToken"]
+                except Exception as e:
+                    await results.put(e)
+                finally:
+                    folders.task_done()
+
+        async def finish() -> None:
+            await folders.join()
+            await results.put(None)
+
+        tasks = [asyncio.create_task(worker()) for _ in range(max_concurrency)]
+        tasks.append(asyncio.create_task(finish()))
+        try:
+            while (item := await results.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def list_folder_tree(
+        self,
+        folder_id: str = "root",
+        max_depth: int | None = None,
+        max_items: int | None = None,
+        fields: str | None = None,
+        max_concurrency: int = WALK_MAX_CONCURRENCY,
+        drive_id: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Lists every file and folder beneath a folder, recursively. Folders are explored breadth-first with several listed concurrently, each fetched 1000 items per page with only the needed fields, so mapping a large tree or shared drive takes a handful of requests per folder level instead of a `search_files` call per folder and page.
+
+        Args:
+            folder_id: ID of the folder to list, or 'root' for My Drive. Defaults to 'root'.
+            max_depth: Deepest level to descend to (1 lists only direct children). Defaults to the whole tree.
+            max_items: Stop after this many items. Defaults to no limit.
+            fields: Comma-separated file fields to return, e.g. 'id,name,mimeType,size'. Defaults to id, name, mimeType, parents, size and modifiedTime.
+            max_concurrency: Maximum number of folders listed at once. Defaults to 8.
+            drive_id: ID of the shared drive the folder belongs to, when walking a shared drive
+
+        Returns:
+            A dictionary with folder_id, items (each file with the requested fields plus its path relative to the folder and its depth, in breadth-first order per folder), files and folders (counts), truncated (whether max_items cut the walk short) and elapsed_seconds
+
+        Raises:
+            HTTPStatusError: When a Drive API request fails
+            ValueError: When max_concurrency is less than 1
+
+        Tags:
+            list, tree, folder, recursive, walk, files, drive, bulk
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        started = time.monotonic()
+        items = []
+        truncated = False
+        walk = self.walk_folder(folder_id, fields or DEFAULT_WALK_FIELDS, max_depth, max_concurrency, drive_id)
+        async with aclosing(walk) as walked:
+            async for item in walked:
+                if max_items is not None and len(items) >= max_items:
+                    truncated = True
+                    break
+                items.append(item)
+        folders = sum(1 for item in items if item["mimeType"] == FOLDER_MIME_TYPE)
+        elapsed = time.monotonic() - started
+        logger.info(f"Walked folder {folder_id}: {len(items)} items in {elapsed:.1f}s")
+        return {
+            "folder_id": folder_id,
+            "items": items,
+            "files": len(items) - folders,
+            "folders": folders,
+            "truncated": truncated,
+            "elapsed_seconds": round(elapsed, 3),
+        }
+
     async def create_folder(self, folder_name: str, parent_id: str = None) -> dict[str, Any]:
         """
         Creates a new folder in Google Drive, optionally within a parent specified by name or ID. If a parent name is given, it internally resolves it to an ID using the `find_folder_id_by_name` function. Returns the metadata for the newly created folder upon successful creation.
@@ -240,18 +629,28 @@ class GoogleDriveApp(APIApplication):
         response = await self._apost(url, data=metadata, params=params)
         return self._handle_response(response)
 
-    async def upload_file_from_path(self, file_name: str, file_path: str, parent_id: str = None, mime_type: str = None) -> dict[str, Any]:
+    async def upload_file_from_path(
+        self,
+        file_name: str,
+        file_path: str,
+        parent_id: str = None,
+        mime_type: str = None,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        multipart_max_bytes: int = MULTIPART_UPLOAD_MAX_BYTES,
+    ) -> dict[str, Any]:
         """
-        Uploads a local file to Google Drive by reading its binary content from a path. It creates the file's metadata, uploads the content, and returns the new file's metadata. This differs from `create_text_file` which uses in-memory string content instead of a local file path.
+        Uploads a local file to Google Drive from a path and returns the new file's metadata. Small files are sent with their metadata in a single multipart request; larger ones use a resumable upload that streams fixed-size chunks from disk, so memory use stays constant, and an interrupted upload of the same unchanged file continues where it stopped, even from a new process. This differs from `create_text_file` which uses in-memory string content instead of a local file path.
 
         Args:
             file_name: Name to give the file on Google Drive
             file_path: Path to the local file to upload
             parent_id: Optional ID of the parent folder to create the file in
-            mime_type: MIME type of the file (e.g., 'image/jpeg', 'image/png', 'application/pdf')
+            mime_type: MIME type of the file (e.g., 'image/jpeg', 'image/png', 'application/pdf'). Guessed from the file name when omitted.
+            chunk_size: Bytes sent per request in a resumable upload, rounded down to a multiple of 256 KiB. Defaults to 8 MiB.
+            multipart_max_bytes: Largest file sent as a single multipart request. Defaults to 5 MiB.
 
         Returns:
-            Dictionary containing the uploaded file's metadata from Google Drive
+            Dictionary containing the uploaded file's metadata from Google Drive, plus an `upload` entry with method (multipart or resumable), bytes, bytes_sent, resumed_from, requests, retries, elapsed_seconds and bytes_per_second
 
         Raises:
             FileNotFoundError: When the specified file_path does not exist or is not accessible
@@ -259,20 +658,325 @@ class GoogleDriveApp(APIApplication):
             IOError: When there are issues reading the file content
 
         Tags:
-            upload, file-handling, google-drive, api, important, binary, storage
+            upload, file-handling, google-drive, api, important, binary, storage, resumable
         """
+        mime_type = mime_type or mimetypes.guess_type(file_name)[0] or "application/octet-stream"
         metadata = {"name": file_name, "mimeType": mime_type}
         if parent_id:
             metadata["parents"] = [parent_id]
-        create_url = f"{self.base_url}/files"
-        create_response = await self._apost(create_url, data=metadata)
-        file_data = self._handle_response(create_response)
-        file_id = file_data.get("id")
-        with open(file_path, "rb") as file_content:
-            binary_content = file_content.read()
-            upload_url = f"https://www.googleapis.com/upload/drive/v3/files/{file_id}?uploadType=media"
-            upload_response = await self._apatch(upload_url, data=binary_content, content_type=mime_type)
-        return self._handle_response(upload_response)
+        stat = os.stat(file_path)
+        started = time.monotonic()
+
+        if stat.st_size <= multipart_max_bytes:
+            file_data = await self._upload_multipart(file_path, metadata)
+            stats = {"method": "multipart", "bytes_sent": stat.st_size, "resumed_from": 0, "requests": 1, "retries": 0}
+        else:
+            chunk_size = max(UPLOAD_CHUNK_GRANULARITY, chunk_size - chunk_size % UPLOAD_CHUNK_GRANULARITY)
+            file_data, stats = await self._upload_resumable(file_path, stat, metadata, chunk_size)
+            stats = {"method": "resumable", **stats}
+
+        elapsed = time.monotonic() - started
+        stats.update(
+            bytes=stat.st_size,
+            elapsed_seconds=round(elapsed, 3),
+            bytes_per_second=round(stats["bytes_sent"] / elapsed) if elapsed > 0 else None,
+        )
+        logger.info(f"Uploaded {file_path} to Drive file {file_data.get('id')}: {stats}")
+        return {**file_data, "upload": stats}
+
+    async def _upload_multipart(self, file_path: str, metadata: dict[str, Any]) -> dict[str, Any]:
+        """Create a file and send its content in one multipart/related request."""
+        boundary = f"upload_{uuid.uuid4().hex}"
+        with open(file_path, "rb") as f:
+            content = f.read()
+        body = b"".join(
+            [
+                f"--{boundary}\r\nContent-Type: application/json; charset=UTF-8\r\n\r\n".encode(),
+                json.dumps(metadata).encode(),
+                f"\r\n--{boundary}\r\nContent-Type: {metadata['mimeType']}\r\n\r\n".encode(),
+                content,
+                f"\r\n--{boundary}--\r\n".encode(),
+            ]
+        )
+        response = await self._apost(
+            UPLOAD_BASE_URL, data=body, params={"uploadType": "multipart"}, content_type=f"multipart/related; boundary={boundary}"
+        )
+        return self._handle_response(response)
+
+    async def _upload_resumable(
+        self, file_path: str, stat: os.stat_result, metadata: dict[str, Any], chunk_size: int
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Upload a file through a resumable session, reusing a persisted session when there is one.
+
+        Each chunk is read from disk just before it is sent. After a network error or
+        a retryable status the session is asked how much it has received and the
+        upload continues from there; an expired session starts over once.
+
+        Returns:
+            The file metadata and the upload statistics
+        """
+        total = stat.st_size
+        key = UploadSessionStore.key(file_path, stat, metadata)
+        stats = {"bytes_sent": 0, "resumed_from": 0, "requests": 0, "retries": 0}
+        restarted = False
+
+        session_uri = self.upload_sessions.load(key)
+        resuming = session_uri is not None
+        offset = None
+        async with self.get_async_client() as client:
+            while True:
+                if session_uri is None:
+                    response = await client.post(
+                        UPLOAD_BASE_URL,
+                        params={"uploadType": "resumable"},
+                        json=metadata,
+                        headers={"X-Upload-Content-Type": metadata["mimeType"], "X-Upload-Content-Length": str(total)},
+                    )
+                    stats["requests"] += 1
+                    response.raise_for_status()
+                    session_uri = response.headers["Location"]
+                    self.upload_sessions.save(key, session_uri)
+                    offset = 0
+
+                attempt = 0
+                with open(file_path, "rb") as f:
+                    while True:
+                        try:
+                            if offset is None:
+                                # Ask the session how much it already has
+                                response = await client.put(session_uri, content=b"", headers={"Content-Range": f"bytes */{total}"})
+                            else:
+                                f.seek(offset)
+                                chunk = await asyncio.to_thread(f.read, chunk_size)
+                                end = offset + len(chunk) - 1
+                                response = await client.put(
+                                    session_uri,
+                                    content=chunk,
+                                    headers={"Content-Type": metadata["mimeType"], "Content-Range": f"bytes {offset}-{end}/{total}"},
+                                )
+                                stats["bytes_sent"] += len(chunk)
+                            stats["requests"] += 1
+                        except httpx.TransportError as e:
+                            if attempt >= UPLOAD_MAX_RETRIES:
+                                raise
+                            reason = str(e) or type(e).__name__
+                        else:
+                            if response.status_code in (200, 201):
+                                self.upload_sessions.discard(key)
+                                return response.json(), stats
+                            if response.status_code == 308:
+                                next_offset = _next_upload_offset(response)
+                                if resuming:
+                                    stats["resumed_from"] = next_offset
+                                    logger.info(f"Resuming upload of {file_path} at byte {next_offset} of {total}")
+                                    resuming = False
+                                offset = next_offset
+                                attempt = 0
+                                continue
+                            if response.status_code in (404, 410):
+                                break
+                            if response.status_code not in RETRY_STATUS_CODES or attempt >= UPLOAD_MAX_RETRIES:
+                                response.raise_for_status()
+                            reason = f"HTTP {response.status_code}"
+                        delay = _retry_delay(attempt)
+                        logger.warning(f"Upload of {file_path} interrupted ({reason}), retrying in {delay:.1f}s")
+                        await asyncio.sleep(delay)
+                        attempt += 1
+                        stats["retries"] += 1
+                        offset = None
+
+                # The session expired or was never valid: start a new one, once
+                self.upload_sessions.discard(key)
+                if restarted:
+                    response.raise_for_status()
+                logger.warning(f"Upload session for {file_path} is gone, starting a new one")
+                restarted = True
+                resuming = False
+                session_uri = None
+
+    async def download_file(
+        self,
+        file_id: str,
+        destination: str,
+        range_start: int | None = None,
+        range_end: int | None = None,
+        resume: bool = True,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    ) -> dict[str, Any]:
+        """
+        Downloads a binary file's content (`alt=media`) straight to disk, streaming it in chunks so memory use stays flat for any file size. The MD5 checksum is computed while writing and checked against Drive's `md5Checksum`; an interrupted download is kept as a `.part` file and continued with an HTTP Range request on the next call or after a network error. Passing `range_start`/`range_end` saves only that byte range. For Google Docs, Sheets and Slides use `export_file_to_path` instead.
+
+        Args:
+            file_id: The ID of the file to download
+            destination: Local file path to write, or an existing directory to save the file in under its Drive name
+            range_start: First byte to download (inclusive) for a partial read. Defaults to the start of the file.
+            range_end: Last byte to download (inclusive) for a partial read. Defaults to the end of the file.
+            resume: Continue from a leftover `.part` file of an earlier interrupted download instead of starting over. Defaults to True.
+            chunk_size: Bytes read from the network per step. Defaults to 1 MiB.
+
+        Returns:
+            A dictionary with file_id, name, mime_type, path, size (bytes written), md5Checksum (of the bytes written), verified (whether it matched Drive's checksum; None for partial reads or files without one), range, resumed_from, elapsed_seconds and bytes_per_second
+
+        Raises:
+            HTTPStatusError: When the Drive API request fails
+            ValueError: When the file is a Google Workspace document, or the downloaded content does not match Drive's checksum
+
+        Tags:
+            download, file, stream, range, resume, checksum, drive, binary, storage, important
+        """
+        url = f"{self.base_url}/files/{file_id}"
+        response = await self._aget(url, params={"fields": "id,name,mimeType,size,md5Checksum", "supportsAllDrives": "true"})
+        metadata = self._handle_response(response)
+        if metadata.get("mimeType", "").startswith(GOOGLE_APPS_MIME_PREFIX):
+            raise ValueError(f"'{metadata.get('name')}' is a Google Workspace document and must be exported with export_file_to_path")
+
+        path = self._download_path(destination, metadata["name"])
+        partial = range_start is not None or range_end is not None
+        start = range_start or 0
+        params = {"alt": "media", "supportsAllDrives": "true"}
+        result = await self._stream_to_path(url, params, path, chunk_size, start=start, end=range_end, resume=resume and not partial)
+
+        expected = metadata.get("md5Checksum")
+        verified = None
+        if not partial and expected:
+            verified = result["md5Checksum"] == expected
+            if not verified:
+                os.unlink(path)
+                raise ValueError(f"Checksum mismatch downloading {file_id}: expected {expected}, got {result['md5Checksum']}")
+        return {
+            "file_id": file_id,
+            "name": metadata["name"],
+            "mime_type": metadata.get("mimeType"),
+            **result,
+            "verified": verified,
+            "range": [start, start + result["size"] - 1] if partial else None,
+        }
+
+    async def export_file_to_path(
+        self, file_id: str, mime_type: str, destination: str, chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE
+    ) -> dict[str, Any]:
+        """
+        Exports a Google Workspace document (Doc, Sheet, Slides, Drawing) to a format such as PDF, DOCX or CSV and streams the converted content straight to disk, rather than returning it in memory like `export_file`. The file appears at its final path only once fully written.
+
+        Args:
+            file_id: The ID of the Google Workspace document to export
+            mime_type: The MIME type to export to, e.g. 'application/pdf' or 'text/csv'
+            destination: Local file path to write, or an existing directory to save the export in under the document's name plus an extension for the MIME type
+            chunk_size: Bytes read from the network per step. Defaults to 1 MiB.
+
+        Returns:
+            A dictionary with file_id, name, mime_type, path, size (bytes written), md5Checksum (of the exported content), resumed_from, elapsed_seconds and bytes_per_second
+
+        Raises:
+            HTTPStatusError: When the Drive API request fails, e.g. the document cannot be converted to the requested format
+
+        Tags:
+            export, download, file, stream, convert, document, drive, storage
+        """
+        url = f"{self.base_url}/files/{file_id}"
+        response = await self._aget(url, params={"fields": "id,name", "supportsAllDrives": "true"})
+        name = self._handle_response(response)["name"]
+        extension = mimetypes.guess_extension(mime_type) or ""
+        path = self._download_path(destination, name if name.endswith(extension) else name + extension)
+        # Exports do not support Range requests, so a failed stream starts over
+        result = await self._stream_to_path(f"{url}/export", {"mimeType": mime_type}, path, chunk_size, resume=False, ranged=False)
+        return {"file_id": file_id, "name": name, "mime_type": mime_type, **result}
+
+    @staticmethod
+    def _download_path(destination: str, name: str) -> str:
+        if os.path.isdir(destination):
+            return os.path.abspath(os.path.join(destination, os.path.basename(name)))
+        os.makedirs(os.path.dirname(os.path.abspath(destination)), exist_ok=True)
+        return os.path.abspath(destination)
+
+    async def _stream_to_path(
+        self,
+        url: str,
+        params: dict[str, Any],
+        path: str,
+        chunk_size: int,
+        start: int = 0,
+        end: int | None = None,
+        resume: bool = True,
+        ranged: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Stream a response body to ``path`` through a ``.part`` file, hashing it as it is written.
+
+        The part file holds bytes ``start`` onward. When ``ranged``, each request asks
+        for the bytes after those already written, so a leftover part file (when
+        ``resume``) or a dropped connection continues where it stopped; otherwise a
+        retry starts over.
+
+        Returns:
+            path, size, md5Checksum, resumed_from, elapsed_seconds and bytes_per_second
+        """
+        part_path = f"{path}.part"
+        started = time.monotonic()
+        digest = hashlib.md5(usedforsecurity=False)
+        if not resume and os.path.exists(part_path):
+            os.unlink(part_path)
+
+        async with self.get_async_client() as client:
+            with open(part_path, "ab") as f:
+                written = f.tell()
+                if written:
+                    # Hash what an earlier attempt already saved
+                    with open(part_path, "rb") as existing:
+                        while block := await asyncio.to_thread(existing.read, chunk_size):
+                            digest.update(block)
+                    logger.info(f"Resuming download to {path} at byte {start + written}")
+                resumed_from = written
+                received = 0
+
+                attempt = 0
+                while end is None or start + f.tell() <= end:
+                    position = start + f.tell()
+                    headers = (
+                        {"Range": f"bytes={position}-{'' if end is None else end}"} if ranged and (position or end is not None) else {}
+                    )
+                    try:
+                        async with client.stream("GET", url, params=params, headers=headers) as response:
+                            if response.status_code == 416 and f.tell():
+                                # Nothing left after what is already on disk
+                                break
+                            response.raise_for_status()
+                            if headers and response.status_code != 206:
+                                if start:
+                                    raise ValueError(f"Server ignored the Range header for {url}")
+                                # Full body sent instead of the requested range; start over
+                                f.truncate(0)
+                                digest = hashlib.md5(usedforsecurity=False)
+                            async for chunk in response.aiter_bytes(chunk_size):
+                                f.write(chunk)
+                                digest.update(chunk)
+                                received += len(chunk)
+                        break
+                    except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                        if isinstance(e, httpx.HTTPStatusError) and e.response.status_code not in RETRY_STATUS_CODES:
+                            raise
+                        if attempt >= DOWNLOAD_MAX_RETRIES:
+                            raise
+                        if not ranged:
+                            f.truncate(0)
+                            digest = hashlib.md5(usedforsecurity=False)
+                        delay = _retry_delay(attempt)
+                        logger.warning(f"Download to {path} interrupted ({e}), retrying in {delay:.1f}s")
+                        await asyncio.sleep(delay)
+                        attempt += 1
+                size = f.tell()
+
+        os.replace(part_path, path)
+        elapsed = time.monotonic() - started
+        return {
+            "path": path,
+            "size": size,
+            "md5Checksum": digest.hexdigest(),
+            "resumed_from": resumed_from,
+            "elapsed_seconds": round(elapsed, 3),
+            "bytes_per_second": round(received / elapsed) if elapsed > 0 else None,
+        }
 
     async def list_installed_apps(
         self,
@@ -4150,6 +4854,10 @@ class GoogleDriveApp(APIApplication):
             self.create_text_file,
             self.upload_file_from_path,
             self.find_folder_id_by_name,
+            self.sync_drive_index,
+            self.find_file_by_path,
+            self.get_file_path,
+            self.list_folder_tree,
             self.create_folder,
             self.get_file_details,
             self.trash_file,
@@ -4180,6 +4888,8 @@ class GoogleDriveApp(APIApplication):
             self.update_file_metadata,
             self.copy_file,
             self.export_file,
+            self.download_file,
+            self.export_file_to_path,
             self.list_file_labels,
             self.modify_file_labels,
             self.watch_file_for_changes,
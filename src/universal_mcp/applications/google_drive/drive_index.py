@@ -0,0 +1,204 @@
+"""On-disk index of Google Drive file metadata, kept current from the changes feed."""
+
+import json
+import os
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+# File fields stored in the index, as a Drive API field mask
+INDEX_FILE_FIELDS = "id,name,mimeType,parents,modifiedTime,trashed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    mime_type TEXT,
+    modified_time TEXT,
+    parents TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_name ON files (name);
+CREATE TABLE IF NOT EXISTS parents (
+    parent_id TEXT NOT NULL,
+    file_id TEXT NOT NULL,
+    PRIMARY KEY (parent_id, file_id)
+);
+CREATE INDEX IF NOT EXISTS parents_file ON parents (file_id);
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _row_to_file(row: tuple) -> dict[str, Any]:
+    file_id, name, mime_type, modified_time, parents = row
+    return {"id": file_id, "name": name, "mimeType": mime_type, "modifiedTime": modified_time, "parents": json.loads(parents)}
+
+
+class DriveIndex:
+    """
+    SQLite mirror of the name, parents, MIME type and modification time of every
+    non-trashed file in a Drive.
+
+    The index is built once from a full listing and then kept current by applying
+    pages of the changes feed, so each sync costs O(changes) rather than O(files).
+    The changes page token and the ID of the My Drive root are stored alongside the
+    files; the index only counts as built once a page token has been saved, so an
+    interrupted build is redone rather than served.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """
+        Args:
+            path: SQLite database file, created (with its directory) if missing
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def _get_state(self, key: str) -> str | None:
+        row = self._db.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: str | None) -> None:
+        self._db.execute("INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", (key, value))
+
+    @property
+    def page_token(self) -> str | None:
+        """Changes page token to sync from, or None if the index has not been built."""
+        return self._get_state("page_token")
+
+    @property
+    def root_id(self) -> str | None:
+        """ID of the My Drive root folder."""
+        return self._get_state("root_id")
+
+    def _upsert(self, files: Iterable[dict[str, Any]]) -> None:
+        for file in files:
+            if file.get("trashed"):
+                self._remove(file["id"])
+                continue
+            parents = file.get("parents", [])
+            self._db.execute(
+                "INSERT OR REPLACE INTO files (id, name, mime_type, modified_time, parents) VALUES (?, ?, ?, ?, ?)",
+                (file["id"], file.get("name", ""), file.get("mimeType"), file.get("modifiedTime"), json.dumps(parents)),
+            )
+            self._db.execute("DELETE FROM parents WHERE file_id = ?", (file["id"],))
+            self._db.executemany("INSERT OR IGNORE INTO parents (parent_id, file_id) VALUES (?, ?)", [(p, file["id"]) for p in parents])
+
+    def _remove(self, file_id: str) -> None:
+        self._db.execute("DELETE FROM files WHERE id = ?", (file_id,))
+        self._db.execute("DELETE FROM parents WHERE file_id = ?", (file_id,))
+
+    def start_rebuild(self, root_id: str) -> None:
+        """Drop all files and the page token ahead of a full listing."""
+        with self._db:
+            self._db.execute("DELETE FROM files")
+            self._db.execute("DELETE FROM parents")
+            self._set_state("page_token", None)
+            self._set_state("root_id", root_id)
+
+    def add_files(self, files: Iterable[dict[str, Any]]) -> None:
+        """Store one page of a full listing."""
+        with self._db:
+            self._upsert(files)
+
+    def finish_rebuild(self, page_token: str) -> None:
+        """Mark the index as built, syncing from the token taken before the listing started."""
+        with self._db:
+            self._set_state("page_token", page_token)
+
+    def apply_changes(self, changes: Iterable[dict[str, Any]], page_token: str) -> int:
+        """
+        Apply one page of the changes feed and move the page token on, atomically.
+
+        Returns:
+            Number of file changes applied
+        """
+        applied = 0
+        with self._db:
+            for change in changes:
+                if change.get("changeType", "file") != "file":
+                    continue
+                if change.get("removed") or "file" not in change:
+                    self._remove(change["fileId"])
+                else:
+                    self._upsert([change["file"]])
+                applied += 1
+            self._set_state("page_token", page_token)
+        return applied
+
+    def get(self, file_id: str) -> dict[str, Any] | None:
+        row = self._db.execute("SELECT id, name, mime_type, modified_time, parents FROM files WHERE id = ?", (file_id,)).fetchone()
+        return _row_to_file(row) if row else None
+
+    def find(self, name: str, mime_type: str | None = None, parent_id: str | None = None) -> list[dict[str, Any]]:
+        """
+        Get the files with an exact name, most recently modified first.
+
+        Args:
+            name: File name to match
+            mime_type: Only return files of this MIME type
+            parent_id: Only return files directly inside this folder
+        """
+        query = "SELECT f.id, f.name, f.mime_type, f.modified_time, f.parents FROM files f"
+        args: list[Any] = []
+        if parent_id is not None:
+            query += " JOIN parents p ON p.file_id = f.id AND p.parent_id = ?"
+            args.append(parent_id)
+        query += " WHERE f.name = ?"
+        args.append(name)
+        if mime_type is not None:
+            query += " AND f.mime_type = ?"
+            args.append(mime_type)
+        query += " ORDER BY f.modified_time DESC"
+        return [_row_to_file(row) for row in self._db.execute(query, args)]
+
+    def resolve_path(self, path: str) -> dict[str, Any] | None:
+        """
+        Look up a file by its slash-separated path from the My Drive root, e.g. "Reports/2024/q1.pdf".
+
+        Returns:
+            The file, or None if any path segment is missing. Where a folder holds
+            several items with the same name the most recently modified one is used.
+        """
+        segments = [segment for segment in path.strip("/").split("/") if segment]
+        current = {"id": self.root_id, "name": "", "mimeType": FOLDER_MIME_TYPE, "modifiedTime": None, "parents": []}
+        for segment in segments:
+            matches = self.find(segment, parent_id=current["id"])
+            if not matches:
+                return None
+            current = matches[0]
+        return current
+
+    def path_of(self, file_id: str) -> str | None:
+        """
+        Build the path of a file by following its first parent up to the root.
+
+        Returns:
+            The slash-separated path, or None if the file is not indexed. Files
+            outside My Drive (e.g. shared with the user) are rooted at their
+            topmost indexed ancestor.
+        """
+        names = []
+        seen = set()
+        current = self.get(file_id)
+        if current is None:
+            return None
+        while current is not None and current["id"] not in seen:
+            seen.add(current["id"])
+            names.append(current["name"])
+            parent_id = current["parents"][0] if current["parents"] else None
+            current = self.get(parent_id) if parent_id and parent_id != self.root_id else None
+        return "/".join(reversed(names))
@@ -1,17 +1,154 @@
 import base64
 import asyncio
+import hashlib
+import json
+import os
+import re
+import tempfile
+import uuid
+from collections import OrderedDict
 from email.message import EmailMessage
 from typing import Any
+from urllib.parse import urlencode
+import httpx
 from loguru import logger
 from universal_mcp.applications.application import APIApplication
 from universal_mcp.integrations import Integration
 
+# Gmail accepts up to 100 sub-requests per batch call
+BATCH_MAX_REQUESTS = 100
+# Batch calls in flight at once when hydrating message lists
+BATCH_MAX_CONCURRENCY = 3
+# Rounds of retries for sub-requests that were rate limited or hit a transient error
+BATCH_MAX_RETRIES = 3
+BATCH_RETRY_STATUS_CODES = (429, 500, 503)
+MESSAGE_FORMATS = ("full", "metadata", "minimal")
+# Headers returned for format="metadata" when none are requested explicitly
+DEFAULT_METADATA_HEADERS = ("From", "To", "Date", "Subject")
+# Maximum number of formatted messages kept in memory per app instance
+GMAIL_MESSAGE_CACHE_SIZE = int(os.getenv("GMAIL_MESSAGE_CACHE_SIZE", "2000"))
+HISTORY_TYPES = ("messageAdded", "messageDeleted", "labelAdded", "labelRemoved")
+# Bytes read from the network per step when streaming attachments to disk
+ATTACHMENT_CHUNK_SIZE = 1024 * 1024
+# Attachments downloaded at once by download_thread_attachments
+ATTACHMENT_MAX_CONCURRENCY = 4
+
+
+def default_attachment_name(attachment_id: str) -> str:
+    """
+    File name used for an attachment saved without a name of its own.
+
+    Gmail attachment IDs are often several hundred characters long, well past
+    the file system's name limit, so a short digest of the ID is used instead.
+    """
+    return f"attachment-{hashlib.sha256(attachment_id.encode()).hexdigest()[:16]}"
+
+
+class MessageCache:
+    """
+    Least-recently-used cache of formatted messages.
+
+    Message content never changes once delivered, so entries stay valid until
+    the message is deleted or they are evicted. Entries are keyed by message ID
+    and by the format and field mask they were fetched with, since a metadata
+    fetch has no body.
+    """
+
+    def __init__(self, max_entries: int = GMAIL_MESSAGE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, str | None], dict[str, Any]] = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, message_id: str, format: str, fields: str | None = None) -> dict[str, Any] | None:
+        key = (message_id, format, fields)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return dict(entry)
+
+    def put(self, message_id: str, format: str, fields: str | None, message: dict[str, Any]) -> None:
+        if self.max_entries <= 0:
+            return
+        key = (message_id, format, fields)
+        self._entries[key] = dict(message)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, message_id: str) -> None:
+        """Drop every cached format of a message."""
+        for key in [key for key in self._entries if key[0] == message_id]:
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class AttachmentStreamDecoder:
+    """
+    Incremental decoder for the ``data`` field of a streamed attachments.get response.
+
+    The response is JSON whose ``data`` member holds the attachment as base64url.
+    Bytes are fed in as they arrive: the decoder skips ahead to the ``data`` string,
+    then decodes it in whole 4-character groups, carrying any remainder to the next
+    chunk, and passes the decoded bytes to ``sink``. Only the current chunk is held
+    in memory.
+    """
+
+    _DATA_START = re.compile(rb'"data"\s*:\s*"')
+
+    def __init__(self, sink):
+        """
+        Args:
+            sink: Callable receiving each block of decoded bytes
+        """
+        self._sink = sink
+        self._buffer = b""
+        self._in_data = False
+        self._done = False
+
+    def feed(self, chunk: bytes) -> None:
+        if self._done:
+            return
+        if not self._in_data:
+            self._buffer += chunk
+            match = self._DATA_START.search(self._buffer)
+            if not match:
+                # Keep enough to match a key split across chunks
+                self._buffer = self._buffer[-64:]
+                return
+            self._in_data = True
+            chunk, self._buffer = self._buffer[match.end() :], b""
+
+        end = chunk.find(b'"')
+        if end != -1:
+            chunk, self._done = chunk[:end], True
+        data = self._buffer + chunk
+        usable = len(data) - len(data) % 4
+        if usable:
+            self._sink(base64.urlsafe_b64decode(data[:usable]))
+        self._buffer = data[usable:]
+
+    def close(self) -> None:
+        """Decode whatever is left, adding the padding Gmail leaves out."""
+        if not self._in_data:
+            raise ValueError("Attachment response has no data field")
+        if self._buffer:
+            self._sink(base64.urlsafe_b64decode(self._buffer + b"=" * (-len(self._buffer) % 4)))
+            self._buffer = b""
+
 
 class GoogleMailApp(APIApplication):
     def __init__(self, integration: Integration) -> None:
         super().__init__(name="google_mail", integration=integration)
         self.base_api_url = "https://gmail.googleapis.com/gmail/v1/users/me"
         self.base_url = "https://gmail.googleapis.com"
+        self.message_cache = MessageCache()
+        # Mailbox historyId reached by the last sync_messages call
+        self._history_id: str | None = None
 
     async def send_email(self, to: str, subject: str, body: str, body_type: str = "plain", thread_id: str | None = None) -> dict[str, Any]:
         """
@@ -186,13 +323,31 @@ class GoogleMailApp(APIApplication):
                 - thread_id (str | None): The ID of the email thread this message belongs to.
                 - attachments (list[dict]): A list of attachments, each represented as a dictionary
                 with metadata (e.g., filename, MIME type, attachment ID).
-        
+
         Tags:
             retrieve, email, format, api, gmail, message, important, body, content, attachments
         """
+        cached = self.message_cache.get(message_id, "full")
+        if cached is not None:
+            return cached
         url = f"{self.base_api_url}/messages/{message_id}"
         response = await self._aget(url)
         raw_data = self._handle_response(response)
+        message = self._format_message(message_id, raw_data)
+        self.message_cache.put(message_id, "full", None, message)
+        return message
+
+    def _format_message(self, message_id: str, raw_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Converts a raw Gmail message resource into the dictionary returned by `get_message_details`.
+
+        Args:
+            message_id: The message ID
+            raw_data: The message resource, in any format (full, metadata or minimal)
+
+        Returns:
+            dict: The formatted message; headers and body fall back to placeholders or the snippet when the format omits them
+        """
         headers = {}
         for header in raw_data.get("payload", {}).get("headers", []):
             name = header.get("name", "")
@@ -311,11 +466,289 @@ class GoogleMailApp(APIApplication):
             logger.error(f"Error decoding base64 data: {str(e)}")
             return f"[Unable to decode content: {str(e)}]"
 
+    def _build_batch_body(self, boundary: str, paths: list[str]) -> bytes:
+        """
+        Builds a multipart/mixed body for the Gmail batch endpoint with one GET sub-request per path.
+
+        Args:
+            boundary: The multipart boundary
+            paths: Request paths (with query strings) relative to https://gmail.googleapis.com
+
+        Returns:
+            bytes: The encoded request body; each part's Content-ID is the path's index
+        """
+        lines = []
+        for index, path in enumerate(paths):
+            lines += [f"--{boundary}", "Content-Type: application/http", f"Content-ID: <{index}>", "", f"GET {path}", ""]
+        lines.append(f"--{boundary}--")
+        return "\r\n".join(lines).encode("utf-8")
+
+    def _parse_batch_response(self, content_type: str, content: bytes) -> dict[int, tuple[int, Any]]:
+        """
+        Splits a Gmail batch response into its sub-responses.
+
+        Args:
+            content_type: The response's Content-Type header, which carries the multipart boundary
+            content: The raw response body
+
+        Returns:
+            dict: Status code and decoded JSON body (or None) per sub-request index, keyed by the index
+                  sent as its Content-ID
+        """
+        boundary = content_type.split("boundary=", 1)[1].split(";", 1)[0].strip().strip('"')
+        results = {}
+        for part in content.split(f"--{boundary}".encode()):
+            if b"HTTP/" not in part:
+                continue
+            part_headers, _, http_response = part.partition(b"\r\n\r\n")
+            index = None
+            for line in part_headers.decode("utf-8", "replace").splitlines():
+                name, _, value = line.partition(":")
+                if name.strip().lower() == "content-id":
+                    # Responses echo the request ID as <response-ID>
+                    index = int(value.strip().strip("<>").rsplit("-", 1)[-1])
+            status_line, _, rest = http_response.partition(b"\r\n")
+            _, _, body = rest.partition(b"\r\n\r\n")
+            status = int(status_line.split()[1])
+            try:
+                payload = json.loads(body) if body.strip() else None
+            except ValueError:
+                payload = None
+            if index is not None:
+                results[index] = (status, payload)
+        return results
+
+    async def _batch_get(self, paths: list[str]) -> list[tuple[int, Any]]:
+        """
+        Sends GET requests through the Gmail batch endpoint, in calls of up to `BATCH_MAX_REQUESTS` sub-requests with at most `BATCH_MAX_CONCURRENCY` calls in flight. Sub-requests that come back rate limited or with a transient error are retried in later rounds with exponential backoff.
+
+        Args:
+            paths: Request paths (with query strings) relative to https://gmail.googleapis.com
+
+        Returns:
+            list: (status code, decoded JSON body) per path, in the same order
+        """
+        results: list[tuple[int, Any]] = [(0, None)] * len(paths)
+        slots = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+
+        async def send(indices: list[int]) -> None:
+            boundary = f"batch_{uuid.uuid4().hex}"
+            body = self._build_batch_body(boundary, [paths[i] for i in indices])
+            try:
+                async with slots:
+                    response = await self._apost(
+                        f"{self.base_url}/batch/gmail/v1", data=body, content_type=f"multipart/mixed; boundary={boundary}"
+                    )
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                # A throttled batch call is retried as a whole with the next round
+                if e.response.status_code in BATCH_RETRY_STATUS_CODES:
+                    return
+                raise
+            for position, result in self._parse_batch_response(response.headers.get("content-type", ""), response.content).items():
+                results[indices[position]] = result
+
+        remaining = list(range(len(paths)))
+        for attempt in range(BATCH_MAX_RETRIES + 1):
+            if attempt:
+                delay = 2 ** (attempt - 1)
+                logger.warning(f"Retrying {len(remaining)} rate-limited Gmail batch sub-requests in {delay}s")
+                await asyncio.sleep(delay)
+            chunks = [remaining[i : i + BATCH_MAX_REQUESTS] for i in range(0, len(remaining), BATCH_MAX_REQUESTS)]
+            await asyncio.gather(*(send(chunk) for chunk in chunks))
+            remaining = [i for i in remaining if results[i][0] in BATCH_RETRY_STATUS_CODES or results[i][0] == 0]
+            if not remaining:
+                break
+        return results
+
+    async def get_messages_details(
+        self,
+        message_ids: list[str],
+        format: str = "full",
+        metadata_headers: list[str] | None = None,
+        fields: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Retrieves many emails by ID through Gmail's batch endpoint, packing up to 100 lookups into each HTTP call and keeping only a few calls in flight. Messages already in the local message cache are served from it, so only new messages are downloaded. Each message is formatted like `get_message_details`; a `metadata` or `minimal` format (or a `fields` mask) skips downloading bodies when only headers are needed.
+
+        Args:
+            message_ids: The IDs of the messages to retrieve
+            format: "full" (headers, body and attachments), "metadata" (headers and snippet only) or "minimal" (IDs, labels and snippet). Defaults to "full".
+            metadata_headers: Headers to return with format="metadata". Defaults to From, To, Date and Subject.
+            fields: Optional partial-response field mask applied to each message. Example: "id,threadId,snippet,payload/headers"
+
+        Returns:
+            A list of message dictionaries in the order of `message_ids` (messages that could not be retrieved are skipped), each with message_id, from, to, date, subject, body, thread_id and attachments
+
+        Raises:
+            ValueError: When format is not one of "full", "metadata" or "minimal"
+            HTTPStatusError: When a batch call itself fails
+
+        Tags:
+            retrieve, email, batch, gmail, message, bulk
+        """
+        if format not in MESSAGE_FORMATS:
+            raise ValueError(f"format must be one of {', '.join(MESSAGE_FORMATS)}")
+        if not message_ids:
+            return []
+        query: list[tuple[str, str]] = [("format", format)]
+        if format == "metadata":
+            query += [("metadataHeaders", header) for header in metadata_headers or DEFAULT_METADATA_HEADERS]
+        if fields:
+            query.append(("fields", fields))
+        query_string = urlencode(query)
+
+        found = {}
+        missing = []
+        for message_id in dict.fromkeys(message_ids):
+            cached = self.message_cache.get(message_id, format, fields)
+            if cached is not None:
+                found[message_id] = cached
+            else:
+                missing.append(message_id)
+
+        paths = [f"/gmail/v1/users/me/messages/{message_id}?{query_string}" for message_id in missing]
+        for message_id, (status, raw_data) in zip(missing, await self._batch_get(paths) if paths else [], strict=True):
+            if status == 200 and isinstance(raw_data, dict):
+                found[message_id] = self._format_message(message_id, raw_data)
+                self.message_cache.put(message_id, format, fields, found[message_id])
+            else:
+                error = raw_data.get("error", {}).get("message") if isinstance(raw_data, dict) else None
+                logger.error(f"Error retrieving message {message_id}: HTTP {status} {error or ''}".rstrip())
+        return [found[message_id] for message_id in message_ids if message_id in found]
+
+    async def _list_history(self, start_history_id: str, label_id: str | None = None) -> dict[str, Any] | None:
+        """
+        Pages through `users.history.list` from a history ID and folds the records into net changes.
+
+        Args:
+            start_history_id: The history ID to list changes after
+            label_id: Only return changes to messages with this label
+
+        Returns:
+            dict: The latest history ID and the added message IDs, deleted message IDs and current label IDs of
+                  relabelled messages, or None if the start history ID is too old and a full sync is needed
+        """
+        url = f"{self.base_api_url}/history"
+        params: dict[str, Any] = {"startHistoryId": start_history_id, "historyType": list(HISTORY_TYPES), "maxResults": 500}
+        if label_id:
+            params["labelId"] = label_id
+
+        added: dict[str, None] = {}
+        deleted: dict[str, None] = {}
+        labels: dict[str, list[str]] = {}
+        history_id = start_history_id
+        while True:
+            try:
+                response = await self._aget(url, params=params)
+                data = self._handle_response(response)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 404:
+                    return None
+                raise
+            for record in data.get("history", []):
+                for entry in record.get("messagesAdded", []):
+                    added[entry["message"]["id"]] = None
+                for entry in record.get("messagesDeleted", []):
+                    message_id = entry["message"]["id"]
+                    labels.pop(message_id, None)
+                    # A message added and deleted within the window is not reported at all
+                    if message_id in added:
+                        del added[message_id]
+                    else:
+                        deleted[message_id] = None
+                for entry in record.get("labelsAdded", []) + record.get("labelsRemoved", []):
+                    message = entry["message"]
+                    if message["id"] not in deleted:
+                        labels[message["id"]] = message.get("labelIds", [])
+            history_id = data.get("historyId", history_id)
+            if not data.get("nextPageToken"):
+                break
+            params["pageToken"] = data["nextPageToken"]
+
+        return {"history_id": history_id, "added": list(added), "deleted": list(deleted), "labels": labels}
+
+    async def sync_messages(
+        self,
+        history_id: str | None = None,
+        q: str | None = None,
+        max_results: int = 100,
+        label_id: str | None = None,
+        format: str = "metadata",
+    ) -> dict[str, Any]:
+        """
+        Incrementally syncs the mailbox: returns only the messages added, deleted or relabelled since the last sync, using Gmail's history API instead of re-listing and re-downloading messages. The first call (or a call whose history ID has expired) performs a full sync of the newest messages matching `q`; later calls cost one small history request plus downloads of genuinely new messages, since details are served from the local message cache. Prefer this over repeated `list_messages` polling with `newer_than:` queries.
+
+        Args:
+            history_id: History ID to sync from, as returned by a previous call. Defaults to the history ID reached by this app's last sync.
+            q: Gmail search query used for a full sync (e.g. 'newer_than:7d'); incremental syncs report every change, optionally limited by label_id
+            max_results: Maximum number of messages returned by a full sync (max 500, default 100)
+            label_id: Only report changes to messages with this label ID (e.g. 'INBOX')
+            format: Message format for returned messages: "full", "metadata" (default) or "minimal"
+
+        Returns:
+            A dictionary with the following keys:
+                - history_id (str): The mailbox history ID to pass to the next sync.
+                - full_sync (bool): True when the messages were listed from scratch rather than from history.
+                - added (list[dict]): New messages, formatted like `get_message_details`.
+                - deleted (list[str]): IDs of messages deleted since the last sync.
+                - labels_changed (list[dict]): Messages whose labels changed, each with message_id and label_ids.
+
+        Raises:
+            ValueError: When format is not one of "full", "metadata" or "minimal"
+            HTTPStatusError: When a Gmail API request fails
+
+        Tags:
+            sync, incremental, history, messages, gmail, poll, cache
+        """
+        if format not in MESSAGE_FORMATS:
+            raise ValueError(f"format must be one of {', '.join(MESSAGE_FORMATS)}")
+        start_history_id = history_id or self._history_id
+
+        changes = await self._list_history(start_history_id, label_id) if start_history_id else None
+        if changes is None:
+            if start_history_id:
+                logger.info(f"Gmail history {start_history_id} has expired, running a full sync")
+            # Read the history ID first so changes made while listing are picked up by the next sync
+            profile = await self.get_profile()
+            listing = await self.list_messages(max_results=max_results, q=q, format=format, label_ids=[label_id] if label_id else None)
+            self._history_id = str(profile.get("historyId"))
+            return {
+                "history_id": self._history_id,
+                "full_sync": True,
+                "added": listing["messages"],
+                "deleted": [],
+                "labels_changed": [],
+            }
+
+        for message_id in changes["deleted"]:
+            self.message_cache.discard(message_id)
+        added = await self.get_messages_details(changes["added"], format=format)
+        self._history_id = str(changes["history_id"])
+        logger.info(
+            f"Gmail sync to history {self._history_id}: {len(added)} added, {len(changes['deleted'])} deleted, "
+            f"{len(changes['labels'])} relabelled"
+        )
+        return {
+            "history_id": self._history_id,
+            "full_sync": False,
+            "added": added,
+            "deleted": changes["deleted"],
+            "labels_changed": [{"message_id": message_id, "label_ids": label_ids} for message_id, label_ids in changes["labels"].items()],
+        }
+
     async def list_messages(
-        self, max_results: int = 10, q: str | None = None, include_spam_trash: bool = False, page_token: str | None = None
+        self,
+        max_results: int = 10,
+        q: str | None = None,
+        include_spam_trash: bool = False,
+        page_token: str | None = None,
+        format: str = "full",
+        fields: str | None = None,
+        label_ids: list[str] | None = None,
     ) -> dict[str, Any]:
         """
-        Fetches a paginated list of detailed email messages using optional search queries. It concurrently retrieves full content (sender, subject, body) for each message, returning the results and a pagination token. This differs from `get_message_details`, which fetches only a single message.
+        Fetches a paginated list of detailed email messages using optional search queries. Message details are retrieved through Gmail's batch endpoint (up to 100 messages per HTTP call, with only a few calls in flight) rather than one request per message, returning the results and a pagination token. Use format="metadata" for list views that only need sender, subject and date, so bodies are not downloaded. This differs from `get_message_details`, which fetches only a single message.
 
         Args:
             max_results: Maximum number of messages to return (max 500, default 20)
@@ -337,6 +770,10 @@ class GoogleMailApp(APIApplication):
                     - 'has:attachment' for emails with attachments
                     - 'is:unread' for unread emails
             include_spam_trash: Boolean flag to include messages from spam and trash folders (default False)
+            page_token: Token from a previous call's next_page_token to fetch the following page
+            format: "full" (default) for bodies and attachments, "metadata" for From/To/Date/Subject headers with the snippet as body, or "minimal" for IDs and snippet only
+            fields: Optional partial-response field mask applied to each message. Example: "id,threadId,snippet,payload/headers"
+            label_ids: Only return messages with all of these label IDs. Example: ["INBOX", "UNREAD"]
 
         Returns:
             A dictionary with the following keys:
@@ -359,7 +796,9 @@ class GoogleMailApp(APIApplication):
         Tags:
             list, messages, gmail, search, query, pagination, important
         """
-        url = f"{self.base_api_url}/messages?format=metadata"
+        if format not in MESSAGE_FORMATS:
+            raise ValueError(f"format must be one of {', '.join(MESSAGE_FORMATS)}")
+        url = f"{self.base_api_url}/messages"
         params: dict[str, Any] = {"maxResults": max_results}
         if q:
             params["q"] = q
@@ -367,20 +806,14 @@ class GoogleMailApp(APIApplication):
             params["includeSpamTrash"] = "true"
         if page_token:
             params["pageToken"] = page_token
+        if label_ids:
+            params["labelIds"] = label_ids
         logger.info(f"Retrieving messages list with params: {params}")
         response = await self._aget(url, params=params)
         data = self._handle_response(response)
         messages = data.get("messages", [])
         message_ids = [msg.get("id") for msg in messages if msg.get("id")]
-        detailed_messages = []
-        if message_ids:
-            tasks = [self.get_message_details(message_id) for message_id in message_ids]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Error retrieving message {message_ids[i]}: {str(result)}")
-                else:
-                    detailed_messages.append(result)
+        detailed_messages = await self.get_messages_details(message_ids, format=format, fields=fields)
         return {"messages": detailed_messages, "next_page_token": data.get("nextPageToken")}
 
     async def get_email_thread(self, thread_id: str) -> dict[str, Any]:
@@ -788,6 +1221,120 @@ class GoogleMailApp(APIApplication):
         response = await self._aget(url, params=query_params)
         return self._handle_response(response)
 
+    async def download_attachment(
+        self,
+        message_id: str,
+        attachment_id: str,
+        destination_dir: str,
+        filename: str | None = None,
+        chunk_size: int = ATTACHMENT_CHUNK_SIZE,
+    ) -> dict[str, Any]:
+        """
+        Downloads an email attachment straight to a file instead of returning its base64 content inline like `get_attachment`. The response is streamed and decoded in fixed-size chunks, so memory use stays flat regardless of attachment size, and the file only appears at its final path once fully written.
+
+        Args:
+            message_id: The ID of the message containing the attachment
+            attachment_id: The attachment ID, as listed in a message's `attachments` by `get_message_details`
+            destination_dir: Directory to save the file in (created if missing)
+            filename: File name to save as. Defaults to "attachment-" followed by a short digest of the attachment ID.
+            chunk_size: Bytes read from the network per step. Defaults to 1 MiB.
+
+        Returns:
+            A dictionary with message_id, attachment_id, path (absolute path of the saved file), size (bytes written) and sha256 (hex digest of the content)
+
+        Raises:
+            HTTPStatusError: When the Gmail API request fails
+            ValueError: When the response does not contain attachment data
+
+        Tags:
+            download, attachment, file, stream, gmail, message
+        """
+        os.makedirs(destination_dir, exist_ok=True)
+        path = os.path.abspath(os.path.join(destination_dir, os.path.basename(filename or default_attachment_name(attachment_id))))
+        url = f"{self.base_api_url}/messages/{message_id}/attachments/{attachment_id}"
+
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+
+                def write(block: bytes) -> None:
+                    nonlocal size
+                    f.write(block)
+                    digest.update(block)
+                    size += len(block)
+
+                decoder = AttachmentStreamDecoder(write)
+                async with self.get_async_client() as client, client.stream("GET", url) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        decoder.feed(chunk)
+                decoder.close()
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        logger.info(f"Saved attachment {attachment_id} of message {message_id} to {path} ({size} bytes)")
+        return {"message_id": message_id, "attachment_id": attachment_id, "path": path, "size": size, "sha256": digest.hexdigest()}
+
+    async def download_thread_attachments(
+        self, thread_id: str, destination_dir: str, max_concurrency: int = ATTACHMENT_MAX_CONCURRENCY
+    ) -> dict[str, Any]:
+        """
+        Downloads every attachment in an email thread to a directory, streaming several at once. Each file is written with `download_attachment`, so attachments never sit in memory; files with the same name are saved as "name (2).ext" and so on.
+
+        Args:
+            thread_id: The ID of the thread whose attachments to download
+            destination_dir: Directory to save the files in (created if missing)
+            max_concurrency: Maximum number of attachments downloaded at once. Defaults to 4.
+
+        Returns:
+            A dictionary with thread_id, files (one entry per saved attachment, as returned by `download_attachment`, plus filename and mime_type) and errors (attachments that failed, with the error message)
+
+        Raises:
+            HTTPStatusError: When the thread cannot be retrieved
+            ValueError: When max_concurrency is less than 1
+
+        Tags:
+            download, attachments, thread, file, stream, gmail, bulk
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        thread = await self.get_email_thread(thread_id)
+
+        attachments = []
+        used_names: set[str] = set()
+        for message in thread.get("messages", []):
+            for attachment in self._extract_attachments(message.get("payload", {})):
+                name = os.path.basename(attachment["filename"]) or default_attachment_name(attachment["attachment_id"])
+                stem, ext = os.path.splitext(name)
+                counter = 1
+                while name.lower() in used_names:
+                    counter += 1
+                    name = f"{stem} ({counter}){ext}"
+                used_names.add(name.lower())
+                attachments.append((message["id"], attachment, name))
+
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def download(message_id: str, attachment: dict[str, Any], name: str) -> dict[str, Any]:
+            async with slots:
+                result = await self.download_attachment(message_id, attachment["attachment_id"], destination_dir, name)
+            return {**result, "filename": attachment["filename"], "mime_type": attachment["mime_type"]}
+
+        results = await asyncio.gather(*(download(*item) for item in attachments), return_exceptions=True)
+        files = []
+        errors = []
+        for (message_id, attachment, _), result in zip(attachments, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error downloading attachment {attachment['filename']} of message {message_id}: {result}")
+                errors.append({"message_id": message_id, "filename": attachment["filename"], "error": str(result)})
+            else:
+                files.append(result)
+        return {"thread_id": thread_id, "files": files, "errors": errors}
+
     async def update_label(
         self,
         userId,
@@ -1263,7 +1810,9 @@ class GoogleMailApp(APIApplication):
             self.get_draft,
             self.list_drafts,
             self.get_message_details,
+            self.get_messages_details,
             self.list_messages,
+            self.sync_messages,
             self.get_email_thread,
             self.list_labels,
             self.create_label,
@@ -1272,6 +1821,8 @@ class GoogleMailApp(APIApplication):
             self.trash_message,
             self.untrash_message,
             self.get_attachment,
+            self.download_attachment,
+            self.download_thread_attachments,
             self.update_label,
             self.delete_label,
             self.get_filter,
@@ -1,7 +1,35 @@
+import asyncio
+import random
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from contextlib import aclosing
 from typing import Any
+import httpx
+from loguru import logger
 from universal_mcp.applications.application import APIApplication
 from universal_mcp.integrations import Integration
-from universal_mcp.applications.google_sheet.helper import analyze_sheet_for_tables, analyze_table_schema
+from universal_mcp.applications.google_sheet.helper import (
+    BULK_WRITE_MAX_REQUEST_BYTES,
+    BULK_WRITE_MAX_ROWS_PER_REQUEST,
+    DEFAULT_GRID_COLUMNS,
+    DEFAULT_GRID_ROWS,
+    SAMPLING_STRATEGIES,
+    SCAN_MAX_SHEETS,
+    a1_cell,
+    a1_range_bounds,
+    analyze_table_schema,
+    block_range_for_sheet,
+    iter_row_chunks,
+    parse_a1_cell,
+    quoted_cell_range,
+    scan_block_rows,
+    scan_sheet_for_tables,
+)
+
+# Statuses retried by bulk writes: rate limiting and transient backend errors
+RETRY_STATUS_CODES = (429, 500, 503)
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 64.0
 
 
 class GoogleSheetApp(APIApplication):
@@ -38,12 +66,13 @@ class GoogleSheetApp(APIApplication):
         payload["Note"] = "You must load and call other google_sheet content functions (like `google_sheet__write_values_to_sheet`)"
         return payload
 
-    async def get_spreadsheet_metadata(self, spreadsheetId: str) -> dict[str, Any]:
+    async def get_spreadsheet_metadata(self, spreadsheetId: str, fields: str | None = None) -> dict[str, Any]:
         """
         Retrieves a spreadsheet's metadata and structural properties, such as sheet names, IDs, and named ranges, using its unique ID. This function intentionally excludes cell data, distinguishing it from `get_values` which fetches the actual content within cells.
 
         Args:
             spreadsheetId: The unique identifier of the Google Spreadsheet to retrieve (found in the spreadsheet's URL)
+            fields: Optional field mask limiting the response to the listed fields. Example: "sheets.properties(sheetId,title)"
 
         Returns:
             A dictionary containing the full spreadsheet metadata and contents, including properties, sheets, named ranges, and other spreadsheet-specific information from the Google Sheets API
@@ -57,7 +86,10 @@ class GoogleSheetApp(APIApplication):
             get, retrieve, spreadsheet, api, metadata, read, important
         """
         url = f"{self.base_url}/{spreadsheetId}"
-        response = await self._aget(url)
+        params = {}
+        if fields:
+            params["fields"] = fields
+        response = await self._aget(url, params=params)
         return self._handle_response(response)
 
     async def get_values(
@@ -1117,15 +1149,8 @@ class GoogleSheetApp(APIApplication):
             raise ValueError("min_columns must be at least 1")
         if not 0 <= min_confidence <= 1:
             raise ValueError("min_confidence must be between 0.0 and 1.0")
-        spreadsheet = await self.get_spreadsheet_metadata(spreadsheetId)
         tables = []
-        for sheet in spreadsheet.get("sheets", []):
-            sheet_properties = sheet.get("properties", {})
-            sheet_id = sheet_properties.get("sheetId")
-            sheet_title = sheet_properties.get("title", "Sheet1")
-            sheet_tables = await analyze_sheet_for_tables(
-                self.get_values, spreadsheetId, sheet_id, sheet_title, min_rows, min_columns, min_confidence
-            )
+        async for sheet_tables in self._iter_tables_by_sheet(spreadsheetId, min_rows, min_columns, min_confidence):
             tables.extend(sheet_tables)
         return {
             "spreadsheetId": spreadsheetId,
@@ -1134,24 +1159,84 @@ class GoogleSheetApp(APIApplication):
             "analysis_parameters": {"min_rows": min_rows, "min_columns": min_columns},
         }
 
+    async def _iter_tables_by_sheet(
+        self, spreadsheetId: str, min_rows: int, min_columns: int, min_confidence: float, sheet_name: str | None = None
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Detects table regions anywhere in every grid sheet of a spreadsheet, yielding each sheet's tables in sheet order. A metadata call limited by a `fields` mask supplies each sheet's grid size. Sheets are scanned in groups of `SCAN_MAX_SHEETS`: one `values:batchGet` fetches the first row block of each sheet in the group, and sheets taller than one block keep streaming the rest in blocks sized from their column count. Each first block is released once its sheet has consumed it, so memory depends on the group size rather than the number of sheets, and a caller that stops iterating early skips the remaining groups.
+
+        Yields:
+            The list of discovered tables for each sheet
+        """
+        spreadsheet = await self.get_spreadsheet_metadata(
+            spreadsheetId, fields="sheets.properties(sheetId,title,sheetType,gridProperties(rowCount,columnCount))"
+        )
+        sheets = []
+        for sheet in spreadsheet.get("sheets", []):
+            sheet_properties = sheet.get("properties", {})
+            sheet_title = sheet_properties.get("title", "Sheet1")
+            if sheet_name and sheet_title != sheet_name:
+                continue
+            # Object sheets (charts) have no cells and would fail the whole batch
+            if sheet_properties.get("sheetType", "GRID") != "GRID":
+                continue
+            grid = sheet_properties.get("gridProperties", {})
+            sheets.append(
+                (
+                    sheet_properties.get("sheetId", 0),
+                    sheet_title,
+                    grid.get("rowCount", DEFAULT_GRID_ROWS),
+                    grid.get("columnCount", DEFAULT_GRID_COLUMNS),
+                )
+            )
+        for group_start in range(0, len(sheets), SCAN_MAX_SHEETS):
+            group = sheets[group_start : group_start + SCAN_MAX_SHEETS]
+            first_blocks = [
+                block_range_for_sheet(sheet_title, 1, min(scan_block_rows(column_count), row_count), column_count)
+                for _, sheet_title, row_count, column_count in group
+            ]
+            value_ranges = (await self.batch_get_values_by_range(spreadsheetId, first_blocks)).get("valueRanges", [])
+            scans = []
+            for sheet_id, sheet_title, row_count, column_count in group:
+                # Move each block into its scan, which drops it once consumed
+                first_block = value_ranges.pop(0).get("values", []) if value_ranges else []
+                scans.append(
+                    scan_sheet_for_tables(
+                        self.get_values,
+                        spreadsheetId,
+                        sheet_id,
+                        sheet_title,
+                        row_count,
+                        column_count,
+                        min_rows,
+                        min_columns,
+                        min_confidence,
+                        first_block=first_block,
+                    )
+                )
+            del first_block
+            for sheet_tables in await asyncio.gather(*scans):
+                yield sheet_tables
+
     async def analyze_table_schema(
-        self, spreadsheetId: str, table_name: str, sheet_name: str | None = None, sample_size: int = 50
+        self, spreadsheetId: str, table_name: str, sheet_name: str | None = None, sample_size: int = 50, sampling: str = "head"
     ) -> dict[str, Any]:
         """
-        Infers a specified table's schema by analyzing a data sample. After locating the table by name (a value discovered via `discover_tables`), this function determines the most likely data type and properties for each column, providing a detailed structural breakdown of its content.
+        Infers a specified table's schema by analyzing a data sample. After locating the table by name (a value discovered via `discover_tables`), this function determines the most likely data type (BOOLEAN, INTEGER, DECIMAL, PERCENT, CURRENCY, DATE, EMAIL, URL or TEXT) and properties for each column, providing a detailed structural breakdown of its content.
 
         Args:
             spreadsheetId: Google Sheets ID from the URL (e.g., '1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms')
             table_name: Specific table name from LIST_TABLES response (e.g., 'Sales_Data', 'Employee_List'). Use 'auto' to analyze the largest/most prominent table
             sheet_name: Sheet/tab name if table_name is ambiguous across multiple sheets
             sample_size: Number of rows to sample for type inference (1-1000, default 50)
+            sampling: Which rows to sample: 'head' (first rows, default), 'stratified' (rows spread evenly across the whole table) or 'full' (every row, ignoring sample_size)
 
         Returns:
             A dictionary containing the table schema with column names, types, and constraints
 
         Raises:
             HTTPError: When the API request fails due to invalid parameters or insufficient permissions
-            ValueError: When spreadsheetId is empty, table_name is empty, or sample_size is invalid
+            ValueError: When spreadsheetId is empty, table_name is empty, or sample_size or sampling is invalid
 
         Tags:
             schema, analyze, table, structure, types, columns
@@ -1162,34 +1247,24 @@ class GoogleSheetApp(APIApplication):
             raise ValueError("table_name cannot be empty")
         if not 1 <= sample_size <= 1000:
             raise ValueError("sample_size must be between 1 and 1000")
-        spreadsheet = await self.get_spreadsheet_metadata(spreadsheetId)
+        if sampling not in SAMPLING_STRATEGIES:
+            raise ValueError(f"sampling must be one of {', '.join(SAMPLING_STRATEGIES)}")
         target_table = None
-        for sheet in spreadsheet.get("sheets", []):
-            sheet_properties = sheet.get("properties", {})
-            sheet_title = sheet_properties.get("title", "Sheet1")
-            if sheet_name and sheet_title != sheet_name:
-                continue
-            sheet_tables = await analyze_sheet_for_tables(
-                self.get_values,
-                spreadsheetId,
-                sheet_properties.get("sheetId", 0),
-                sheet_title,
-                min_rows=2,
-                min_columns=1,
-                min_confidence=0.3,
-            )
-            for table in sheet_tables:
-                if table_name == "auto":
-                    if target_table is None or table["rows"] * table["columns"] > target_table["rows"] * target_table["columns"]:
+        async with aclosing(self._iter_tables_by_sheet(spreadsheetId, 2, 1, 0.3, sheet_name=sheet_name)) as sheets:
+            async for sheet_tables in sheets:
+                for table in sheet_tables:
+                    if table_name == "auto":
+                        if target_table is None or table["rows"] * table["columns"] > target_table["rows"] * target_table["columns"]:
+                            target_table = table
+                    elif table["table_name"] == table_name:
                         target_table = table
-                elif table["table_name"] == table_name:
-                    target_table = table
+                        break
+                # Stop scanning further sheets once the named table is found
+                if target_table and table_name != "auto":
                     break
-            if target_table and table_name != "auto":
-                break
         if not target_table:
             raise ValueError(f"Table '{table_name}' not found in spreadsheet")
-        return await analyze_table_schema(self.get_values, spreadsheetId, target_table, sample_size)
+        return await analyze_table_schema(self.get_values, spreadsheetId, target_table, sample_size, sampling)
 
     async def set_basic_filter(self, spreadsheetId: str, filter: dict) -> dict[str, Any]:
         """
@@ -1565,6 +1640,162 @@ class GoogleSheetApp(APIApplication):
         response = await self._apost(url, data=request_body)
         return self._handle_response(response)
 
+    async def _send_with_retry(self, send, max_retries: int) -> tuple[dict[str, Any], int]:
+        """
+        Runs a request, retrying rate-limited (429) and transient 5xx responses with exponential backoff and jitter. A `Retry-After` header, when present, sets the delay.
+
+        Returns:
+            The response payload and the number of retries it took
+        """
+        attempt = 0
+        while True:
+            try:
+                return await send(), attempt
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in RETRY_STATUS_CODES or attempt >= max_retries:
+                    raise
+                retry_after = e.response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = float(retry_after)
+                else:
+                    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt) * random.uniform(0.5, 1.0)
+                attempt += 1
+                logger.warning(
+                    f"Sheets request got HTTP {e.response.status_code}, retrying in {delay:.1f}s (attempt {attempt}/{max_retries})"
+                )
+                await asyncio.sleep(delay)
+
+    async def bulk_write_values(
+        self,
+        spreadsheetId: str,
+        sheet_name: str,
+        rows: Iterable[list[Any]] | AsyncIterable[list[Any]],
+        first_cell_location: str = "A1",
+        mode: str = "update",
+        value_input_option: str = "USER_ENTERED",
+        max_request_bytes: int = BULK_WRITE_MAX_REQUEST_BYTES,
+        max_rows_per_request: int = BULK_WRITE_MAX_ROWS_PER_REQUEST,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+    ) -> dict[str, Any]:
+        """
+        Writes any number of rows to a sheet in one call, splitting them into request-size-bounded chunks. Rows may be a list or a (sync or async) generator and are consumed lazily, so large exports stream into the sheet without being held in memory. In 'update' mode chunks target fixed, non-overlapping row ranges and are sent concurrently; rate-limited (429) and transient server errors are retried with exponential backoff. Unlike `write_values_to_sheet` and `append_values`, which send one request with the whole matrix, this scales to 100k+ rows.
+
+        Args:
+            spreadsheetId: The unique identifier of the Google Sheets spreadsheet. Example: "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"
+            sheet_name: The name of the sheet to write to. Example: "Sheet1"
+            rows: The rows to write, each a list of cell values. Example: [['Item', 'Cost'], ['Wheel', 20.5], ['Screw', 0.5]]
+            first_cell_location: In 'update' mode, the top-left cell to write from; in 'append' mode, a cell within the table to append after. Defaults to "A1". Example: "B2"
+            mode: 'update' to overwrite cells starting at first_cell_location, or 'append' to add the rows after the existing table. Appended chunks are sent one at a time, in order, each after the rows already appended. Defaults to 'update'.
+            value_input_option: How input data is interpreted: 'USER_ENTERED' (parsed as if typed) or 'RAW' (stored as-is). Defaults to 'USER_ENTERED'.
+            max_request_bytes: Approximate JSON size limit of the values sent per request. Defaults to 2,000,000.
+            max_rows_per_request: Maximum number of rows per request. Defaults to 10,000.
+            max_concurrency: Maximum number of requests in flight at once. Defaults to 4.
+            max_retries: Maximum number of retries per request on 429/5xx responses. Defaults to 5.
+
+        Returns:
+            A dictionary with the written range, total rows and cells updated, number of requests and retries, elapsed seconds and throughput in rows per second
+
+        Raises:
+            HTTPError: When a request fails with a non-retryable status or runs out of retries
+            ValueError: When spreadsheetId or sheet_name is empty, or an option is invalid
+
+        Tags:
+            bulk, write, append, update, values, spreadsheet, import, export
+        """
+        if not spreadsheetId:
+            raise ValueError("spreadsheetId cannot be empty")
+        if not sheet_name:
+            raise ValueError("sheet_name cannot be empty")
+        if mode not in ["update", "append"]:
+            raise ValueError('mode must be either "update" or "append"')
+        if value_input_option not in ["RAW", "USER_ENTERED"]:
+            raise ValueError('value_input_option must be either "RAW" or "USER_ENTERED"')
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        column, first_row = parse_a1_cell(first_cell_location)
+        next_row = first_row
+
+        started = time.monotonic()
+        stats = {"rows": 0, "cells": 0, "requests": 0, "retries": 0, "last_row": next_row - 1, "last_column": column}
+        params = {"valueInputOption": value_input_option}
+        append_url = f"{self.base_url}/{spreadsheetId}/values/{quoted_cell_range(sheet_name, column, first_row)}:append"
+
+        def record(result: dict[str, Any], retries: int, rows_written: int) -> None:
+            stats["rows"] += rows_written
+            stats["cells"] += result.get("updatedCells", 0)
+            stats["requests"] += 1
+            stats["retries"] += retries
+            if result.get("updatedRange"):
+                _, _, end_column, end_row = a1_range_bounds(result["updatedRange"])
+                stats["last_row"] = max(stats["last_row"], end_row)
+                stats["last_column"] = max(stats["last_column"], end_column)
+            elapsed = time.monotonic() - started
+            logger.info(
+                f"Bulk write to {sheet_name}: {stats['rows']} rows in {elapsed:.1f}s ({stats['rows'] / max(elapsed, 1e-9):.0f} rows/s)"
+            )
+
+        async def write_chunk(chunk: list[list[Any]], row: int) -> None:
+            url = f"{self.base_url}/{spreadsheetId}/values/{quoted_cell_range(sheet_name, column, row)}"
+
+            async def send() -> dict[str, Any]:
+                return self._handle_response(await self._aput(url, data={"values": chunk}, params=params))
+
+            try:
+                result, retries = await self._send_with_retry(send, max_retries)
+                record(result, retries, len(chunk))
+            finally:
+                slots.release()
+
+        slots = asyncio.Semaphore(max_concurrency)
+        pending: set[asyncio.Task] = set()
+        chunks = iter_row_chunks(rows, max_request_bytes, max_rows_per_request)
+        try:
+            async for chunk in chunks:
+                if mode == "append":
+                    # Each append lands after the table as it stands, so chunks are appended one at a time, in order
+                    async def send_append(chunk=chunk) -> dict[str, Any]:
+                        return self._handle_response(await self._apost(append_url, data={"values": chunk}, params=params))
+
+                    result, retries = await self._send_with_retry(send_append, max_retries)
+                    updates = result.get("updates", {})
+                    record(updates, retries, len(chunk))
+                    if stats["requests"] == 1:
+                        column, first_row, _, _ = a1_range_bounds(updates["updatedRange"])
+                    continue
+
+                await slots.acquire()
+                # Stop feeding new chunks as soon as one has failed
+                for task in [task for task in pending if task.done()]:
+                    pending.discard(task)
+                    task.result()
+                pending.add(asyncio.create_task(write_chunk(chunk, next_row)))
+                next_row += len(chunk)
+
+            await asyncio.gather(*pending)
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            raise
+        finally:
+            await chunks.aclose()
+
+        elapsed = time.monotonic() - started
+        written_range = f"{sheet_name}!{a1_cell(column, first_row)}"
+        if stats["rows"]:
+            written_range += f":{a1_cell(stats['last_column'], stats['last_row'])}"
+        return {
+            "spreadsheet_id": spreadsheetId,
+            "mode": mode,
+            "range": written_range,
+            "updated_rows": stats["rows"],
+            "updated_cells": stats["cells"],
+            "requests": stats["requests"],
+            "retries": stats["retries"],
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(stats["rows"] / elapsed, 1) if elapsed > 0 else None,
+        }
+
     def list_tools(self):
         return [
             self.create_spreadsheet,
@@ -1586,6 +1817,7 @@ class GoogleSheetApp(APIApplication):
             self.copy_sheet_to_spreadsheet,
             self.write_values_to_sheet,
             self.append_values,
+            self.bulk_write_values,
             self.clear_basic_filter,
             self.delete_sheet,
             self.discover_tables,
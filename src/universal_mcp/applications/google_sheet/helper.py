@@ -2,38 +2,149 @@
 Helper functions for Google Sheets table detection and analysis.
 """
 
+import json
+import re
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from itertools import zip_longest
 from typing import Any
 
-
-async def analyze_sheet_for_tables(
+# Approximate number of cells fetched per block when scanning a sheet for tables
+SCAN_BLOCK_CELLS = 50_000
+# Minimum number of rows fetched per block, however wide the sheet
+SCAN_MIN_BLOCK_ROWS = 100
+# Grid size assumed when a sheet's gridProperties are unknown
+DEFAULT_GRID_ROWS = 100
+DEFAULT_GRID_COLUMNS = 26
+# Sheets scanned at once; their first blocks are fetched together in one batch request
+SCAN_MAX_SHEETS = 8
+
+# Bulk writes: request payloads are kept under ~2 MB, the size Google recommends
+BULK_WRITE_MAX_REQUEST_BYTES = 2_000_000
+BULK_WRITE_MAX_ROWS_PER_REQUEST = 10_000
+
+# Row sampling strategies for schema inference: the first rows, rows spread evenly
+# over the whole table, or every row
+SAMPLING_STRATEGIES = ("head", "stratified", "full")
+
+_NUMBER = r"[+-]?(?:\d{1,3}(?:,\d{3})+|\d+)"
+_CURRENCY = r"[$€£¥₹]"
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?"
+
+# Whole-cell patterns, each matched once against a column's distinct (stripped)
+# values joined by newlines, so ``^``/``$`` anchor each value. They have no
+# capturing groups, so ``findall`` returns the matching values themselves.
+_COLUMN_PATTERNS = {
+    "BOOLEAN": re.compile(r"^(?:true|false|yes|no|1|0)$", re.IGNORECASE | re.MULTILINE),
+    # Integers and decimals; decimals are the matches containing a "."
+    "NUMBER": re.compile(rf"^{_NUMBER}(?:\.\d+)?$|^[+-]?\.\d+$", re.MULTILINE),
+    "PERCENT": re.compile(rf"^{_NUMBER}(?:\.\d+)?\s*%$", re.MULTILINE),
+    "CURRENCY": re.compile(rf"^[+-]?{_CURRENCY}\s?{_NUMBER}(?:\.\d+)?$|^{_NUMBER}(?:\.\d+)?\s?{_CURRENCY}$", re.MULTILINE),
+    "DATE": re.compile(
+        r"^(?:"
+        r"\d{4}-\d{1,2}-\d{1,2}(?:[T ]\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?"
+        r"|\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4}"
+        r"|\d{4}/\d{1,2}/\d{1,2}"
+        rf"|{_MONTH}\s+\d{{1,2}}(?:st|nd|rd|th)?,?\s+\d{{2,4}}"
+        rf"|\d{{1,2}}(?:st|nd|rd|th)?\s+{_MONTH},?\s+\d{{2,4}}"
+        rf"|{_MONTH}\s+\d{{4}}"
+        r")$",
+        re.IGNORECASE | re.MULTILINE,
+    ),
+    "EMAIL": re.compile(r"^[\w.+-]+@[\w-]+(?:\.[\w-]+)+$", re.MULTILINE),
+    "URL": re.compile(r"^(?:https?://|ftp://|www\.)[^\s/$.?#]\S*$", re.IGNORECASE | re.MULTILINE),
+}
+_CURRENCY_SYMBOL = re.compile(_CURRENCY)
+_DIGIT = re.compile(r"\d")
+
+# Fills the gaps when transposing rows of different lengths
+_MISSING = object()
+
+# Share of non-empty values that must match for a column to get a type
+TYPE_THRESHOLD = 0.8
+# Dates are often written inconsistently, so a lower share is enough
+DATE_THRESHOLD = 0.6
+# Share of numeric values with a fractional part that makes a column DECIMAL
+DECIMAL_THRESHOLD = 0.3
+
+
+def scan_block_rows(column_count: int) -> int:
+    """Number of rows to fetch per block for a sheet with ``column_count`` columns."""
+    return max(SCAN_MIN_BLOCK_ROWS, SCAN_BLOCK_CELLS // max(column_count, 1))
+
+
+def block_range_for_sheet(sheet_title: str, first_row: int, last_row: int, column_count: int) -> str:
+    """A1 range for rows ``first_row``..``last_row`` (1-based, inclusive) across all of a sheet's columns."""
+    quoted_title = sheet_title.replace("'", "''")
+    last_column = _column_letter(column_count - 1)
+    return f"'{quoted_title}'!A{first_row}:{last_column}{last_row}"
+
+
+async def scan_sheet_for_tables(
     get_values_func,
     spreadsheet_id: str,
     sheet_id: int,
     sheet_title: str,
+    row_count: int,
+    column_count: int,
     min_rows: int,
     min_columns: int,
     min_confidence: float,
+    first_block: list[list] | None = None,
 ) -> list[dict]:
-    """Analyze a sheet to find potential tables."""
-    tables = []
+    """
+    Find tables anywhere in a sheet by streaming it in row blocks.
+
+    Blocks span every column and are sized from the sheet's grid so each request
+    stays around ``SCAN_BLOCK_CELLS`` cells. Only the current block and the running
+    statistics of the open region are held in memory, so very tall sheets can be
+    scanned without loading them whole.
+
+    Args:
+        get_values_func: Function to get values from spreadsheet
+        spreadsheet_id: The spreadsheet ID
+        sheet_id: The sheet ID
+        sheet_title: The sheet title
+        row_count: Number of rows in the sheet's grid
+        column_count: Number of columns in the sheet's grid
+        min_rows: Minimum number of rows for a table
+        min_columns: Minimum number of columns for a table
+        min_confidence: Minimum confidence score for a table
+        first_block: Values of the first block if already fetched (e.g. by a batch request)
+
+    Returns:
+        List of discovered tables
+    """
+    block_rows = scan_block_rows(column_count)
+    scanner = TableRegionScanner(min_rows, min_columns)
 
     try:
-        # Get sample data from the sheet (first 100 rows)
-        sample_range = f"{sheet_title}!A1:Z100"
-        sample_data = await get_values_func(spreadsheetId=spreadsheet_id, range=sample_range)
+        for start in range(0, max(row_count, 1), block_rows):
+            end = min(start + block_rows, row_count)
+            if start == 0 and first_block is not None:
+                values, first_block = first_block, None
+            else:
+                block_range = block_range_for_sheet(sheet_title, start + 1, end, column_count)
+                values = (await get_values_func(spreadsheetId=spreadsheet_id, range=block_range)).get("values", [])
 
-        values = sample_data.get("values", [])
-        if not values or len(values) < min_rows:
-            return tables
+            scanner.feed(values)
+            # The API omits trailing empty rows of a range
+            scanner.skip(end - start - len(values))
+
+        return _tables_from_regions(scanner.finish(), sheet_id, sheet_title, min_confidence)
 
-        # Find potential table regions
-        table_regions = await find_table_regions(values, min_rows, min_columns)
+    except Exception:
+        # If analysis fails for a sheet, continue with other sheets
+        return []
 
-        for i, region in enumerate(table_regions):
-            confidence = await calculate_table_confidence(values, region)
 
-            if confidence >= min_confidence:
-                table_info = {
+def _tables_from_regions(regions: list[dict], sheet_id: int, sheet_title: str, min_confidence: float) -> list[dict]:
+    """Build table descriptions for the regions that meet the confidence threshold."""
+    tables = []
+    for i, region in enumerate(regions):
+        if region["confidence"] >= min_confidence:
+            tables.append(
+                {
                     "table_id": f"{sheet_title}_table_{i + 1}",
                     "table_name": f"{sheet_title}_Table_{i + 1}",
                     "sheet_id": sheet_id,
@@ -44,19 +155,16 @@ async def analyze_sheet_for_tables(
                     "end_column": region["end_column"],
                     "rows": region["end_row"] - region["start_row"] + 1,
                     "columns": region["end_column"] - region["start_column"] + 1,
-                    "confidence": confidence,
-                    "range": f"{sheet_title}!{await get_column_letter(region['start_column'])}{region['start_row'] + 1}:{await get_column_letter(region['end_column'])}{region['end_row'] + 1}",
+                    "confidence": region["confidence"],
+                    "range": f"{sheet_title}!{_column_letter(region['start_column'])}{region['start_row'] + 1}:{_column_letter(region['end_column'])}{region['end_row'] + 1}",
                 }
-                tables.append(table_info)
-
-    except Exception:
-        # If analysis fails for a sheet, continue with other sheets
-        pass
-
+            )
     return tables
 
 
-async def analyze_table_schema(get_values_func, spreadsheet_id: str, table_info: dict, sample_size: int = 50) -> dict[str, Any]:
+async def analyze_table_schema(
+    get_values_func, spreadsheet_id: str, table_info: dict, sample_size: int = 50, sampling: str = "head"
+) -> dict[str, Any]:
     """
     Analyze table structure and infer column names, types, and constraints.
 
@@ -64,26 +172,31 @@ async def analyze_table_schema(get_values_func, spreadsheet_id: str, table_info:
         get_values_func: Function to get values from spreadsheet
         spreadsheet_id: The spreadsheet ID
         table_info: Dictionary containing table information from list_tables
-        sample_size: Number of rows to sample for type inference
+        sample_size: Number of rows (including the header) to sample for type inference
+        sampling: Which rows to sample, one of ``SAMPLING_STRATEGIES``
 
     Returns:
         Dictionary containing the table schema with column analysis
     """
     try:
-        # Get sample data from the table
-        sample_range = table_info["range"]
+        if sampling not in SAMPLING_STRATEGIES:
+            raise ValueError(f"sampling must be one of {', '.join(SAMPLING_STRATEGIES)}")
+
+        # Head sampling only needs the first rows of the table
+        if sampling == "head":
+            sample_range = _table_rows_range(table_info, sample_size)
+        else:
+            sample_range = _table_rows_range(table_info, table_info["rows"])
         sample_data = await get_values_func(spreadsheetId=spreadsheet_id, range=sample_range)
 
         values = sample_data.get("values", [])
         if not values:
             raise ValueError("No data found in the specified table")
 
-        # Limit sample size to available data
-        actual_sample_size = min(sample_size, len(values))
-        sample_values = values[:actual_sample_size]
+        sample_values = sample_rows(values, sample_size, sampling)
 
         # Analyze column structure
-        columns = await analyze_columns(sample_values)
+        columns = analyze_columns(sample_values)
 
         return {
             "spreadsheet_id": spreadsheet_id,
@@ -92,7 +205,8 @@ async def analyze_table_schema(get_values_func, spreadsheet_id: str, table_info:
             "table_range": table_info["range"],
             "total_rows": table_info["rows"],
             "total_columns": table_info["columns"],
-            "sample_size": actual_sample_size,
+            "sample_size": len(sample_values),
+            "sampling": sampling,
             "columns": columns,
             "schema_version": "1.0",
         }
@@ -101,7 +215,40 @@ async def analyze_table_schema(get_values_func, spreadsheet_id: str, table_info:
         raise ValueError(f"Failed to analyze table schema: {str(e)}")
 
 
-async def analyze_columns(sample_values: list[list[Any]]) -> list[dict]:
+def _table_rows_range(table_info: dict, row_count: int) -> str:
+    """A1 range for the first ``row_count`` rows of a discovered table."""
+    quoted_title = table_info["sheet_name"].replace("'", "''")
+    first_row = table_info["start_row"] + 1
+    last_row = min(table_info["end_row"] + 1, table_info["start_row"] + max(row_count, 1))
+    first_column = _column_letter(table_info["start_column"])
+    last_column = _column_letter(table_info["end_column"])
+    return f"'{quoted_title}'!{first_column}{first_row}:{last_column}{last_row}"
+
+
+def sample_rows(values: list[list], sample_size: int, sampling: str = "head") -> list[list]:
+    """
+    Pick the rows used for type inference, always keeping the header row first.
+
+    Args:
+        values: Table values, header row first
+        sample_size: Number of rows to keep, including the header (ignored for ``full``)
+        sampling: One of ``SAMPLING_STRATEGIES``
+
+    Returns:
+        The sampled rows, in table order
+    """
+    if sampling == "full" or len(values) <= sample_size:
+        return values
+    if sampling == "head" or sample_size < 2:
+        return values[:sample_size]
+
+    # One row from each of sample_size - 1 equal strata of the data rows
+    data_rows = len(values) - 1
+    strata = sample_size - 1
+    return [values[0]] + [values[1 + (i * data_rows) // strata] for i in range(strata)]
+
+
+def analyze_columns(sample_values: list[list[Any]]) -> list[dict]:
     """Analyze column structure and infer types."""
     if not sample_values:
         return []
@@ -112,17 +259,21 @@ async def analyze_columns(sample_values: list[list[Any]]) -> list[dict]:
 
     columns = []
 
+    # Transpose once; short rows simply have no value in their trailing columns
+    if data_rows and min(map(len, data_rows)) < len(headers):
+        table_columns = [[val for val in column if val is not _MISSING] for column in zip_longest(*data_rows, fillvalue=_MISSING)]
+    else:
+        table_columns = [list(column) for column in zip(*data_rows, strict=False)]
+
     for col_idx in range(len(headers)):
         column_name = str(headers[col_idx]) if col_idx < len(headers) else f"Column_{col_idx + 1}"
 
         # Extract column values
-        column_values = []
-        for row in data_rows:
-            if col_idx < len(row):
-                column_values.append(row[col_idx])
+        column_values = table_columns[col_idx] if col_idx < len(table_columns) else []
+        non_empty_values = [val for val in map(str, filter(None, column_values)) if val.strip()]
 
         # Analyze column type
-        column_type, constraints = await infer_column_type(column_values)
+        column_type, constraints = infer_column_type(non_empty_values)
 
         column_info = {
             "name": column_name,
@@ -130,8 +281,8 @@ async def analyze_columns(sample_values: list[list[Any]]) -> list[dict]:
             "type": column_type,
             "constraints": constraints,
             "sample_values": column_values[:5],  # First 5 sample values
-            "null_count": sum(1 for val in column_values if not val or str(val).strip() == ""),
-            "unique_count": len(set(str(val) for val in column_values if val and str(val).strip())),
+            "null_count": len(column_values) - len(non_empty_values),
+            "unique_count": len(set(non_empty_values)),
         }
 
         columns.append(column_info)
@@ -139,167 +290,241 @@ async def analyze_columns(sample_values: list[list[Any]]) -> list[dict]:
     return columns
 
 
-async def infer_column_type(values: list[Any]) -> tuple[str, dict]:
-    """Infer the most likely data type for a column."""
+def infer_column_type(values: list[str]) -> tuple[str, dict]:
+    """
+    Infer the most likely data type for a column.
+
+    Rather than converting cells one at a time, each candidate type is checked
+    with one regex pass over the column's distinct values, weighted by how often
+    each occurs. Types are tried in order (BOOLEAN, INTEGER or DECIMAL, PERCENT,
+    CURRENCY, DATE, EMAIL, URL) and the first one matching enough of the values
+    wins; otherwise the column is TEXT.
+
+    Args:
+        values: The column's non-empty values as strings
+
+    Returns:
+        The type name and any constraints (precision for DECIMAL, symbol for CURRENCY)
+    """
     if not values:
         return "TEXT", {}
 
-    # Remove empty values
-    non_empty_values = [val for val in values if val and str(val).strip()]
+    distinct = Counter(map(str.strip, values))
+    # Multi-line cells cannot match a whole-cell pattern and would split when joined
+    joined = "\n".join(val for val in distinct if "\n" not in val)
+    total = len(values)
 
-    if not non_empty_values:
-        return "TEXT", {}
+    def matching(column_type: str) -> tuple[list[str], int]:
+        matches = _COLUMN_PATTERNS[column_type].findall(joined)
+        return matches, sum(map(distinct.__getitem__, matches))
 
-    # Check for boolean values
-    boolean_count = sum(1 for val in non_empty_values if str(val).lower() in ["true", "false", "yes", "no", "1", "0"])
-    if boolean_count / len(non_empty_values) >= 0.8:
+    if matching("BOOLEAN")[1] / total >= TYPE_THRESHOLD:
         return "BOOLEAN", {}
 
-    # Check for numeric values
-    numeric_count = 0
-    decimal_count = 0
-    date_count = 0
-
-    for val in non_empty_values:
-        val_str = str(val)
-
-        # Check for dates (basic patterns)
-        if any(
-            pattern in val_str.lower()
-            for pattern in [
-                "/",
-                "-",
-                "jan",
-                "feb",
-                "mar",
-                "apr",
-                "may",
-                "jun",
-                "jul",
-                "aug",
-                "sep",
-                "oct",
-                "nov",
-                "dec",
-            ]
-        ):
-            date_count += 1
-
-        # Check for numbers
-        if val_str.replace(".", "").replace("-", "").replace(",", "").isdigit():
-            numeric_count += 1
-            if "." in val_str:
-                decimal_count += 1
-
-    # Determine type based on analysis
-    if date_count / len(non_empty_values) >= 0.6:
-        return "DATE", {}
-    elif numeric_count / len(non_empty_values) >= 0.8:
-        if decimal_count / numeric_count >= 0.3:
-            return "DECIMAL", {"precision": 2}
-        else:
+    # Everything below starts with or contains a digit, apart from emails and URLs
+    if _DIGIT.search(joined):
+        numbers, numeric_count = matching("NUMBER")
+        if numeric_count / total >= TYPE_THRESHOLD:
+            decimals = [val for val in numbers if "." in val]
+            decimal_count = sum(map(distinct.__getitem__, decimals))
+            if decimal_count / numeric_count >= DECIMAL_THRESHOLD:
+                return "DECIMAL", {"precision": max(len(val) - val.rindex(".") - 1 for val in decimals)}
             return "INTEGER", {}
-    else:
-        return "TEXT", {}
 
+        if matching("PERCENT")[1] / total >= TYPE_THRESHOLD:
+            return "PERCENT", {}
 
-async def find_table_regions(values: list[list], min_rows: int, min_columns: int) -> list[dict]:
-    """Find potential table regions in the data."""
-    regions = []
+        amounts, currency_count = matching("CURRENCY")
+        if currency_count / total >= TYPE_THRESHOLD:
+            symbols = Counter()
+            for amount in amounts:
+                symbols[_CURRENCY_SYMBOL.search(amount).group()] += distinct[amount]
+            return "CURRENCY", {"symbol": symbols.most_common(1)[0][0]}
 
-    if not values or len(values) < min_rows:
-        return regions
+        if matching("DATE")[1] / total >= DATE_THRESHOLD:
+            return "DATE", {}
 
-    rows = len(values)
-    cols = max(len(row) for row in values) if values else 0
+    for column_type in ("EMAIL", "URL"):
+        if matching(column_type)[1] / total >= TYPE_THRESHOLD:
+            return column_type, {}
 
-    if cols < min_columns:
-        return regions
+    return "TEXT", {}
 
-    # Simple heuristic: look for regions with consistent data
-    current_start = -1
 
-    for i in range(rows):
-        # Check if this row has enough data
-        row_data_count = sum(1 for cell in values[i] if cell and str(cell).strip())
+def _is_blank(cell: Any) -> bool:
+    return not (cell and str(cell).strip())
 
-        if row_data_count >= min_columns:
-            # Continue current region
-            if current_start == -1:
-                current_start = i
-        else:
-            # End current region if it's valid
-            if current_start != -1 and i - current_start >= min_rows:
-                regions.append(
-                    {
-                        "start_row": current_start,
-                        "end_row": i - 1,
-                        "start_column": 0,
-                        "end_column": cols - 1,
-                    }
-                )
-            current_start = -1
-
-    # Handle region that extends to end
-    if current_start != -1 and rows - current_start >= min_rows:
-        regions.append(
-            {
-                "start_row": current_start,
-                "end_row": rows - 1,
-                "start_column": 0,
-                "end_column": cols - 1,
-            }
-        )
-
-    return regions
-
-
-async def calculate_table_confidence(values: list[list], region: dict) -> float:
-    """Calculate confidence score for a potential table region."""
-    if not values:
-        return 0.0
 
-    start_row = region["start_row"]
-    end_row = region["end_row"]
-    start_col = region["start_column"]
-    end_col = region["end_column"]
+def _looks_numeric(cell: Any) -> bool:
+    return str(cell).replace(".", "").replace("-", "").isdigit()
+
+
+class _RegionStats:
+    """
+    Running statistics for one block of consecutive data rows.
+
+    Keeps per-column counts rather than the rows themselves, plus the first few
+    rows needed for header detection, so memory depends on the sheet's width but
+    not on the region's height.
+    """
+
+    HEADER_SAMPLE_ROWS = 4
+
+    def __init__(self, start_row: int):
+        self.start_row = start_row
+        self.row_count = 0
+        self.max_length = 0
+        # Rows by length, and per-column counts of non-blank, truthy and numeric cells
+        self.length_counts: list[int] = []
+        self.non_blank: list[int] = []
+        self.truthy: list[int] = []
+        self.numeric: list[int] = []
+        self.sample_rows: list[list] = []
+
+    def add(self, row: list) -> None:
+        length = len(row)
+        if length > self.max_length:
+            grow = length - self.max_length
+            for counts in (self.non_blank, self.truthy, self.numeric):
+                counts.extend([0] * grow)
+            self.length_counts.extend([0] * grow)
+            self.max_length = length
+
+        self.row_count += 1
+        if length:
+            self.length_counts[length - 1] += 1
+
+        for col, cell in enumerate(row):
+            if cell:
+                self.truthy[col] += 1
+                if _looks_numeric(cell):
+                    self.numeric[col] += 1
+                if str(cell).strip():
+                    self.non_blank[col] += 1
+
+        # Keep each column's first few rows for the header check
+        if length and sum(1 for sample in self.sample_rows if len(sample) >= length) < self.HEADER_SAMPLE_ROWS:
+            self.sample_rows.append(row)
+
+    def tables(self, min_columns: int) -> list[dict]:
+        """Split the region at fully blank columns and score each part."""
+        # Rows long enough to reach each column
+        present = [0] * self.max_length
+        running = 0
+        for col in range(self.max_length - 1, -1, -1):
+            running += self.length_counts[col]
+            present[col] = running
+
+        end_row = self.start_row + self.row_count - 1
+        tables = []
+        col = 0
+        while col < self.max_length:
+            if not self.non_blank[col]:
+                col += 1
+                continue
+            start_col = col
+            while col < self.max_length and self.non_blank[col]:
+                col += 1
+            end_col = col - 1
+            if end_col - start_col + 1 < min_columns:
+                continue
+
+            tables.append(
+                {
+                    "start_row": self.start_row,
+                    "end_row": end_row,
+                    "start_column": start_col,
+                    "end_column": end_col,
+                    "confidence": self._confidence(present, start_col, end_col),
+                }
+            )
+        return tables
 
-    # Extract region data
-    region_data = []
-    for i in range(start_row, min(end_row + 1, len(values))):
-        row = values[i]
-        if len(row) > start_col:
-            region_data.append(row[start_col : min(end_col + 1, len(row))])
+    def _confidence(self, present: list[int], start_col: int, end_col: int) -> float:
+        """Table confidence from the running counts: data density, plus bonuses for a header row and consistent column types."""
+        total_cells = sum(present[start_col : end_col + 1])
+        if total_cells == 0:
+            return 0.0
 
-    if not region_data:
-        return 0.0
+        data_density = sum(self.non_blank[start_col : end_col + 1]) / total_cells
 
-    # Calculate confidence based on data consistency
-    total_cells = sum(len(row) for row in region_data)
-    non_empty_cells = sum(sum(1 for cell in row if cell and str(cell).strip()) for row in region_data)
+        sample = [row[start_col : end_col + 1] for row in self.sample_rows if len(row) > start_col][: self.HEADER_SAMPLE_ROWS]
+        has_headers = _has_header_row(sample)
 
-    if total_cells == 0:
-        return 0.0
+        consistent_columns = False
+        total_columns = min(self.max_length, end_col + 1) - start_col
+        if present[start_col] >= 2 and total_columns > 0:
+            consistent = 0
+            for col in range(start_col, start_col + total_columns):
+                truthy = self.truthy[col]
+                if truthy >= 2:
+                    numeric = self.numeric[col]
+                    if numeric / truthy >= 0.8 or (truthy - numeric) / truthy >= 0.8:
+                        consistent += 1
+            consistent_columns = consistent / total_columns >= 0.6
 
-    # Base confidence on data density
-    data_density = non_empty_cells / total_cells
+        confidence = data_density * 0.6  # 60% weight to data density
 
-    # Additional factors
-    has_headers = await has_header_row(region_data)
-    consistent_columns = await has_consistent_columns(region_data)
+        if has_headers:
+            confidence += 0.2  # 20% bonus for headers
 
-    confidence = data_density * 0.6  # 60% weight to data density
+        if consistent_columns:
+            confidence += 0.2  # 20% bonus for consistent structure
 
-    if has_headers:
-        confidence += 0.2  # 20% bonus for headers
+        return min(confidence, 1.0)
 
-    if consistent_columns:
-        confidence += 0.2  # 20% bonus for consistent structure
 
-    return min(confidence, 1.0)
+class TableRegionScanner:
+    """
+    Incremental table region detection over rows fed in blocks.
 
+    A region is a run of at least ``min_rows`` rows that each have ``min_columns``
+    or more non-blank cells; its column range is split wherever a column is blank
+    in every row of the region, so side-by-side tables are reported separately.
+    Region state carries across ``feed`` calls, so a table spanning several blocks
+    is found once.
+    """
 
-async def has_header_row(data: list[list]) -> bool:
+    def __init__(self, min_rows: int, min_columns: int):
+        self.min_rows = min_rows
+        self.min_columns = min_columns
+        self.next_row = 0
+        self._region: _RegionStats | None = None
+        self._regions: list[dict] = []
+
+    def feed(self, rows: list[list]) -> None:
+        """Process the next rows of the sheet."""
+        for row in rows:
+            row_data_count = sum(1 for cell in row if not _is_blank(cell))
+
+            if row_data_count >= self.min_columns:
+                if self._region is None:
+                    self._region = _RegionStats(self.next_row)
+                self._region.add(row)
+            else:
+                self._close_region()
+
+            self.next_row += 1
+
+    def skip(self, count: int) -> None:
+        """Advance past ``count`` empty rows."""
+        if count <= 0:
+            return
+        self._close_region()
+        self.next_row += count
+
+    def _close_region(self) -> None:
+        region, self._region = self._region, None
+        if region is not None and region.row_count >= self.min_rows:
+            self._regions.extend(region.tables(self.min_columns))
+
+    def finish(self) -> list[dict]:
+        """Close any open region and return all regions found, in sheet order."""
+        self._close_region()
+        return self._regions
+
+
+def _has_header_row(data: list[list]) -> bool:
     """Check if the first row looks like a header."""
     if not data or len(data) < 2:
         return False
@@ -325,34 +550,102 @@ async def has_header_row(data: list[list]) -> bool:
     return header_text_count > len(header_row) * 0.5 and data_numeric_count > 0
 
 
-async def has_consistent_columns(data: list[list]) -> bool:
-    """Check if columns have consistent data types."""
-    if not data or len(data) < 2:
-        return False
-
-    # Check if most columns have consistent data types
-    consistent_columns = 0
-    total_columns = max(len(row) for row in data)
-
-    for col in range(total_columns):
-        column_values = [row[col] for row in data if col < len(row) and row[col]]
-        if len(column_values) >= 2:
-            # Check if column has consistent type
-            numeric_count = sum(1 for val in column_values if str(val).replace(".", "").replace("-", "").isdigit())
-            text_count = len(column_values) - numeric_count
-
-            # If 80% of values are same type, consider consistent
-            if numeric_count / len(column_values) >= 0.8 or text_count / len(column_values) >= 0.8:
-                consistent_columns += 1
-
-    return consistent_columns / total_columns >= 0.6 if total_columns > 0 else False
-
-
-async def get_column_letter(column_index: int) -> str:
-    """Convert column index to A1 notation letter."""
+def _column_letter(column_index: int) -> str:
     result = ""
     while column_index >= 0:
         column_index, remainder = divmod(column_index, 26)
         result = chr(65 + remainder) + result
         column_index -= 1
     return result
+
+
+def _column_index(column_letters: str) -> int:
+    index = 0
+    for letter in column_letters.upper():
+        index = index * 26 + ord(letter) - 64
+    return index - 1
+
+
+_A1_CELL = re.compile(r"^\$?([A-Za-z]+)\$?(\d+)$")
+
+
+def parse_a1_cell(cell: str) -> tuple[int, int]:
+    """
+    Split an A1 cell reference such as ``"B5"`` into a 0-based column index and a 1-based row number.
+
+    Raises:
+        ValueError: If ``cell`` is not a single A1 cell reference
+    """
+    match = _A1_CELL.match(cell.strip())
+    if not match:
+        raise ValueError(f"Invalid A1 cell reference: {cell!r}")
+    return _column_index(match.group(1)), int(match.group(2))
+
+
+def a1_range_bounds(a1_range: str) -> tuple[int, int, int, int]:
+    """
+    Get the first and last (column index, row number) of an A1 range such as ``"'Sheet 1'!B2:D10"``.
+
+    A single-cell range returns the same cell twice.
+    """
+    cells = a1_range.rsplit("!", 1)[-1].split(":")
+    start_column, start_row = parse_a1_cell(cells[0])
+    end_column, end_row = parse_a1_cell(cells[-1])
+    return start_column, start_row, end_column, end_row
+
+
+def a1_cell(column_index: int, row_number: int) -> str:
+    """A1 reference such as ``"B5"`` for a 0-based column index and a 1-based row number."""
+    return f"{_column_letter(column_index)}{row_number}"
+
+
+def quoted_cell_range(sheet_name: str, column_index: int, row_number: int) -> str:
+    """A1 reference to a single cell on a sheet, with the sheet name quoted."""
+    quoted_title = sheet_name.replace("'", "''")
+    return f"'{quoted_title}'!{a1_cell(column_index, row_number)}"
+
+
+async def iter_row_chunks(
+    rows: Iterable[list[Any]] | AsyncIterable[list[Any]],
+    max_request_bytes: int = BULK_WRITE_MAX_REQUEST_BYTES,
+    max_rows: int = BULK_WRITE_MAX_ROWS_PER_REQUEST,
+) -> AsyncIterator[list[list[Any]]]:
+    """
+    Pack rows into chunks that each fit in one values request.
+
+    Rows are pulled from ``rows`` lazily, so a generator producing a large
+    dataset is never held in memory beyond the chunk being built. A chunk is
+    closed when adding the next row would exceed ``max_request_bytes`` of JSON
+    or ``max_rows`` rows; a single row larger than the byte limit is sent alone.
+
+    Args:
+        rows: Rows to write, as a sync or async iterable of lists of cell values
+        max_request_bytes: Approximate JSON size limit of a chunk's values
+        max_rows: Maximum number of rows per chunk
+
+    Yields:
+        Lists of rows, in input order
+    """
+    chunk: list[list[Any]] = []
+    chunk_bytes = 0
+
+    async def rows_iterator() -> AsyncIterator[list[Any]]:
+        if isinstance(rows, AsyncIterable):
+            async for row in rows:
+                yield row
+        else:
+            for row in rows:
+                yield row
+
+    async for row in rows_iterator():
+        cells = list(row)
+        # Row JSON plus the separating comma
+        row_bytes = len(json.dumps(cells, default=str)) + 1
+        if chunk and (chunk_bytes + row_bytes > max_request_bytes or len(chunk) >= max_rows):
+            yield chunk
+            chunk, chunk_bytes = [], 0
+        chunk.append(cells)
+        chunk_bytes += row_bytes
+
+    if chunk:
+        yield chunk
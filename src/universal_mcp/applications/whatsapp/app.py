@@ -1,21 +1,21 @@
 from typing import Any
-import requests
 from universal_mcp.agentr.integration import AgentrIntegration
 from universal_mcp.applications.application import BaseApplication
 from universal_mcp.exceptions import NotAuthorizedError
 from universal_mcp.applications.whatsapp.whatsapp import WHATSAPP_API_BASE_URL
-from universal_mcp.applications.whatsapp.whatsapp import download_media as whatsapp_download_media
-from universal_mcp.applications.whatsapp.whatsapp import get_chat as whatsapp_get_chat
-from universal_mcp.applications.whatsapp.whatsapp import get_contact_chats as whatsapp_get_contact_chats
-from universal_mcp.applications.whatsapp.whatsapp import get_direct_chat_by_contact as whatsapp_get_direct_chat_by_contact
-from universal_mcp.applications.whatsapp.whatsapp import get_last_interaction as whatsapp_get_last_interaction
-from universal_mcp.applications.whatsapp.whatsapp import get_message_context as whatsapp_get_message_context
-from universal_mcp.applications.whatsapp.whatsapp import list_chats as whatsapp_list_chats
-from universal_mcp.applications.whatsapp.whatsapp import list_messages as whatsapp_list_messages
-from universal_mcp.applications.whatsapp.whatsapp import search_contacts as whatsapp_search_contacts
-from universal_mcp.applications.whatsapp.whatsapp import send_audio_message as whatsapp_audio_voice_message
-from universal_mcp.applications.whatsapp.whatsapp import send_file as whatsapp_send_file
-from universal_mcp.applications.whatsapp.whatsapp import send_message as whatsapp_send_message
+from universal_mcp.applications.whatsapp.whatsapp import adownload_media as whatsapp_download_media
+from universal_mcp.applications.whatsapp.whatsapp import aget_chat as whatsapp_get_chat
+from universal_mcp.applications.whatsapp.whatsapp import aget_contact_chats as whatsapp_get_contact_chats
+from universal_mcp.applications.whatsapp.whatsapp import aget_direct_chat_by_contact as whatsapp_get_direct_chat_by_contact
+from universal_mcp.applications.whatsapp.whatsapp import aget_last_interaction as whatsapp_get_last_interaction
+from universal_mcp.applications.whatsapp.whatsapp import aget_message_context as whatsapp_get_message_context
+from universal_mcp.applications.whatsapp.whatsapp import alist_chats as whatsapp_list_chats
+from universal_mcp.applications.whatsapp.whatsapp import alist_messages as whatsapp_list_messages
+from universal_mcp.applications.whatsapp.whatsapp import asearch_contacts as whatsapp_search_contacts
+from universal_mcp.applications.whatsapp.whatsapp import asend_audio_message as whatsapp_audio_voice_message
+from universal_mcp.applications.whatsapp.whatsapp import asend_file as whatsapp_send_file
+from universal_mcp.applications.whatsapp.whatsapp import asend_message as whatsapp_send_message
+from universal_mcp.applications.whatsapp.whatsapp import get_bridge_client
 
 
 class WhatsappApp(BaseApplication):
@@ -55,12 +55,12 @@ class WhatsappApp(BaseApplication):
         self._api_key = self.get_api_key()
         return self._api_key
 
-    def _authenticator(self):
+    async def _authenticator(self):
         """
         Triggers WhatsApp authentication flow when no integration is available.
         Raises NotAuthorizedError with authorization URL when authentication is needed.
         """
-        auth_result = self._authenticate_whatsapp()
+        auth_result = await self._authenticate_whatsapp()
         if auth_result[0] is True:
             return True
         elif isinstance(auth_result[1], str):
@@ -68,19 +68,17 @@ class WhatsappApp(BaseApplication):
         else:
             raise NotAuthorizedError("WhatsApp authentication failed. Please check your configuration.")
 
-    def _authenticate_whatsapp(self) -> tuple[bool, str]:
+    async def _authenticate_whatsapp(self) -> tuple[bool, str]:
         """
         Authenticate with WhatsApp API when no integration is available.
-        Makes a POST request to the auth endpoint.
+        Makes a POST request to the auth endpoint over the user's pooled bridge connections.
         """
         try:
             user_id = self.api_key
             if not user_id:
                 raise ValueError("No API key available from integration")
-            auth_url = f"{self.base_url}/api/auth"
-            response = requests.post(auth_url, headers={"Content-Type": "application/json"}, json={"user_id": user_id}, timeout=60)
-            if response.status_code == 200:
-                result = response.json()
+            result = await get_bridge_client(user_id).request("auth", method="POST", data={"user_id": user_id}, timeout=60)
+            if "error" not in result:
                 if result.get("status") == "qr_required":
                     qr_url = f"{self.base_url}/api/qr?user_id={user_id}"
                     return (
@@ -124,9 +122,9 @@ class WhatsappApp(BaseApplication):
         """
         if query is None:
             raise ValueError("Missing required parameter 'query'.")
-        self._authenticator()
+        await self._authenticator()
         user_id = self.api_key
-        contacts = whatsapp_search_contacts(query, user_id)
+        contacts = await whatsapp_search_contacts(query, user_id)
         return contacts
 
     async def search_messages(
@@ -166,9 +164,9 @@ class WhatsappApp(BaseApplication):
         Tags:
             whatsapp.messages, important
         """
-        self._authenticator()
+        await self._authenticator()
         user_id = self.api_key
-        messages = whatsapp_list_messages(
+        messages = await whatsapp_list_messages(
             after=after,
             before=before,
             sender_phone_number=sender_phone_number,
@@ -205,9 +203,9 @@ class WhatsappApp(BaseApplication):
         Tags:
             whatsapp.chats, important
         """
-        self._authenticator()
+        await self._authenticator()
         user_id = self.api_key
-        chats = whatsapp_list_chats(
+        chats = await whatsapp_list_chats(
             query=query, limit=limit, page=page, include_last_message=include_last_message, sort_by=sort_by, user_id=user_id
         )
         return chats
@@ -231,9 +229,9 @@ class WhatsappApp(BaseApplication):
         """
         if chat_jid is None:
             raise ValueError("Missing required parameter 'chat_jid'.")
-        self._authenticator()
+        await self._authenticator()
         user_id = self.api_key
-        chat = whatsapp_get_chat(chat_jid, include_last_message, user_id)
+        chat = await whatsapp_get_chat(chat_jid, include_last_message, user_id)
         return chat
 
     async def get_direct_chat_by_phone_number(self, sender_phone_number: str) -> dict[str, Any]:
@@ -254,9 +252,9 @@ class WhatsappApp(BaseApplication):
         """
         if sender_phone_number is None:
             raise ValueError("Missing required parameter 'sender_phone_number'.")
-        self._authenticator()
+        await self._authenticator()
         user_id = self.api_key
-        chat = whatsapp_get_direct_chat_by_contact(sender_phone_number, user_id)
+        chat = await whatsapp_get_direct_chat_by_contact(sender_phone_number, user_id)
         return chat
 
     async def list_chats_by_contact_jid(self, jid: str, limit: int = 20, page: int = 0) -> list[dict[str, Any]]:
@@ -279,9 +277,9 @@ class WhatsappApp(BaseApplication):
         """
         if jid is None:
             raise ValueError("Missing required parameter 'jid'.")
-        self._authenticator()
+        await self._authenticator()
         user_id = self.api_key
-        chats = whatsapp_get_contact_chats(jid, limit, page, user_id)
+        chats = await whatsapp_get_contact_chats(jid, limit, page, user_id)
         return chats
 
     async def get_last_message_by_jid(self, jid: str) -> str:
@@ -302,9 +300,9 @@ class WhatsappApp(BaseApplication):
         """
         if jid is None:
             raise ValueError("Missing required parameter 'jid'.")
-        self._authenticator()
+        await self._authenticator()
         user_id = self.api_key
-        message = whatsapp_get_last_interaction(jid, user_id)
+        message = await whatsapp_get_last_interaction(jid, user_id)
         return message
 
     async def get_message_context(self, message_id: str, before: int = 5, after: int = 5) -> dict[str, Any]:
@@ -317,7 +315,7 @@ class WhatsappApp(BaseApplication):
             after (integer): Number of messages to include after the target message (default 5)
 
         Returns:
-            Dict[str, Any]: Retrieved message context
+            Dict[str, Any]: Retrieved message context, or a dict with an "error" message if the bridge cannot provide it
 
         Raises:
             ValueError: Raised when required parameters are missing.
@@ -327,9 +325,9 @@ class WhatsappApp(BaseApplication):
         """
         if message_id is None:
             raise ValueError("Missing required parameter 'message_id'.")
-        self._authenticator()
+        await self._authenticator()
         user_id = self.api_key
-        context = whatsapp_get_message_context(message_id, before, after, user_id)
+        context = await whatsapp_get_message_context(message_id, before, after, user_id)
         return context
 
     async def send_text_message(self, recipient: str, message: str) -> dict[str, Any]:
@@ -354,9 +352,9 @@ class WhatsappApp(BaseApplication):
             raise ValueError("Missing required parameter 'recipient'.")
         if message is None:
             raise ValueError("Missing required parameter 'message'.")
-        self._authenticator()
+        await self._authenticator()
         user_id = self.api_key
-        success, status_message = whatsapp_send_message(recipient, message, user_id)
+        success, status_message = await whatsapp_send_message(recipient, message, user_id)
         return {"success": success, "message": status_message}
 
     async def send_attachment(self, recipient: str, media_path: str) -> dict[str, Any]:
@@ -381,9 +379,9 @@ class WhatsappApp(BaseApplication):
             raise ValueError("Missing required parameter 'recipient'.")
         if media_path is None:
             raise ValueError("Missing required parameter 'media_path'.")
-        self._authenticator()
+        await self._authenticator()
         user_id = self.api_key
-        success, status_message = whatsapp_send_file(recipient, media_path, user_id)
+        success, status_message = await whatsapp_send_file(recipient, media_path, user_id)
         return {"success": success, "message": status_message}
 
     async def send_voice_message(self, recipient: str, media_path: str) -> dict[str, Any]:
@@ -408,9 +406,9 @@ class WhatsappApp(BaseApplication):
             raise ValueError("Missing required parameter 'recipient'.")
         if media_path is None:
             raise ValueError("Missing required parameter 'media_path'.")
-        self._authenticator()
+        await self._authenticator()
         user_id = self.api_key
-        success, status_message = whatsapp_audio_voice_message(recipient, media_path, user_id)
+        success, status_message = await whatsapp_audio_voice_message(recipient, media_path, user_id)
         return {"success": success, "message": status_message}
 
     async def download_media_from_message(self, message_id: str, chat_jid: str) -> dict[str, Any]:
@@ -434,9 +432,9 @@ class WhatsappApp(BaseApplication):
             raise ValueError("Missing required parameter 'message_id'.")
         if chat_jid is None:
             raise ValueError("Missing required parameter 'chat_jid'.")
-        self._authenticator()
+        await self._authenticator()
         user_id = self.api_key
-        file_path = whatsapp_download_media(message_id, chat_jid, user_id)
+        file_path = await whatsapp_download_media(message_id, chat_jid, user_id)
         if file_path:
             return {"success": True, "message": "Media downloaded successfully", "file_path": file_path}
         else:
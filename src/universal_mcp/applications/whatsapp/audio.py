@@ -1,6 +1,50 @@
+import asyncio
+import functools
+import hashlib
 import os
 import subprocess
 import tempfile
+import time
+from pathlib import Path
+
+# Converted voice messages are cached here, keyed by a hash of the source audio
+WHATSAPP_AUDIO_CACHE_DIR = os.getenv("WHATSAPP_AUDIO_CACHE_DIR", os.path.expanduser("~/.cache/universal_mcp/whatsapp_audio"))
+WHATSAPP_AUDIO_CACHE_MAX_BYTES = int(os.getenv("WHATSAPP_AUDIO_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Maximum ffmpeg processes running at once
+WHATSAPP_TRANSCODE_WORKERS = int(os.getenv("WHATSAPP_TRANSCODE_WORKERS", str(os.cpu_count() or 2)))
+
+# Cached files used more recently than this (seconds) are never evicted, as the bridge may still be reading them
+CACHE_EVICTION_MIN_AGE = 60
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _ffmpeg_command(input_file, output_file, bitrate, sample_rate):
+    """ffmpeg arguments for a voice-optimised Opus/Ogg encode; "pipe:0"/"pipe:1" read stdin/write stdout."""
+    return [
+        "ffmpeg",
+        "-i",
+        input_file,
+        "-c:a",
+        "libopus",
+        "-b:a",
+        bitrate,
+        "-ar",
+        str(sample_rate),
+        "-application",
+        "voip",  # Optimize for voice
+        "-vbr",
+        "on",  # Variable bitrate
+        "-compression_level",
+        "10",  # Maximum compression
+        "-frame_duration",
+        "60",  # 60ms frames (good for voice)
+        "-f",
+        "ogg",
+        "-y",  # Overwrite output file if it exists
+        output_file,
+    ]
 
 
 def convert_to_opus_ogg(input_file, output_file=None, bitrate="32k", sample_rate=24000):
@@ -33,28 +77,7 @@ def convert_to_opus_ogg(input_file, output_file=None, bitrate="32k", sample_rate
     if output_dir and not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
-    # Build the ffmpeg command
-    cmd = [
-        "ffmpeg",
-        "-i",
-        input_file,
-        "-c:a",
-        "libopus",
-        "-b:a",
-        bitrate,
-        "-ar",
-        str(sample_rate),
-        "-application",
-        "voip",  # Optimize for voice
-        "-vbr",
-        "on",  # Variable bitrate
-        "-compression_level",
-        "10",  # Maximum compression
-        "-frame_duration",
-        "60",  # 60ms frames (good for voice)
-        "-y",  # Overwrite output file if it exists
-        output_file,
-    ]
+    cmd = _ffmpeg_command(input_file, output_file, bitrate, sample_rate)
 
     try:
         # Run the ffmpeg command and capture output
@@ -95,6 +118,236 @@ def convert_to_opus_ogg_temp(input_file, bitrate="32k", sample_rate=24000):
         raise e
 
 
+class TranscodeCache:
+    """
+    Directory of converted ``.ogg`` files keyed by the SHA-256 of the source audio
+    and the encoding settings, so the same recording is only transcoded once.
+
+    Files are written atomically and their mtime is refreshed on every hit. Once
+    the directory grows past ``max_bytes`` the least recently used files are
+    removed, except those used in the last ``CACHE_EVICTION_MIN_AGE`` seconds.
+    """
+
+    def __init__(self, directory: str | os.PathLike = WHATSAPP_AUDIO_CACHE_DIR, max_bytes: int = WHATSAPP_AUDIO_CACHE_MAX_BYTES):
+        """
+        Args:
+            directory: Cache directory, created if missing
+            max_bytes: Total size of cached files to keep
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path(self, digest: str, bitrate: str, sample_rate: int) -> Path:
+        return self.directory / f"{digest}-{bitrate}-{sample_rate}.ogg"
+
+    def get(self, path: Path) -> str | None:
+        """Return a cached file's path and mark it as recently used, or None on a miss."""
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return str(path)
+
+    def temp_path(self, path: Path) -> str:
+        """Reserve a temporary file next to ``path`` to write a conversion into."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{path.name}.")
+        os.close(fd)
+        return tmp_path
+
+    def commit(self, tmp_path: str, path: Path) -> str:
+        """Move a finished conversion into place and evict old files if over budget."""
+        os.replace(tmp_path, path)
+        self.evict(keep=path)
+        return str(path)
+
+    def write(self, path: Path, data: bytes) -> str:
+        tmp_path = self.temp_path(path)
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            return self.commit(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def evict(self, keep: Path | None = None) -> None:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(".ogg") and not entry.name.startswith("."):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        cutoff = time.time() - CACHE_EVICTION_MIN_AGE
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_bytes or mtime >= cutoff:
+                break
+            if keep is not None and path == str(keep):
+                continue
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AudioTranscoder:
+    """
+    Async ffmpeg runner for voice messages with a bounded worker pool.
+
+    Conversions run as ``asyncio`` subprocesses, at most ``max_workers`` at a time,
+    so many voice messages can be prepared concurrently without blocking the event
+    loop. Results are served from a ``TranscodeCache`` and concurrent requests for
+    the same source audio share one ffmpeg run.
+    """
+
+    def __init__(self, cache: TranscodeCache | None = None, max_workers: int = WHATSAPP_TRANSCODE_WORKERS):
+        """
+        Args:
+            cache: Cache of converted files (default: one in ``WHATSAPP_AUDIO_CACHE_DIR``)
+            max_workers: Maximum ffmpeg processes running at once
+        """
+        self.cache = cache or TranscodeCache()
+        self.max_workers = max(1, max_workers)
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._in_flight: dict[Path, asyncio.Task] = {}
+
+    def _bind_loop(self) -> None:
+        """Create the worker slots for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._in_flight = {}
+
+    async def convert(self, source: str | bytes, bitrate: str = "32k", sample_rate: int = 24000, pipe: bool = False) -> str:
+        """
+        Convert audio to Opus in an Ogg container, reusing a cached conversion if there is one.
+
+        Args:
+            source: Path to the input audio file, or the audio itself as bytes
+            bitrate: Target bitrate for Opus encoding
+            sample_rate: Sample rate for output
+            pipe: Feed a file path's contents to ffmpeg on stdin and read the result from
+                stdout instead of letting ffmpeg open the files itself. Always used for bytes.
+                Containers that need seeking (e.g. MP4/M4A with a trailing index) cannot be
+                read from a pipe.
+
+        Returns:
+            Path to the converted file in the cache
+
+        Raises:
+            FileNotFoundError: If the input file doesn't exist
+            RuntimeError: If the ffmpeg conversion fails
+        """
+        self._bind_loop()
+        if isinstance(source, bytes):
+            digest = hashlib.sha256(source).hexdigest()
+        else:
+            if not os.path.isfile(source):
+                raise FileNotFoundError(f"Input file not found: {source}")
+            digest = await asyncio.to_thread(_file_digest, source)
+
+        path = self.cache.path(digest, bitrate, sample_rate)
+        cached = self.cache.get(path)
+        if cached is not None:
+            return cached
+
+        pending = self._in_flight.get(path)
+        if pending is None:
+            # The conversion runs as its own task so cancelling any one caller, including
+            # the one that started it, does not end it for the others
+            pending = self._loop.create_task(self._transcode(source, path, bitrate, sample_rate, pipe))
+            pending.add_done_callback(functools.partial(self._transcode_done, path))
+            self._in_flight[path] = pending
+        return await asyncio.shield(pending)
+
+    def _transcode_done(self, path: Path, task: asyncio.Task) -> None:
+        """Drop a finished conversion from the in-flight table."""
+        if self._in_flight.get(path) is task:
+            del self._in_flight[path]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled
+            task.exception()
+
+    async def _transcode(self, source: str | bytes, path: Path, bitrate: str, sample_rate: int, pipe: bool) -> str:
+        if isinstance(source, bytes) or pipe:
+            data = source if isinstance(source, bytes) else await asyncio.to_thread(Path(source).read_bytes)
+            output = await self._run_ffmpeg(_ffmpeg_command("pipe:0", "pipe:1", bitrate, sample_rate), data)
+            return await asyncio.to_thread(self.cache.write, path, output)
+
+        tmp_path = self.cache.temp_path(path)
+        try:
+            await self._run_ffmpeg(_ffmpeg_command(source, tmp_path, bitrate, sample_rate))
+            return await asyncio.to_thread(self.cache.commit, tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    async def _run_ffmpeg(self, cmd: list[str], data: bytes | None = None) -> bytes:
+        """Run ffmpeg in a worker slot, returning its stdout."""
+        async with self._slots:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=asyncio.subprocess.PIPE if data is not None else asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except OSError as e:
+                raise RuntimeError(f"Failed to convert audio. You likely need to install ffmpeg {e}") from e
+            try:
+                stdout, stderr = await process.communicate(data)
+            except BaseException:
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+                raise
+        if process.returncode != 0:
+            raise RuntimeError(f"Failed to convert audio. You likely need to install ffmpeg {stderr.decode(errors='replace')}")
+        return stdout
+
+
+@functools.cache
+def get_transcoder() -> AudioTranscoder:
+    """Get the shared transcoder, creating its cache directory on first use."""
+    return AudioTranscoder()
+
+
+async def aconvert_to_opus_ogg(input_file, bitrate="32k", sample_rate=24000, pipe=False):
+    """
+    Convert an audio file to Opus format in an Ogg container without blocking the event loop.
+
+    The result is shared through the transcoding cache, so callers must not delete
+    or modify the returned file.
+
+    Args:
+        input_file (str): Path to the input audio file
+        bitrate (str, optional): Target bitrate for Opus encoding (default: "32k")
+        sample_rate (int, optional): Sample rate for output (default: 24000)
+        pipe (bool, optional): Stream the audio through ffmpeg's stdin/stdout (default: False)
+
+    Returns:
+        str: Path to the cached converted file
+
+    Raises:
+        FileNotFoundError: If the input file doesn't exist
+        RuntimeError: If the ffmpeg conversion fails
+    """
+    return await get_transcoder().convert(input_file, bitrate, sample_rate, pipe)
+
+
 if __name__ == "__main__":
     # Example usage
     import sys
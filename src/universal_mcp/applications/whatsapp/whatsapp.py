@@ -1,8 +1,14 @@
+import asyncio
+import contextlib
 import json
 import os.path
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 
+import httpx
 import requests
 from dotenv import load_dotenv
 
@@ -12,6 +18,19 @@ load_dotenv()
 
 WHATSAPP_API_BASE_URL = os.getenv("WHATSAPP_API_BASE_URL", "http://134.209.144.43:8080")
 
+# Bridge connections pooled per user, and how long idle ones are kept open (seconds)
+WHATSAPP_MAX_CONNECTIONS = int(os.getenv("WHATSAPP_MAX_CONNECTIONS", "10"))
+WHATSAPP_KEEPALIVE_EXPIRY = float(os.getenv("WHATSAPP_KEEPALIVE_EXPIRY", "60"))
+
+REQUEST_TIMEOUT = 30
+
+# How long resolved sender names are reused (seconds), and how many are kept per user
+WHATSAPP_SENDER_NAME_TTL = float(os.getenv("WHATSAPP_SENDER_NAME_TTL", "900"))
+WHATSAPP_SENDER_NAME_CACHE_SIZE = int(os.getenv("WHATSAPP_SENDER_NAME_CACHE_SIZE", "5000"))
+
+# Maximum simultaneous sender_name requests when resolving a page of messages
+SENDER_NAME_MAX_CONCURRENCY = 8
+
 
 @dataclass
 class Message:
@@ -54,6 +73,123 @@ class MessageContext:
     after: list[Message]
 
 
+def _chat_from_data(chat_data: dict) -> Chat:
+    return Chat(
+        jid=chat_data["jid"],
+        name=chat_data.get("name"),
+        last_message_time=datetime.fromisoformat(chat_data["last_message_time"]) if chat_data.get("last_message_time") else None,
+        last_message=chat_data.get("last_message"),
+        last_sender=chat_data.get("last_sender"),
+        last_is_from_me=chat_data.get("last_is_from_me"),
+    )
+
+
+def _chats_from_result(result: dict) -> list[Chat]:
+    if "error" in result:
+        return []
+    return [_chat_from_data(chat_data) for chat_data in result.get("chats", [])]
+
+
+def _chat_from_result(result: dict) -> Chat | None:
+    if "error" in result:
+        return None
+    chat_data = result.get("chat")
+    return _chat_from_data(chat_data) if chat_data else None
+
+
+def _contacts_from_result(result: dict) -> list[Contact]:
+    if "error" in result:
+        return []
+    return [
+        Contact(phone_number=contact_data["phone_number"], name=contact_data.get("name"), jid=contact_data["jid"])
+        for contact_data in result.get("contacts", [])
+    ]
+
+
+def _send_status(result: dict) -> tuple[bool, str]:
+    if "error" in result:
+        return False, result["error"]
+    return result.get("success", False), result.get("message", "Unknown response")
+
+
+class SenderNameCache:
+    """
+    Per-user cache of sender JID to display name, shared by the sync and async paths.
+
+    Names expire after ``ttl`` seconds so renamed contacts are picked up, and each
+    user keeps at most ``max_entries`` names, dropping the least recently used.
+    Failed lookups are not cached.
+    """
+
+    def __init__(self, ttl: float = WHATSAPP_SENDER_NAME_TTL, max_entries: int = WHATSAPP_SENDER_NAME_CACHE_SIZE):
+        """
+        Args:
+            ttl: Lifetime of a resolved name in seconds
+            max_entries: Maximum names kept per user
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._names: dict[str, OrderedDict[str, tuple[str, float]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str, sender_jid: str) -> str | None:
+        with self._lock:
+            names = self._names.get(user_id)
+            entry = names.get(sender_jid) if names else None
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del names[sender_jid]
+                return None
+            names.move_to_end(sender_jid)
+            return entry[0]
+
+    def set(self, user_id: str, sender_jid: str, name: str) -> None:
+        with self._lock:
+            names = self._names.setdefault(user_id, OrderedDict())
+            names[sender_jid] = (name, time.monotonic() + self.ttl)
+            names.move_to_end(sender_jid)
+            while len(names) > self.max_entries:
+                names.popitem(last=False)
+
+    def clear(self, user_id: str | None = None) -> None:
+        """Forget the names of one user, or of all users."""
+        with self._lock:
+            if user_id is None:
+                self._names.clear()
+            else:
+                self._names.pop(user_id, None)
+
+
+sender_names = SenderNameCache()
+
+
+def _sender_name_from_result(result: dict, sender_jid: str, user_id: str) -> str:
+    if "error" in result:
+        return sender_jid
+    name = result.get("name", sender_jid)
+    sender_names.set(user_id, sender_jid, name)
+    return name
+
+
+def _format_message(message: Message, show_chat_info: bool, sender_name: str) -> str:
+    parts = [f"[{message.timestamp:%Y-%m-%d %H:%M:%S}] "]
+    if show_chat_info and message.chat_name:
+        parts.append(f"Chat: {message.chat_name} ")
+
+    content_prefix = ""
+    if getattr(message, "media_type", None):
+        content_prefix = f"[{message.media_type} - Message ID: {message.id} - Chat JID: {message.chat_jid}] "
+
+    parts.append(f"From: {sender_name}: {content_prefix}{message.content}\n")
+    return "".join(parts)
+
+
+def _distinct_senders(messages: list[Message]) -> list[str]:
+    """JIDs of the other people who sent the messages, in first-seen order."""
+    return list(dict.fromkeys(message.sender for message in messages if not message.is_from_me))
+
+
 def _make_api_request(endpoint: str, method: str = "GET", data: dict = None, user_id: str = "default_user") -> dict:
     """Make HTTP request to WhatsApp Bridge API."""
     url = f"{WHATSAPP_API_BASE_URL}/api/{endpoint}"
@@ -83,46 +219,158 @@ def _make_api_request(endpoint: str, method: str = "GET", data: dict = None, use
         return {"error": f"Invalid JSON response: {response.text}"}
 
 
+async def _close_stale_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+    """Close a client left behind by another event loop."""
+    if loop is not None and loop.is_running():
+        # Still serving requests on another thread, so close it there
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+    # Its loop is no longer running, so close it from this one as far as possible
+    with contextlib.suppress(RuntimeError, OSError):
+        await client.aclose()
+
+
+class BridgeClient:
+    """
+    Async client for the WhatsApp Bridge API, bound to one user.
+
+    Requests share a keep-alive connection pool, so only the first call pays for
+    connection setup. The pool is tied to the event loop it was created on; if the
+    client is used from a different loop, a new pool is created and the old one closed.
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        base_url: str = WHATSAPP_API_BASE_URL,
+        max_connections: int = WHATSAPP_MAX_CONNECTIONS,
+        timeout: float = REQUEST_TIMEOUT,
+    ):
+        """
+        Args:
+            user_id: User whose bridge session requests are made for
+            base_url: Bridge API base URL
+            max_connections: Maximum pooled connections to the bridge
+            timeout: Default request timeout in seconds
+        """
+        self.user_id = user_id
+        self.base_url = base_url
+        self.max_connections = max_connections
+        self.timeout = timeout
+
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    async def get_client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client for the running event loop, replacing and closing one left on another loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            stale, stale_loop = self._client, self._client_loop
+            self._client = httpx.AsyncClient(
+                base_url=f"{self.base_url}/api/",
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=WHATSAPP_KEEPALIVE_EXPIRY,
+                ),
+            )
+            self._client_loop = loop
+            if stale is not None:
+                await _close_stale_client(stale, stale_loop)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def request(self, endpoint: str, method: str = "GET", data: dict | None = None, timeout: float | None = None) -> dict:
+        """
+        Make a request to the bridge.
+
+        GET requests send ``data`` and the user ID as query parameters, POST requests
+        send ``data`` as the JSON body.
+
+        Returns:
+            The JSON response, or a dict with an "error" message if the request failed
+        """
+        method = method.upper()
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            client = await self.get_client()
+            if method == "GET":
+                response = await client.get(endpoint, params={**(data or {}), "user_id": self.user_id}, timeout=timeout)
+            elif method == "POST":
+                response = await client.post(endpoint, json=data, timeout=timeout)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+        except httpx.HTTPError as e:
+            return {"error": f"Request failed: {str(e)}"}
+
+        if response.status_code != 200:
+            return {"error": f"HTTP {response.status_code}: {response.text}"}
+        try:
+            return response.json()
+        except json.JSONDecodeError:
+            return {"error": f"Invalid JSON response: {response.text}"}
+
+
+_bridge_clients: dict[str, BridgeClient] = {}
+
+
+def get_bridge_client(user_id: str = "default_user") -> BridgeClient:
+    """Get the shared bridge client for a user, creating it on first use."""
+    client = _bridge_clients.get(user_id)
+    if client is None:
+        client = _bridge_clients[user_id] = BridgeClient(user_id)
+    return client
+
+
+async def close_bridge_clients() -> None:
+    """Close the connection pools of all shared bridge clients."""
+    clients = list(_bridge_clients.values())
+    _bridge_clients.clear()
+    await asyncio.gather(*(client.aclose() for client in clients))
+
+
+async def _amake_api_request(
+    endpoint: str, method: str = "GET", data: dict | None = None, user_id: str = "default_user", timeout: float | None = None
+) -> dict:
+    """Make HTTP request to WhatsApp Bridge API over the user's pooled connections."""
+    return await get_bridge_client(user_id).request(endpoint, method, data, timeout)
+
+
 def get_sender_name(sender_jid: str, user_id: str = "default_user") -> str:
-    """Get sender name via API call."""
+    """Get sender name via API call, reusing names resolved within the cache TTL."""
+    name = sender_names.get(user_id, sender_jid)
+    if name is not None:
+        return name
+
     result = _make_api_request("sender_name", data={"sender_jid": sender_jid}, user_id=user_id)
+    return _sender_name_from_result(result, sender_jid, user_id)
 
-    if "error" in result:
-        return sender_jid
 
-    return result.get("name", sender_jid)
+def resolve_sender_names(sender_jids: list[str], user_id: str = "default_user") -> dict[str, str]:
+    """Resolve the names of several senders, looking up each distinct uncached JID once."""
+    return {sender_jid: get_sender_name(sender_jid, user_id) for sender_jid in dict.fromkeys(sender_jids)}
 
 
 def format_message(message: Message, show_chat_info: bool = True, user_id: str = "default_user") -> str:
     """Print a single message with consistent formatting."""
-    output = ""
-
-    if show_chat_info and message.chat_name:
-        output += f"[{message.timestamp:%Y-%m-%d %H:%M:%S}] Chat: {message.chat_name} "
-    else:
-        output += f"[{message.timestamp:%Y-%m-%d %H:%M:%S}] "
-
-    content_prefix = ""
-    if hasattr(message, "media_type") and message.media_type:
-        content_prefix = f"[{message.media_type} - Message ID: {message.id} - Chat JID: {message.chat_jid}] "
-
-    try:
-        sender_name = get_sender_name(message.sender, user_id) if not message.is_from_me else "Me"
-        output += f"From: {sender_name}: {content_prefix}{message.content}\n"
-    except Exception:
-        pass
-    return output
+    sender_name = get_sender_name(message.sender, user_id) if not message.is_from_me else "Me"
+    return _format_message(message, show_chat_info, sender_name)
 
 
 def format_messages_list(messages: list[Message], show_chat_info: bool = True, user_id: str = "default_user") -> str:
-    output = ""
+    """Format a page of messages, resolving each distinct sender's name once."""
     if not messages:
-        output += "No messages to display."
-        return output
+        return "No messages to display."
 
-    for message in messages:
-        output += format_message(message, show_chat_info, user_id)
-    return output
+    names = resolve_sender_names(_distinct_senders(messages), user_id)
+    return "".join(_format_message(message, show_chat_info, "Me" if message.is_from_me else names[message.sender]) for message in messages)
 
 
 def list_messages(
@@ -199,46 +447,13 @@ def list_chats(
     params = {k: v for k, v in params.items() if v is not None}
 
     result = _make_api_request("chats", data=params, user_id=user_id)
-
-    if "error" in result:
-        return []
-
-    chats_data = result.get("chats", [])
-    chats = []
-
-    for chat_data in chats_data:
-        chat = Chat(
-            jid=chat_data["jid"],
-            name=chat_data.get("name"),
-            last_message_time=datetime.fromisoformat(chat_data["last_message_time"]) if chat_data.get("last_message_time") else None,
-            last_message=chat_data.get("last_message"),
-            last_sender=chat_data.get("last_sender"),
-            last_is_from_me=chat_data.get("last_is_from_me"),
-        )
-        chats.append(chat)
-
-    return chats
+    return _chats_from_result(result)
 
 
 def search_contacts(query: str, user_id: str = "default_user") -> list[Contact]:
     """Search contacts by name or phone number via API."""
     result = _make_api_request("contacts", data={"query": query}, user_id=user_id)
-
-    if "error" in result:
-        return []
-
-    contacts_data = result.get("contacts", [])
-    contacts = []
-
-    for contact_data in contacts_data:
-        contact = Contact(
-            phone_number=contact_data["phone_number"],
-            name=contact_data.get("name"),
-            jid=contact_data["jid"],
-        )
-        contacts.append(contact)
-
-    return contacts
+    return _contacts_from_result(result)
 
 
 def get_contact_chats(jid: str, limit: int = 20, page: int = 0, user_id: str = "default_user") -> list[Chat]:
@@ -246,25 +461,7 @@ def get_contact_chats(jid: str, limit: int = 20, page: int = 0, user_id: str = "
     params = {"jid": jid, "limit": limit, "page": page}
 
     result = _make_api_request("contact_chats", data=params, user_id=user_id)
-
-    if "error" in result:
-        return []
-
-    chats_data = result.get("chats", [])
-    chats = []
-
-    for chat_data in chats_data:
-        chat = Chat(
-            jid=chat_data["jid"],
-            name=chat_data.get("name"),
-            last_message_time=datetime.fromisoformat(chat_data["last_message_time"]) if chat_data.get("last_message_time") else None,
-            last_message=chat_data.get("last_message"),
-            last_sender=chat_data.get("last_sender"),
-            last_is_from_me=chat_data.get("last_is_from_me"),
-        )
-        chats.append(chat)
-
-    return chats
+    return _chats_from_result(result)
 
 
 def get_last_interaction(jid: str, user_id: str = "default_user") -> str:
@@ -282,22 +479,7 @@ def get_chat(chat_jid: str, include_last_message: bool = True, user_id: str = "d
     params = {"chat_jid": chat_jid, "include_last_message": include_last_message}
 
     result = _make_api_request("chat", data=params, user_id=user_id)
-
-    if "error" in result:
-        return None
-
-    chat_data = result.get("chat")
-    if not chat_data:
-        return None
-
-    return Chat(
-        jid=chat_data["jid"],
-        name=chat_data.get("name"),
-        last_message_time=datetime.fromisoformat(chat_data["last_message_time"]) if chat_data.get("last_message_time") else None,
-        last_message=chat_data.get("last_message"),
-        last_sender=chat_data.get("last_sender"),
-        last_is_from_me=chat_data.get("last_is_from_me"),
-    )
+    return _chat_from_result(result)
 
 
 def get_direct_chat_by_contact(sender_phone_number: str, user_id: str = "default_user") -> Chat | None:
@@ -307,22 +489,7 @@ def get_direct_chat_by_contact(sender_phone_number: str, user_id: str = "default
         data={"sender_phone_number": sender_phone_number},
         user_id=user_id,
     )
-
-    if "error" in result:
-        return None
-
-    chat_data = result.get("chat")
-    if not chat_data:
-        return None
-
-    return Chat(
-        jid=chat_data["jid"],
-        name=chat_data.get("name"),
-        last_message_time=datetime.fromisoformat(chat_data["last_message_time"]) if chat_data.get("last_message_time") else None,
-        last_message=chat_data.get("last_message"),
-        last_sender=chat_data.get("last_sender"),
-        last_is_from_me=chat_data.get("last_is_from_me"),
-    )
+    return _chat_from_result(result)
 
 
 def send_message(recipient: str, message: str, user_id: str = "default_user") -> tuple[bool, str]:
@@ -330,11 +497,7 @@ def send_message(recipient: str, message: str, user_id: str = "default_user") ->
     payload = {"user_id": user_id, "recipient": recipient, "message": message}
 
     result = _make_api_request("send", method="POST", data=payload, user_id=user_id)
-
-    if "error" in result:
-        return False, result["error"]
-
-    return result.get("success", False), result.get("message", "Unknown response")
+    return _send_status(result)
 
 
 def send_file(recipient: str, media_path: str, user_id: str = "default_user") -> tuple[bool, str]:
@@ -342,11 +505,7 @@ def send_file(recipient: str, media_path: str, user_id: str = "default_user") ->
     payload = {"user_id": user_id, "recipient": recipient, "media_path": media_path}
 
     result = _make_api_request("send", method="POST", data=payload, user_id=user_id)
-
-    if "error" in result:
-        return False, result["error"]
-
-    return result.get("success", False), result.get("message", "Unknown response")
+    return _send_status(result)
 
 
 def send_audio_message(recipient: str, media_path: str, user_id: str = "default_user") -> tuple[bool, str]:
@@ -363,11 +522,7 @@ def send_audio_message(recipient: str, media_path: str, user_id: str = "default_
     payload = {"user_id": user_id, "recipient": recipient, "media_path": media_path}
 
     result = _make_api_request("send", method="POST", data=payload, user_id=user_id)
-
-    if "error" in result:
-        return False, result["error"]
-
-    return result.get("success", False), result.get("message", "Unknown response")
+    return _send_status(result)
 
 
 def download_media(message_id: str, chat_jid: str, user_id: str = "default_user") -> str | None:
@@ -384,3 +539,217 @@ def download_media(message_id: str, chat_jid: str, user_id: str = "default_user"
         return path
     else:
         return None
+
+
+async def aget_sender_name(sender_jid: str, user_id: str = "default_user") -> str:
+    """Get sender name via API call, reusing names resolved within the cache TTL."""
+    name = sender_names.get(user_id, sender_jid)
+    if name is not None:
+        return name
+
+    result = await _amake_api_request("sender_name", data={"sender_jid": sender_jid}, user_id=user_id)
+    return _sender_name_from_result(result, sender_jid, user_id)
+
+
+async def aresolve_sender_names(
+    sender_jids: list[str], user_id: str = "default_user", max_concurrency: int = SENDER_NAME_MAX_CONCURRENCY
+) -> dict[str, str]:
+    """
+    Resolve the names of several senders in one pass.
+
+    Cached names are used directly and each distinct uncached JID is looked up
+    once, with up to ``max_concurrency`` lookups in flight.
+    """
+    names = {}
+    missing = []
+    for sender_jid in dict.fromkeys(sender_jids):
+        name = sender_names.get(user_id, sender_jid)
+        if name is None:
+            missing.append(sender_jid)
+        else:
+            names[sender_jid] = name
+
+    slots = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def lookup(sender_jid: str) -> str:
+        async with slots:
+            result = await _amake_api_request("sender_name", data={"sender_jid": sender_jid}, user_id=user_id)
+        return _sender_name_from_result(result, sender_jid, user_id)
+
+    resolved = await asyncio.gather(*(lookup(sender_jid) for sender_jid in missing))
+    names.update(zip(missing, resolved, strict=True))
+    return names
+
+
+async def aformat_message(message: Message, show_chat_info: bool = True, user_id: str = "default_user") -> str:
+    """Print a single message with consistent formatting."""
+    sender_name = await aget_sender_name(message.sender, user_id) if not message.is_from_me else "Me"
+    return _format_message(message, show_chat_info, sender_name)
+
+
+async def aformat_messages_list(messages: list[Message], show_chat_info: bool = True, user_id: str = "default_user") -> str:
+    """Format a page of messages, resolving each distinct sender's name once."""
+    if not messages:
+        return "No messages to display."
+
+    names = await aresolve_sender_names(_distinct_senders(messages), user_id)
+    return "".join(_format_message(message, show_chat_info, "Me" if message.is_from_me else names[message.sender]) for message in messages)
+
+
+async def alist_messages(
+    after: str | None = None,
+    before: str | None = None,
+    sender_phone_number: str | None = None,
+    chat_jid: str | None = None,
+    query: str | None = None,
+    limit: int = 20,
+    page: int = 0,
+    include_context: bool = True,
+    context_before: int = 1,
+    context_after: int = 1,
+    user_id: str = "default_user",
+) -> str:
+    """Get messages matching the specified criteria with optional context via API."""
+    params = {
+        "after": after,
+        "before": before,
+        "sender_phone_number": sender_phone_number,
+        "chat_jid": chat_jid,
+        "query": query,
+        "limit": limit,
+        "page": page,
+        "include_context": include_context,
+        "context_before": context_before,
+        "context_after": context_after,
+    }
+    params = {k: v for k, v in params.items() if v is not None}
+
+    result = await _amake_api_request("messages", data=params, user_id=user_id)
+
+    if "error" in result:
+        return f"Error retrieving messages: {result['error']}"
+
+    return result.get("messages", "No messages found")
+
+
+async def aget_message_context(message_id: str, before: int = 5, after: int = 5, user_id: str = "default_user") -> dict:
+    """
+    Get context around a specific message via API.
+
+    Returns:
+        The bridge's response as is, or a dict with an "error" message if the bridge
+        failed or does not support the endpoint
+    """
+    params = {"message_id": message_id, "before": before, "after": after}
+
+    result = await _amake_api_request("message_context", data=params, user_id=user_id)
+
+    if "error" in result:
+        return {"error": f"Error getting message context: {result['error']}"}
+
+    return result
+
+
+async def alist_chats(
+    query: str | None = None,
+    limit: int = 20,
+    page: int = 0,
+    include_last_message: bool = True,
+    sort_by: str = "last_active",
+    user_id: str = "default_user",
+) -> list[Chat]:
+    """Get chats matching the specified criteria via API."""
+    params = {
+        "query": query,
+        "limit": limit,
+        "page": page,
+        "include_last_message": include_last_message,
+        "sort_by": sort_by,
+    }
+    params = {k: v for k, v in params.items() if v is not None}
+
+    result = await _amake_api_request("chats", data=params, user_id=user_id)
+    return _chats_from_result(result)
+
+
+async def asearch_contacts(query: str, user_id: str = "default_user") -> list[Contact]:
+    """Search contacts by name or phone number via API."""
+    result = await _amake_api_request("contacts", data={"query": query}, user_id=user_id)
+    return _contacts_from_result(result)
+
+
+async def aget_contact_chats(jid: str, limit: int = 20, page: int = 0, user_id: str = "default_user") -> list[Chat]:
+    """Get all chats involving the contact via API."""
+    params = {"jid": jid, "limit": limit, "page": page}
+
+    result = await _amake_api_request("contact_chats", data=params, user_id=user_id)
+    return _chats_from_result(result)
+
+
+async def aget_last_interaction(jid: str, user_id: str = "default_user") -> str:
+    """Get most recent message involving the contact via API."""
+    result = await _amake_api_request("last_interaction", data={"jid": jid}, user_id=user_id)
+
+    if "error" in result:
+        return f"Error getting last interaction: {result['error']}"
+
+    return result.get("message", "No interaction found")
+
+
+async def aget_chat(chat_jid: str, include_last_message: bool = True, user_id: str = "default_user") -> Chat | None:
+    """Get chat metadata by JID via API."""
+    params = {"chat_jid": chat_jid, "include_last_message": include_last_message}
+
+    result = await _amake_api_request("chat", data=params, user_id=user_id)
+    return _chat_from_result(result)
+
+
+async def aget_direct_chat_by_contact(sender_phone_number: str, user_id: str = "default_user") -> Chat | None:
+    """Get chat metadata by sender phone number via API."""
+    result = await _amake_api_request("direct_chat", data={"sender_phone_number": sender_phone_number}, user_id=user_id)
+    return _chat_from_result(result)
+
+
+async def asend_message(recipient: str, message: str, user_id: str = "default_user") -> tuple[bool, str]:
+    """Send message via API."""
+    payload = {"user_id": user_id, "recipient": recipient, "message": message}
+
+    result = await _amake_api_request("send", method="POST", data=payload, user_id=user_id)
+    return _send_status(result)
+
+
+async def asend_file(recipient: str, media_path: str, user_id: str = "default_user") -> tuple[bool, str]:
+    """Send file via API."""
+    payload = {"user_id": user_id, "recipient": recipient, "media_path": media_path}
+
+    result = await _amake_api_request("send", method="POST", data=payload, user_id=user_id)
+    return _send_status(result)
+
+
+async def asend_audio_message(recipient: str, media_path: str, user_id: str = "default_user") -> tuple[bool, str]:
+    """Send audio message via API, converting it to Opus through the shared transcoding pool and cache."""
+    if not media_path.endswith(".ogg"):
+        try:
+            media_path = await audio.aconvert_to_opus_ogg(media_path)
+        except Exception as e:
+            return (
+                False,
+                f"Error converting file to opus ogg. You likely need to install ffmpeg: {str(e)}",
+            )
+
+    payload = {"user_id": user_id, "recipient": recipient, "media_path": media_path}
+
+    result = await _amake_api_request("send", method="POST", data=payload, user_id=user_id)
+    return _send_status(result)
+
+
+async def adownload_media(message_id: str, chat_jid: str, user_id: str = "default_user") -> str | None:
+    """Download media from a message via API."""
+    payload = {"user_id": user_id, "message_id": message_id, "chat_jid": chat_jid}
+
+    result = await _amake_api_request("download", method="POST", data=payload, user_id=user_id)
+
+    if "error" in result or not result.get("success", False):
+        return None
+
+    return result.get("path")